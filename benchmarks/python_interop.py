@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Benchmark for list/dict round trips across the Python interop boundary.
+#
+# Each case passes a container from RenzmcLang into a Python function that
+# returns it unchanged, through SmartPythonWrapper, the same path used when
+# RenzmcLang code calls Python objects.
+#
+# Usage:
+#     python benchmarks/python_interop.py [--max-size 1000000] [--repeat 5]
+
+import argparse
+import time
+
+from renzmc.runtime.python_integration import PythonIntegration, SmartPythonWrapper
+
+
+def _identity(value):
+    return value
+
+
+def _cases(size):
+    return {
+        "list[int]": list(range(size)),
+        "list[list]": [[i, i + 1] for i in range(size)],
+        "dict[str,int]": {f"k{i}": i for i in range(size)},
+        "dict[str,dict]": {f"k{i}": {"n": i} for i in range(size)},
+    }
+
+
+def _round_trip(mode, data, repeat):
+    integration = PythonIntegration(conversion_mode=mode)
+    call = SmartPythonWrapper(_identity, integration)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = call(data)
+        # Touch one element so lazy views do a realistic amount of work
+        if len(result):
+            next(iter(result))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark interop container round trips")
+    parser.add_argument("--max-size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sizes = []
+    size = 1_000
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 10
+
+    print(f"{'kasus':<16}{'ukuran':>10}{'eager (ms)':>14}{'lazy (ms)':>14}")
+    for size in sizes:
+        for name, data in _cases(size).items():
+            eager = _round_trip("eager", data, args.repeat) * 1000
+            lazy = _round_trip("lazy", data, args.repeat) * 1000
+            print(f"{name:<16}{size:>10}{eager:>14.3f}{lazy:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,9 @@ from renzmc.core.error_logger import log_error
 from renzmc.core.interpreter import Interpreter
 from renzmc.core.lexer import Lexer
 from renzmc.core.parser import Parser
+from renzmc.runtime.module_prefetch import ModulePrefetcher
+from renzmc.runtime.output import DEFAULT_BUFFER_SIZE
+from renzmc.runtime.output import configure as configure_output
 from renzmc.utils.linter import RenzmcLinter
 from renzmc.utils.formater import RenzmcFormatter
 from renzmc.version import __version__
@@ -99,6 +102,10 @@ def run_code(source_code, filename="<stdin>", interpreter=None, use_cache=True):
                 cache_key = _ast_cache.get_cache_key(source_code)
                 _ast_cache.save(cache_key, ast)
 
+        # Parse every reachable RenzmcLang module up front, in parallel
+        if filename != "<stdin>":
+            ModulePrefetcher(interpreter.module_manager).prefetch(ast, interpreter.current_file)
+
         # Use Rust-aware execution (automatic)
         if hasattr(interpreter, "visit_with_rust"):
             interpreter.visit_with_rust(ast)
@@ -223,8 +230,72 @@ def format_file(filename, save_changes=False):
         sys.exit(1)
 
 
+def explain_import(module_name):
+    """Show how an import name is resolved to a RenzmcLang or Python module."""
+    import importlib.util
+
+    interpreter = Interpreter()
+    report = interpreter.module_manager.explain_import(module_name)
+
+    print(f"🔎 Resolusi impor: {module_name}")
+    print("\nPath pencarian:")
+    for index, search_path in enumerate(report["search_paths"], 1):
+        print(f"  {index}. {search_path}")
+
+    print("\nKandidat yang diperiksa:")
+    for candidate, found in report["steps"]:
+        marker = "✅" if found else "  "
+        print(f"  {marker} {candidate}")
+
+    if report["path"]:
+        print(f"\n✅ Ditemukan modul RenzmcLang: {report['path']}")
+    else:
+        print("\n❌ Tidak ada modul RenzmcLang dengan nama ini")
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is not None:
+            print(f"🐍 Akan diimpor sebagai modul Python: {spec.origin or module_name}")
+        else:
+            print("🐍 Modul Python dengan nama ini juga tidak ditemukan")
+
+    print(f"\n⏱️  Resolusi pertama: {report['cold_time'] * 1000:.3f} ms")
+    print(f"⏱️  Resolusi dari cache: {report['cached_time'] * 1000:.3f} ms")
+
+
+def finish_profile(profiler, output=None, filename=None):
+    """
+    Stop the profiler, print its report and write collapsed stacks.
+
+    Args:
+        profiler: Running SamplingProfiler
+        output: Path for the collapsed stacks file
+        filename: Profiled script, used to derive the default output path
+    """
+    profiler.stop()
+    if output is None:
+        base = os.path.splitext(os.path.basename(filename))[0] if filename else "rmc"
+        output = f"{base}.collapsed"
+
+    sys.stdout.flush()
+    print(file=sys.stderr)
+    print(profiler.report(), file=sys.stderr)
+    try:
+        profiler.write_collapsed(output)
+        print(f"\n📁 Collapsed stacks disimpan di: {output}", file=sys.stderr)
+    except OSError as e:
+        print(f"\n❌ Gagal menyimpan collapsed stacks: {e}", file=sys.stderr)
+
+
 def main():
     """Main entry point for the RenzmcLang CLI."""
+    # `rmc bench ...` has its own options; a file literally named "bench" still runs
+    if len(sys.argv) > 1 and sys.argv[1] == "bench" and not os.path.isfile("bench"):
+        from renzmc.bench import main as bench_main
+
+        sys.exit(bench_main(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         prog="rmc",
         description="RenzmcLang - Bahasa pemrograman berbasis Bahasa Indonesia",
@@ -280,6 +351,55 @@ def main():
         action="store_true",
         help="Simpan perubahan format ke file (harus digunakan dengan --format)",
     )
+    parser.add_argument(
+        "--explain-import",
+        "--jelaskan-impor",
+        metavar="NAMA",
+        help="Tampilkan bagaimana nama modul di-resolve beserta waktunya",
+    )
+    parser.add_argument(
+        "--profile",
+        "--profil",
+        action="store_true",
+        help="Jalankan dengan sampling profiler dan tampilkan waktu per fungsi dan baris",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="FILE",
+        help="File tujuan collapsed stacks untuk flamegraph (default: <file>.collapsed)",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=1.0,
+        metavar="MS",
+        help="Interval sampling profiler dalam milidetik (default: 1.0)",
+    )
+    parser.add_argument(
+        "--trace",
+        "--lacak",
+        metavar="FILE",
+        help="Catat jumlah eksekusi per tipe node, fungsi, dan baris ke FILE "
+        "(.prom/.txt untuk format Prometheus, selain itu JSON)",
+    )
+    parser.add_argument(
+        "--trace-node-time",
+        action="store_true",
+        help="Dengan --trace, ukur juga waktu per tipe node (menambah overhead)",
+    )
+    parser.add_argument(
+        "--memprofile",
+        "--profil-memori",
+        action="store_true",
+        help="Laporkan alokasi memori per baris RenzmcLang, kebocoran, dan struktur terbesar",
+    )
+    parser.add_argument(
+        "--output-buffer",
+        type=int,
+        metavar="BYTES",
+        help="Ukuran buffer output tampilkan dalam byte; 0 = flush setiap baris "
+        f"(default: {DEFAULT_BUFFER_SIZE}, terminal dan PYTHONUNBUFFERED per baris)",
+    )
 
     args = parser.parse_args()
 
@@ -302,6 +422,10 @@ def main():
             print("ℹ️  Tidak ada error log yang perlu dihapus")
         return
 
+    if args.explain_import:
+        explain_import(args.explain_import)
+        return
+
     if args.hapuscache:
         import shutil
 
@@ -346,12 +470,56 @@ def main():
     # Determine if caching should be used
     use_cache = not args.no_cache
 
-    if args.code:
-        run_code(args.code, use_cache=False)
-    elif args.file:
-        run_file(args.file, use_cache=use_cache)
-    else:
-        run_interactive()
+    profiler = None
+    if args.profile:
+        from renzmc.runtime.profiler import SamplingProfiler
+
+        profiler = SamplingProfiler(interval=args.profile_interval / 1000)
+        profiler.start()
+
+    if args.trace and args.memprofile:
+        print("Error: --trace dan --memprofile tidak bisa digunakan bersamaan")
+        sys.exit(1)
+
+    tracer = None
+    if args.trace:
+        from renzmc.runtime.tracing import Tracer
+
+        tracer = Tracer(time_nodes=args.trace_node_time).start()
+
+    memory_profiler = None
+    if args.memprofile:
+        from renzmc.runtime.memprofiler import MemoryProfiler
+
+        memory_profiler = MemoryProfiler().start()
+
+    if args.output_buffer is not None and args.output_buffer < 0:
+        print("Error: --output-buffer tidak boleh negatif")
+        sys.exit(1)
+
+    try:
+        if args.code or args.file:
+            configure_output(args.output_buffer)
+        if args.code:
+            run_code(args.code, use_cache=False)
+        elif args.file:
+            run_file(args.file, use_cache=use_cache)
+        else:
+            run_interactive()
+    finally:
+        if tracer is not None:
+            tracer.stop()
+            try:
+                tracer.write(args.trace)
+            except OSError as e:
+                print(f"❌ Gagal menyimpan hasil trace: {e}", file=sys.stderr)
+        if memory_profiler is not None:
+            memory_profiler.stop()
+            sys.stdout.flush()
+            print(file=sys.stderr)
+            print(memory_profiler.report(), file=sys.stderr)
+        if profiler is not None:
+            finish_profile(profiler, args.profile_output, args.file)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import glob
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from renzmc.version import __version__
+
+LEX_PARSE_COPIES = 40
+
+
+class Benchmark:
+    """One named benchmark: ``setup`` returns the callable that is timed."""
+
+    def __init__(self, name, setup, description=""):
+        self.name = name
+        self.setup = setup
+        self.description = description
+
+
+def default_corpus_dir():
+    """Return the corpus shipped inside the package, so installed copies find it too."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_corpus")
+
+
+def _parse(source):
+    from renzmc.core.lexer import Lexer
+    from renzmc.core.parser import Parser
+
+    return Parser(Lexer(source)).parse()
+
+
+def _new_interpreter(path):
+    from renzmc.core.interpreter import Interpreter
+
+    interpreter = Interpreter()
+    interpreter.current_file = os.path.abspath(path)
+    # Resolve corpus modules the same way whatever the working directory is
+    interpreter.module_manager.add_search_path(os.path.dirname(interpreter.current_file))
+    return interpreter
+
+
+def _execute(interpreter, ast):
+    if hasattr(interpreter, "visit_with_rust"):
+        interpreter.visit_with_rust(ast)
+    else:
+        interpreter.visit(ast)
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _program_benchmark(path, warm):
+    def setup():
+        ast = _parse(_read(path))
+        if warm:
+            # Reruns skip the Rust attempt: executing a program rewrites parts
+            # of its AST, which the Rust serializer then rejects
+            interpreter = _new_interpreter(path)
+            return lambda: interpreter.visit(ast)
+        return lambda: _execute(_new_interpreter(path), ast)
+
+    return setup
+
+
+def _lex_parse_benchmark(paths):
+    def setup():
+        source = "\n".join(_read(path) for path in paths) * LEX_PARSE_COPIES
+        return lambda: _parse(source)
+
+    return setup
+
+
+def discover(corpus_dir):
+    """Return the benchmarks defined by ``corpus_dir``, in a stable order."""
+    paths = sorted(glob.glob(os.path.join(corpus_dir, "*.rmc")))
+    benchmarks = []
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        benchmarks.append(Benchmark(name, _program_benchmark(path, warm=False), path))
+        if name.startswith("jit_"):
+            benchmarks.append(
+                Benchmark(f"{name}:hangat", _program_benchmark(path, warm=True), path)
+            )
+    if paths:
+        benchmarks.append(
+            Benchmark(
+                "lex_parse_besar",
+                _lex_parse_benchmark(paths),
+                f"korpus x{LEX_PARSE_COPIES}, hanya lexer dan parser",
+            )
+        )
+    return benchmarks
+
+
+def summarize(times):
+    """Return summary statistics for a list of timings in seconds."""
+    return {
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "max": max(times),
+    }
+
+
+def run_benchmark(benchmark, repeat=5, warmup=1):
+    """Run ``benchmark`` and return its summary; program output is discarded."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        func = benchmark.setup()
+        for _ in range(warmup):
+            func()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare medians against ``baseline`` results.
+
+    Returns (name, baseline_median, median, change) tuples, where ``change`` is
+    the relative difference, and the names whose change exceeds ``threshold``.
+    """
+    rows = []
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        change = result["median"] / base["median"] - 1 if base["median"] else 0.0
+        rows.append((name, base["median"], result["median"], change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def _metadata():
+    return {
+        "renzmc_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def _format_ms(seconds):
+    return f"{seconds * 1000:10.2f}"
+
+
+def main(argv=None):
+    """
+    Entry point of ``rmc bench``.
+
+    Usage: ``rmc bench [NAMA ...] [--repeat 5] [--warmup 1] [--output hasil.json]
+    [--baseline dasar.json] [--threshold 10]``
+
+    Every .rmc file in the corpus directory (default: the packaged
+    ``renzmc/bench_corpus``) is a benchmark. Each repetition runs the parsed
+    program in a fresh interpreter, so parsing is excluded and JIT compilation
+    is included. Files whose name starts with ``jit_`` also get a ``:hangat``
+    variant that keeps one interpreter across repetitions, measuring
+    already-compiled code. The built-in ``lex_parse_besar`` case lexes and
+    parses the whole corpus concatenated many times.
+
+    Returns:
+        Exit status: 1 on a failed benchmark or a regression, 2 if nothing ran
+    """
+    parser = argparse.ArgumentParser(
+        prog="rmc bench", description="Jalankan korpus benchmark RenzmcLang"
+    )
+    parser.add_argument("names", nargs="*", metavar="NAMA", help="Pola nama benchmark (glob)")
+    parser.add_argument("--corpus", default=None, help="Direktori korpus .rmc")
+    parser.add_argument("--repeat", type=int, default=5, help="Jumlah pengulangan terukur")
+    parser.add_argument("--warmup", type=int, default=1, help="Jumlah pemanasan sebelum diukur")
+    parser.add_argument("--output", "-o", metavar="FILE", help="Simpan hasil sebagai JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="Bandingkan dengan hasil JSON lama")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        metavar="PERSEN",
+        help="Batas kenaikan median (persen) yang dianggap regresi (default: 10)",
+    )
+    parser.add_argument("--list", action="store_true", help="Tampilkan daftar benchmark saja")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat minimal 1")
+
+    corpus_dir = args.corpus or default_corpus_dir()
+    benchmarks = discover(corpus_dir)
+    if args.names:
+        benchmarks = [
+            b for b in benchmarks if any(fnmatch.fnmatch(b.name, pattern) for pattern in args.names)
+        ]
+    if not benchmarks:
+        print(f"Tidak ada benchmark di: {corpus_dir}", file=sys.stderr)
+        return 2
+
+    if args.list:
+        for benchmark in benchmarks:
+            print(f"{benchmark.name:<28} {benchmark.description}")
+        return 0
+
+    print(
+        f"{'benchmark':<28}{'min (ms)':>10}{'median':>11}{'mean':>11}{'stdev':>11}"
+        f"  (repeat={args.repeat}, warmup={args.warmup})"
+    )
+    results = {}
+    failures = {}
+    for benchmark in benchmarks:
+        try:
+            result = run_benchmark(benchmark, repeat=args.repeat, warmup=args.warmup)
+        except (Exception, SystemExit) as e:
+            failures[benchmark.name] = f"{type(e).__name__}: {e}"
+            print(f"{benchmark.name:<28} GAGAL: {failures[benchmark.name]}")
+            continue
+        results[benchmark.name] = result
+        print(
+            f"{benchmark.name:<28}{_format_ms(result['min'])} {_format_ms(result['median'])}"
+            f" {_format_ms(result['mean'])} {_format_ms(result['stdev'])}"
+        )
+
+    report = {"metadata": _metadata(), "results": results, "failures": failures}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 Hasil disimpan di: {args.output}")
+
+    status = 1 if failures else 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+        rows, regressions = compare(results, baseline, args.threshold / 100)
+        print(f"\nPerbandingan dengan {args.baseline} (batas regresi {args.threshold:g}%):")
+        print(f"{'benchmark':<28}{'dasar (ms)':>12}{'kini (ms)':>12}{'selisih':>10}")
+        for name, base_median, median, change in rows:
+            marker = "  ❌ REGRESI" if name in regressions else ""
+            print(
+                f"{name:<28}{base_median * 1000:12.2f}{median * 1000:12.2f}"
+                f"{change * 100:+9.1f}%{marker}"
+            )
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark melambat lebih dari {args.threshold:g}%")
+            status = 1
+        else:
+            print("\n✅ Tidak ada regresi")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
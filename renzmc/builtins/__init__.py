@@ -53,6 +53,7 @@ from renzmc.builtins.string_functions import (
     berisi,
     hapus_spasi,
     format_teks,
+    PembangunTeks,
     adalah_huruf,
     adalah_angka,
     adalah_alfanumerik,
@@ -97,10 +98,15 @@ from renzmc.builtins.list_functions import (
     hapus_pada,
     hitung,
     indeks,
+    larik,
     masukkan,
+    rata_rata,
     salin,
     salin_dalam,
     tambah,
+    terbesar,
+    terkecil,
+    total,
     urutkan,
 )
 
@@ -159,6 +165,7 @@ __all__ = [
     "berisi",
     "hapus_spasi",
     "format_teks",
+    "PembangunTeks",
     "adalah_huruf",
     "adalah_angka",
     "adalah_alfanumerik",
@@ -196,10 +203,15 @@ __all__ = [
     "hapus_pada",
     "hitung",
     "indeks",
+    "larik",
     "masukkan",
+    "rata_rata",
     "salin",
     "salin_dalam",
     "tambah",
+    "terbesar",
+    "terkecil",
+    "total",
     "urutkan",
     # Utility functions
     "hash_teks",
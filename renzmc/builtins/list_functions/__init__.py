@@ -23,8 +23,15 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import builtins as _builtins
 import copy
 
+from renzmc.runtime.numeric_array import Larik, larik
+from renzmc.runtime.python_integration import PythonListView
+
+# Lazy views of Python lists are modified through the same list methods
+_LIST_TYPES = (list, PythonListView)
+
 
 class RenzmcBuiltinFunction:
 
@@ -41,14 +48,14 @@ class RenzmcBuiltinFunction:
 
 
 def tambah(lst, item):
-    if not isinstance(lst, list):
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen pertama harus berupa list, bukan '{type(lst).__name__}'")
     lst.append(item)
     return lst
 
 
 def hapus(lst, item):
-    if not isinstance(lst, list):
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen pertama harus berupa list, bukan '{type(lst).__name__}'")
     try:
         lst.remove(item)
@@ -58,7 +65,7 @@ def hapus(lst, item):
 
 
 def hapus_pada(lst, index):
-    if not isinstance(lst, list):
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen pertama harus berupa list, bukan '{type(lst).__name__}'")
     try:
         del lst[index]
@@ -68,7 +75,7 @@ def hapus_pada(lst, index):
 
 
 def masukkan(lst, index, item):
-    if not isinstance(lst, list):
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen pertama harus berupa list, bukan '{type(lst).__name__}'")
     try:
         lst.insert(index, item)
@@ -78,7 +85,9 @@ def masukkan(lst, index, item):
 
 
 def urutkan(lst, terbalik=False):
-    if not isinstance(lst, list):
+    if isinstance(lst, Larik):
+        return lst.urutkan(terbalik)
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen pertama harus berupa list, bukan '{type(lst).__name__}'")
     try:
         lst.sort(reverse=terbalik)
@@ -88,20 +97,26 @@ def urutkan(lst, terbalik=False):
 
 
 def balikkan(lst):
-    if not isinstance(lst, list):
+    if isinstance(lst, Larik):
+        return lst.balikkan()
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen harus berupa list, bukan '{type(lst).__name__}'")
     lst.reverse()
     return lst
 
 
 def hitung(lst, item):
-    if not isinstance(lst, list):
+    if isinstance(lst, Larik):
+        return lst.hitung(item)
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen harus berupa list, bukan '{type(lst).__name__}'")
     return lst.count(item)
 
 
 def indeks(lst, item):
-    if not isinstance(lst, list):
+    if isinstance(lst, Larik):
+        return lst.indeks(item)
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen harus berupa list, bukan '{type(lst).__name__}'")
     try:
         return lst.index(item)
@@ -110,15 +125,44 @@ def indeks(lst, item):
 
 
 def extend(lst, iterable):
-    if not isinstance(lst, list):
+    if not isinstance(lst, _LIST_TYPES):
         raise TypeError(f"Argumen harus berupa list, bukan '{type(lst).__name__}'")
     lst.extend(iterable)
     return lst
 
 
 def salin(obj):
+    if isinstance(obj, Larik):
+        return obj.salin()
     return copy.copy(obj)
 
 
 def salin_dalam(obj):
     return copy.deepcopy(obj)
+
+
+def total(iterable, start=0):
+    if isinstance(iterable, Larik):
+        return iterable.jumlah() + start
+    return _builtins.sum(iterable, start)
+
+
+def terkecil(*args, **kwargs):
+    if len(args) == 1 and not kwargs and isinstance(args[0], Larik):
+        return args[0].minimum()
+    return _builtins.min(*args, **kwargs)
+
+
+def terbesar(*args, **kwargs):
+    if len(args) == 1 and not kwargs and isinstance(args[0], Larik):
+        return args[0].maksimum()
+    return _builtins.max(*args, **kwargs)
+
+
+def rata_rata(iterable):
+    if isinstance(iterable, Larik):
+        return iterable.rata_rata()
+    values = list(iterable)
+    if not values:
+        raise ValueError("rata_rata() dari data kosong")
+    return _builtins.sum(values) / len(values)
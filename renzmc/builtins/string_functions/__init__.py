@@ -123,6 +123,59 @@ def format_teks(template, *args, **kwargs):
         raise ValueError(f"Error dalam format teks: {e}")
 
 
+class PembangunTeks:
+    """
+    Mutable text builder for building long text piece by piece.
+
+    Pieces are kept in a list and joined once by ``ke_teks()``, so adding
+    100 000 lines costs the same per line instead of copying the whole text
+    each time, as ``teks itu teks + bagian`` on a global variable does.
+    """
+
+    def __init__(self, awal=""):
+        self._parts = []
+        self._length = 0
+        if awal:
+            self.tambah(awal)
+
+    def tambah(self, *bagian):
+        """Add each piece (converted to text) and return the builder."""
+        for item in bagian:
+            text = item if isinstance(item, str) else str(item)
+            self._parts.append(text)
+            self._length += len(text)
+        return self
+
+    def tambah_baris(self, bagian=""):
+        """Add a piece followed by a newline and return the builder."""
+        return self.tambah(bagian, "\n")
+
+    def tambah_format(self, template, *args, **kwargs):
+        """Add ``template.format(*args, **kwargs)`` and return the builder."""
+        return self.tambah(format_teks(template, *args, **kwargs))
+
+    def ke_teks(self):
+        """Return the text built so far."""
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def bersihkan(self):
+        """Remove all text and return the builder."""
+        self._parts = []
+        self._length = 0
+        return self
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        return self.ke_teks()
+
+    def __repr__(self):
+        return f"<PembangunTeks {self._length} karakter>"
+
+
 def is_alpha_impl(text):
     if not isinstance(text, str):
         raise TypeError(f"Argumen harus berupa teks, bukan '{type(text).__name__}'")
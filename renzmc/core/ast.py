@@ -507,6 +507,15 @@ class FormatString(AST):
         self.parts = parts
 
 
+class FormattedValue(AST):
+
+    def __init__(self, expr, conversion=None, format_spec=None, token=None):
+        super().__init__(token)
+        self.expr = expr
+        self.conversion = conversion
+        self.format_spec = format_spec
+
+
 class Ternary(AST):
 
     def __init__(self, condition, if_expr, else_expr, token=None):
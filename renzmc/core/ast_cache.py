@@ -27,6 +27,10 @@ import hashlib
 import os
 import pickle
 
+# Part of every cache key; bump it when the parser produces different trees
+# for the same source so stale cached ASTs are not reused
+AST_FORMAT_VERSION = 2
+
 
 class ASTCache:
     """
@@ -53,7 +57,8 @@ class ASTCache:
         """
         Generate a unique cache key for the given source code.
 
-        Uses MD5 hashing to create a unique identifier for the source code.
+        Uses MD5 hashing to create a unique identifier for the source code
+        and the AST format version.
         This key is used as the filename for the cached AST.
 
         Args:
@@ -62,7 +67,7 @@ class ASTCache:
         Returns:
             A hexadecimal string representing the MD5 hash of the source code
         """
-        return hashlib.md5(source_code.encode()).hexdigest()
+        return hashlib.md5(f"{AST_FORMAT_VERSION}:{source_code}".encode()).hexdigest()
 
     def load(self, key):
         """
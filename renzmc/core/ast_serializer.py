@@ -352,6 +352,13 @@ class ASTSerializer:
         """Serialize FormatString node."""
         result["parts"] = [self.serialize(part) for part in ast_node.parts]
 
+    def _serialize_formattedvalue(self, ast_node, result: Dict[str, Any]):
+        """Serialize FormattedValue node."""
+        result["expr"] = self.serialize(ast_node.expr)
+        result["conversion"] = ast_node.conversion
+        spec = ast_node.format_spec
+        result["format_spec"] = spec if spec is None or isinstance(spec, str) else self.serialize(spec)
+
     def _serialize_ternary(self, ast_node, result: Dict[str, Any]):
         """Serialize Ternary node."""
         result["condition"] = self.serialize(ast_node.condition)
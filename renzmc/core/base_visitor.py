@@ -29,32 +29,48 @@ from renzmc.core.error import RenzmcError
 class NodeVisitor:
 
     def visit(self, node):
-        method_name = "visit_" + type(node).__name__
-        visitor = getattr(self, method_name, self.generic_visit)
+        visitor = getattr(self, "visit_" + type(node).__name__, self.generic_visit)
         try:
             return visitor(node)
-        except RenzmcError as e:
-            raise e
-        except RuntimeError as e:
-            if len(e.args) >= 3 and isinstance(e.args[1], int) and isinstance(e.args[2], int):
-                raise
-            error_msg = e.args[0] if e.args else str(e)
-            while isinstance(error_msg, tuple) and len(error_msg) >= 1:
-                error_msg = error_msg[0]
-            if hasattr(node, "line") and hasattr(node, "column"):
-                line = node.line
-                column = node.column
-                raise RuntimeError(error_msg, line, column)
-            else:
-                raise RuntimeError(error_msg)
         except Exception as e:
-            error_msg = str(e)
-            if hasattr(node, "line") and hasattr(node, "column"):
-                line = node.line
-                column = node.column
-                raise RuntimeError(error_msg, line, column)
-            else:
-                raise RuntimeError(error_msg)
+            # Positions are attached once, by the innermost visit() that sees
+            # the error; enclosing frames re-raise it untouched
+            if isinstance(e, RenzmcError) or is_located(e):
+                raise
+            raise _locate(e, node)
 
     def generic_visit(self, node):
         raise RuntimeError(f"Tidak ada metode visit_{type(node).__name__}")
+
+
+def is_located(error):
+    """
+    Return True if ``error`` already carries the position of the node that raised it.
+
+    Call wrappers that add context to errors from Python callables re-raise
+    such errors unchanged, so an error crossing several calls keeps the
+    message and position it got at the innermost one.
+    """
+    return "_renzmc_position" in error.__dict__
+
+
+def _locate(error, node):
+    """Return ``error`` as RuntimeError(message, line, column) positioned at ``node``."""
+    if isinstance(error, RuntimeError):
+        args = error.args
+        if len(args) >= 3 and isinstance(args[1], int) and isinstance(args[2], int):
+            error._renzmc_position = (args[1], args[2])
+            return error
+        error_msg = args[0] if args else str(error)
+        while isinstance(error_msg, tuple) and len(error_msg) >= 1:
+            error_msg = error_msg[0]
+    else:
+        error_msg = str(error)
+    if not (hasattr(node, "line") and hasattr(node, "column")):
+        return RuntimeError(error_msg)
+    located = RuntimeError(error_msg, node.line, node.column)
+    # Nodes without a token (blocks, the program) have no position; leave the
+    # error unmarked so the nearest enclosing node that has one attaches it
+    if isinstance(node.line, int) and isinstance(node.column, int):
+        located._renzmc_position = (node.line, node.column)
+    return located
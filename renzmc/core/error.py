@@ -23,6 +23,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import builtins
+
 from renzmc.core.error_catalog import get_error_info, suggest_error_code
 
 
@@ -117,6 +119,78 @@ class AsyncError(RenzmcError):
     """Error in asynchronous operations."""
 
 
+# RenzmcLang errors raised where Python would raise the builtin exception, so
+# ``tangkap ValueError`` also catches RenzmcValueError and so on
+_RENZMC_EQUIVALENTS = (
+    (ValueError, RenzmcValueError),
+    (TypeError, RenzmcTypeError),
+    (TypeError, TypeHintError),
+    (NameError, RenzmcNameError),
+    (IndexError, RenzmcIndexError),
+    (KeyError, RenzmcKeyError),
+    (AttributeError, RenzmcAttributeError),
+    (ImportError, RenzmcImportError),
+    (RuntimeError, RenzmcRuntimeError),
+    (RuntimeError, InterpreterError),
+    (ZeroDivisionError, DivisionByZeroError),
+    (SyntaxError, RenzmcSyntaxError),
+    (SyntaxError, ParserError),
+    (SyntaxError, LexerError),
+    (OSError, FileError),
+)
+
+# Indonesian names accepted in ``tangkap`` clauses
+EXCEPTION_ALIASES = {
+    "Kesalahan": "Exception",
+    "KesalahanNilai": "ValueError",
+    "KesalahanTipe": "TypeError",
+    "KesalahanNama": "NameError",
+    "KesalahanIndeks": "IndexError",
+    "KesalahanKunci": "KeyError",
+    "KesalahanAtribut": "AttributeError",
+    "KesalahanImpor": "ImportError",
+    "KesalahanRuntime": "RuntimeError",
+    "KesalahanPembagianNol": "ZeroDivisionError",
+    "KesalahanSintaks": "SyntaxError",
+    "KesalahanFile": "OSError",
+    "KesalahanWaktuHabis": "TimeoutError",
+    "KesalahanKoneksi": "ConnectionError",
+    "KesalahanAsync": "AsyncError",
+}
+
+_exception_types_cache = {}
+
+
+def resolve_exception_types(name):
+    """
+    Resolve an exception name from a ``tangkap`` clause to exception classes.
+
+    Args:
+        name: Python builtin exception, RenzmcLang error class or Indonesian alias
+
+    Returns:
+        Tuple of classes for isinstance checks, or None if the name is unknown
+    """
+    try:
+        return _exception_types_cache[name]
+    except KeyError:
+        pass
+    target = EXCEPTION_ALIASES.get(name, name)
+    cls = globals().get(target)
+    if not (isinstance(cls, type) and issubclass(cls, RenzmcError)):
+        cls = getattr(builtins, target, None)
+    if isinstance(cls, type) and issubclass(cls, BaseException):
+        types = (cls,) + tuple(
+            renzmc_cls
+            for python_cls, renzmc_cls in _RENZMC_EQUIVALENTS
+            if issubclass(python_cls, cls) and not issubclass(renzmc_cls, cls)
+        )
+    else:
+        types = None
+    _exception_types_cache[name] = types
+    return types
+
+
 def format_error(error, source_code=None):
     """
     Format error messages in a user-friendly and informative way.
@@ -23,7 +23,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
 class ErrorInfo:
@@ -1908,6 +1909,57 @@ def get_errors_by_category(category: str) -> List[ErrorInfo]:
     return [error_info for error_info in ERROR_CATALOG.values() if error_info.category == category]
 
 
+# Map error types to code prefixes
+_TYPE_TO_PREFIX = {
+    "LexerError": "RMC-L",
+    "ParserError": "RMC-P",
+    "RenzmcNameError": "RMC-N",
+    "NameError": "RMC-N",
+    "RenzmcTypeError": "RMC-T",
+    "TypeError": "RMC-T",
+    "RenzmcValueError": "RMC-V",
+    "ValueError": "RMC-V",
+    "DivisionByZeroError": "RMC-V002",
+    "RenzmcIndexError": "RMC-IX",
+    "IndexError": "RMC-IX",
+    "RenzmcKeyError": "RMC-K",
+    "KeyError": "RMC-K",
+    "RenzmcAttributeError": "RMC-A",
+    "AttributeError": "RMC-A",
+    "RenzmcImportError": "RMC-I",
+    "ImportError": "RMC-I",
+    "FileError": "RMC-F",
+    "FileNotFoundError": "RMC-F001",
+    "FileExistsError": "RMC-F005",
+    "PermissionError": "RMC-F002",
+    "IsADirectoryError": "RMC-F008",
+    "NotADirectoryError": "RMC-F007",
+    "AsyncError": "RMC-AS",
+    "PythonIntegrationError": "RMC-PY",
+    "RenzmcRuntimeError": "RMC-R",
+    "RuntimeError": "RMC-R",
+    "RecursionError": "RMC-R002",
+    "ConnectionError": "RMC-C001",
+    "NotImplementedError": "RMC-NI001",
+}
+
+
+@lru_cache(maxsize=None)
+def _keyword_index(prefix: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Codes starting with ``prefix`` and their lowercased title keywords.
+
+    Built once per prefix so suggestion does not rescan the whole catalog
+    and re-split every title on each error. Catalog order is kept, so the
+    first matching code wins exactly as before.
+    """
+    return tuple(
+        (error_code, tuple(error_info.title.lower().split()))
+        for error_code, error_info in ERROR_CATALOG.items()
+        if error_code.startswith(prefix)
+    )
+
+
 def suggest_error_code(error_type: str, message: str) -> Optional[str]:
     """
     Suggest error code based on error type and message.
@@ -1919,50 +1971,15 @@ def suggest_error_code(error_type: str, message: str) -> Optional[str]:
     Returns:
         Suggested error code or None
     """
-    # Map error types to code prefixes
-    type_to_prefix = {
-        "LexerError": "RMC-L",
-        "ParserError": "RMC-P",
-        "RenzmcNameError": "RMC-N",
-        "NameError": "RMC-N",
-        "RenzmcTypeError": "RMC-T",
-        "TypeError": "RMC-T",
-        "RenzmcValueError": "RMC-V",
-        "ValueError": "RMC-V",
-        "DivisionByZeroError": "RMC-V002",
-        "RenzmcIndexError": "RMC-IX",
-        "IndexError": "RMC-IX",
-        "RenzmcKeyError": "RMC-K",
-        "KeyError": "RMC-K",
-        "RenzmcAttributeError": "RMC-A",
-        "AttributeError": "RMC-A",
-        "RenzmcImportError": "RMC-I",
-        "ImportError": "RMC-I",
-        "FileError": "RMC-F",
-        "FileNotFoundError": "RMC-F001",
-        "FileExistsError": "RMC-F005",
-        "PermissionError": "RMC-F002",
-        "IsADirectoryError": "RMC-F008",
-        "NotADirectoryError": "RMC-F007",
-        "AsyncError": "RMC-AS",
-        "PythonIntegrationError": "RMC-PY",
-        "RenzmcRuntimeError": "RMC-R",
-        "RuntimeError": "RMC-R",
-        "RecursionError": "RMC-R002",
-        "ConnectionError": "RMC-C001",
-        "NotImplementedError": "RMC-NI001",
-    }
-
-    # Direct mapping for specific errors
-    if error_type in type_to_prefix:
-        code = type_to_prefix[error_type]
-        if len(code) > 6:  # Full code like "RMC-V002"
-            return code
-        # Search for matching error in catalog
-        message_lower = message.lower()
-        for error_code, error_info in ERROR_CATALOG.items():
-            if error_code.startswith(code):
-                if any(keyword in message_lower for keyword in error_info.title.lower().split()):
-                    return error_code
+    code = _TYPE_TO_PREFIX.get(error_type)
+    if code is None:
+        return None
+    if len(code) > 6:  # Full code like "RMC-V002"
+        return code
+    # Search for matching error in catalog
+    message_lower = message.lower()
+    for error_code, keywords in _keyword_index(code):
+        if any(keyword in message_lower for keyword in keywords):
+            return error_code
 
     return None
@@ -23,18 +23,38 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import atexit
 import json
 import logging
 import os
+import threading
 import traceback
 from collections import defaultdict
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from queue import Full, Queue
+from typing import Any, Dict, List, Optional, Tuple
 
 from renzmc.core.error_catalog import suggest_error_code
 
+# Distinct error fingerprints tracked before the dedup table is reset
+MAX_FINGERPRINTS = 10000
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, queue: Queue, owner: "ErrorLogger"):
+        super().__init__(queue)
+        self.owner = owner
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.owner.dropped_count += 1
+
 
 class ErrorLogger:
     """Advanced error logger with structured logging and analytics."""
@@ -46,35 +66,63 @@ class ErrorLogger:
         backup_count: int = 5,
         enable_console: bool = True,
         enable_file: bool = True,
+        queue_size: int = 10000,
+        dedup: bool = True,
     ):
         """
         Initialize error logger.
 
+        File writes happen on a background thread fed by a bounded queue, so
+        logging never blocks on disk. When the queue is full, records are
+        dropped and counted in ``dropped_count``.
+
         Args:
             log_dir: Directory for log files (default: ~/.renzmc/logs)
             max_bytes: Maximum size of log file before rotation
             backup_count: Number of backup files to keep
             enable_console: Enable console logging
             enable_file: Enable file logging
+            queue_size: Maximum number of records waiting to be written
+            dedup: Sample repeats of an identical error instead of logging each one
         """
         self.log_dir = log_dir or self._get_default_log_dir()
         self.max_bytes = max_bytes
         self.backup_count = backup_count
         self.enable_console = enable_console
         self.enable_file = enable_file
+        self.dedup = dedup
 
         # Create log directory if it doesn't exist
         Path(self.log_dir).mkdir(parents=True, exist_ok=True)
 
+        # Background writer state
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._file_handlers: List[logging.Handler] = []
+        self._listener: Optional[QueueListener] = None
+        self.dropped_count = 0
+
         # Initialize loggers
         self.error_logger = self._setup_logger("renzmc.errors", "errors.log", logging.ERROR)
         self.warning_logger = self._setup_logger("renzmc.warnings", "warnings.log", logging.WARNING)
         self.debug_logger = self._setup_logger("renzmc.debug", "debug.log", logging.DEBUG)
 
+        if self._file_handlers:
+            self._listener = QueueListener(
+                self._queue, *self._file_handlers, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.close)
+
         # Error statistics
         self.error_stats = defaultdict(int)
         self.error_history: List[Dict[str, Any]] = []
 
+        # Dedup state: fingerprint -> [occurrences, error_code]
+        self._lock = threading.Lock()
+        self._occurrences: Dict[Tuple[Any, ...], List[Any]] = {}
+        self.suppressed_count = 0
+        self._cleanup_hint_shown = False
+
     def _get_default_log_dir(self) -> str:
         """Get default log directory."""
         home = Path.home()
@@ -97,7 +145,7 @@ class ErrorLogger:
         logger.setLevel(logging.DEBUG)
         logger.handlers.clear()
 
-        # File handler with rotation
+        # File handler with rotation, written by the background listener
         if self.enable_file:
             log_file = os.path.join(self.log_dir, filename)
             file_handler = RotatingFileHandler(
@@ -105,6 +153,7 @@ class ErrorLogger:
                 maxBytes=self.max_bytes,
                 backupCount=self.backup_count,
                 encoding="utf-8",
+                delay=True,
             )
             file_handler.setLevel(level)
             file_formatter = logging.Formatter(
@@ -112,7 +161,10 @@ class ErrorLogger:
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            # The listener feeds every handler, so route by logger name
+            file_handler.addFilter(logging.Filter(name))
+            self._file_handlers.append(file_handler)
+            logger.addHandler(_BoundedQueueHandler(self._queue, self))
 
         # Console handler
         if self.enable_console and level >= logging.WARNING:
@@ -135,6 +187,10 @@ class ErrorLogger:
         """
         Log an error with full context and analytics.
 
+        Identical errors (same type, message, file and line) are sampled: the
+        first occurrence is logged in full, then only the 2nd, 4th, 8th, ...
+        with an ``occurrences`` counter, and the rest are just counted.
+
         Args:
             error: The exception object
             error_code: Optional error code (will be auto-detected if None)
@@ -145,13 +201,7 @@ class ErrorLogger:
         Returns:
             Error code assigned to this error
         """
-        # Auto-detect error code if not provided
-        if error_code is None:
-            error_type = type(error).__name__
-            error_message = str(error)
-            error_code = suggest_error_code(error_type, error_message)
-            if error_code is None:
-                error_code = "RMC-R001"  # Generic runtime error
+        error_type = type(error).__name__
 
         # Extract clean error message
         error_message = str(error)
@@ -175,16 +225,37 @@ class ErrorLogger:
         if column is None:
             column = getattr(error, "column", None)
 
+        fingerprint = (error_code, error_type, error_message, filename, line)
+        with self._lock:
+            entry = self._occurrences.get(fingerprint)
+            if entry is None:
+                if len(self._occurrences) >= MAX_FINGERPRINTS:
+                    self._occurrences.clear()
+                # Auto-detect error code if not provided
+                if error_code is None:
+                    error_code = suggest_error_code(error_type, str(error)) or "RMC-R001"
+                entry = self._occurrences[fingerprint] = [0, error_code]
+            entry[0] += 1
+            occurrences, error_code = entry
+            self.error_stats[error_code] += 1
+            # Log only on powers of two: 1, 2, 4, 8, ...
+            if self.dedup and occurrences & (occurrences - 1):
+                self.suppressed_count += 1
+                return error_code
+
         # Build error record
         error_record = {
             "timestamp": datetime.now().isoformat(),
             "error_code": error_code,
-            "error_type": type(error).__name__,
+            "error_type": error_type,
             "error_message": error_message,
             "filename": filename or "<unknown>",
             "line": line,
             "column": column,
-            "traceback": traceback.format_exc(),
+            "occurrences": occurrences,
+            "traceback": "".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            ),
             "context": context or {},
         }
 
@@ -192,22 +263,17 @@ class ErrorLogger:
         if source_code and line is not None:
             error_record["source_snippet"] = self._get_source_snippet(source_code, line)
 
-        # Log to file
+        # Queue for the background writer
         self.error_logger.error(json.dumps(error_record, ensure_ascii=False))
 
-        # Save error to individual text file
-        error_file_path = self._save_error_to_file(error_record)
-
-        # Update statistics
-        self.error_stats[error_code] += 1
-        self.error_history.append(error_record)
-
-        # Keep only last 1000 errors in memory
-        if len(self.error_history) > 1000:
-            self.error_history = self.error_history[-1000:]
+        with self._lock:
+            self.error_history.append(error_record)
+            # Keep only last 1000 errors in memory
+            if len(self.error_history) > 1000:
+                del self.error_history[:-1000]
 
         # Print suggestion to clean error logs
-        self._print_cleanup_suggestion(error_file_path)
+        self._print_cleanup_suggestion()
 
         return error_code
 
@@ -283,112 +349,27 @@ class ErrorLogger:
             "lines": snippet_lines,
         }
 
-    def _save_error_to_file(self, error_record: Dict[str, Any]) -> str:
-        """
-        Save error to individual text file.
-
-        Args:
-            error_record: Error record dictionary
-
-        Returns:
-            Path to the saved error file
-        """
-        # Create error logs directory
-        error_logs_dir = os.path.join(self.log_dir, "error_logs")
-        Path(error_logs_dir).mkdir(parents=True, exist_ok=True)
-
-        # Generate unique filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        error_code = error_record.get("error_code", "UNKNOWN")
-        error_type = error_record.get("error_type", "Error")
-        filename = f"error_{error_code}_{error_type}_{timestamp}.txt"
-        filepath = os.path.join(error_logs_dir, filename)
-
-        # Format error content for text file
-        content_lines = [
-            "=" * 80,
-            "RENZMC ERROR LOG",
-            "=" * 80,
-            "",
-            f"Timestamp: {error_record.get('timestamp', 'N/A')}",
-            f"Error Code: {error_record.get('error_code', 'N/A')}",
-            f"Error Type: {error_record.get('error_type', 'N/A')}",
-            f"File: {error_record.get('filename', 'N/A')}",
-            f"Line: {error_record.get('line', 'N/A')}",
-            f"Column: {error_record.get('column', 'N/A')}",
-            "",
-            "-" * 80,
-            "ERROR MESSAGE:",
-            "-" * 80,
-            error_record.get("error_message", "N/A"),
-            "",
-        ]
-
-        # Add source snippet if available
-        if "source_snippet" in error_record:
-            snippet = error_record["source_snippet"]
-            content_lines.extend(
-                [
-                    "-" * 80,
-                    "SOURCE CODE SNIPPET:",
-                    "-" * 80,
-                ]
-            )
-            for line_info in snippet.get("lines", []):
-                marker = ">>>" if line_info.get("is_error_line") else "   "
-                content_lines.append(
-                    f"{marker} {line_info.get('line_number', 0):4d} | {line_info.get('content', '')}"
-                )
-            content_lines.append("")
-
-        # Add traceback
-        content_lines.extend(
-            [
-                "-" * 80,
-                "TRACEBACK:",
-                "-" * 80,
-                error_record.get("traceback", "N/A"),
-                "",
-            ]
-        )
-
-        # Add context if available
-        if error_record.get("context"):
-            content_lines.extend(
-                [
-                    "-" * 80,
-                    "CONTEXT:",
-                    "-" * 80,
-                    json.dumps(error_record["context"], indent=2, ensure_ascii=False),
-                    "",
-                ]
-            )
-
-        content_lines.append("=" * 80)
-
-        # Write to file
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write("\n".join(content_lines))
-
-        return filepath
-
-    def _print_cleanup_suggestion(self, error_file_path: str) -> None:
-        """
-        Print suggestion to clean up error logs.
-
-        Args:
-            error_file_path: Path to the error file that was just created
-        """
-        error_logs_dir = os.path.dirname(error_file_path)
-        error_files = [
-            f for f in os.listdir(error_logs_dir) if f.startswith("error_") and f.endswith(".txt")
-        ]
-        num_errors = len(error_files)
-
-        if num_errors > 0:
-            print(f"\n💡 Error log disimpan di: {error_file_path}")
-            print(f"📁 Total error logs: {num_errors} file")
-            print("🧹 Untuk menghapus semua error logs, jalankan: rmc --hapussampaherror\n")
+    def _print_cleanup_suggestion(self) -> None:
+        """Print where errors are logged, once per logger."""
+        if self._cleanup_hint_shown or not self.enable_file:
+            return
+        self._cleanup_hint_shown = True
+        print(f"\n💡 Error log disimpan di: {os.path.join(self.log_dir, 'errors.log')}")
+        print("🧹 Untuk menghapus semua error logs, jalankan: rmc --hapussampaherror\n")
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._listener is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Drain the queue, stop the background writer and close log files."""
+        if self._listener is None:
+            return
+        listener, self._listener = self._listener, None
+        listener.stop()
+        for handler in self._file_handlers:
+            handler.close()
 
     def get_error_logs_dir(self) -> str:
         """
@@ -397,32 +378,47 @@ class ErrorLogger:
         Returns:
             Path to error logs directory
         """
-        return os.path.join(self.log_dir, "error_logs")
+        return self.log_dir
 
     def clear_error_logs(self) -> int:
         """
-        Clear all error log files.
+        Clear the error log, its rotated backups and legacy per-error files.
 
         Returns:
-            Number of files deleted
+            Number of files deleted or emptied
         """
-        error_logs_dir = self.get_error_logs_dir()
-        if not os.path.exists(error_logs_dir):
-            return 0
-
-        error_files = [
-            f for f in os.listdir(error_logs_dir) if f.startswith("error_") and f.endswith(".txt")
-        ]
+        self.flush()
         count = 0
 
-        for filename in error_files:
-            filepath = os.path.join(error_logs_dir, filename)
+        error_log = os.path.join(self.log_dir, "errors.log")
+        if os.path.exists(error_log) and os.path.getsize(error_log) > 0:
             try:
-                os.remove(filepath)
+                # Truncate in place; the rotating handler may hold it open
+                open(error_log, "w").close()
                 count += 1
-            except Exception:
+            except OSError:
                 pass
 
+        for index in range(1, self.backup_count + 1):
+            backup = f"{error_log}.{index}"
+            if os.path.exists(backup):
+                try:
+                    os.remove(backup)
+                    count += 1
+                except OSError:
+                    pass
+
+        # Older versions wrote one text file per error
+        legacy_dir = os.path.join(self.log_dir, "error_logs")
+        if os.path.isdir(legacy_dir):
+            for filename in os.listdir(legacy_dir):
+                if filename.startswith("error_") and filename.endswith(".txt"):
+                    try:
+                        os.remove(os.path.join(legacy_dir, filename))
+                        count += 1
+                    except OSError:
+                        pass
+
         return count
 
     def get_error_statistics(self) -> Dict[str, Any]:
@@ -440,6 +436,8 @@ class ErrorLogger:
             "unique_error_codes": len(self.error_stats),
             "most_common_errors": [{"code": code, "count": count} for code, count in most_common],
             "error_breakdown": dict(self.error_stats),
+            "suppressed_duplicates": self.suppressed_count,
+            "dropped_records": self.dropped_count,
         }
 
     def get_recent_errors(self, count: int = 10) -> List[Dict[str, Any]]:
@@ -470,8 +468,12 @@ class ErrorLogger:
 
     def clear_statistics(self) -> None:
         """Clear error statistics and history."""
-        self.error_stats.clear()
-        self.error_history.clear()
+        with self._lock:
+            self.error_stats.clear()
+            self.error_history.clear()
+            self._occurrences.clear()
+            self.suppressed_count = 0
+            self.dropped_count = 0
 
     def get_log_files(self) -> List[str]:
         """
@@ -68,30 +68,22 @@ class InterpreterBase(NodeVisitor, TypeIntegrationMixin):
     including scope management, builtin functions, and runtime managers.
     """
 
-    def __init__(self):
-        self.safe_mode = True
-        self.scope_manager = ScopeManager()
-        self.python_integration = PythonIntegration()
-        self.file_ops = FileOperations()
-        self.crypto_ops = CryptoOperations()
-        self.module_manager = RenzmcModuleManager(self)
-        add_examples_path(self)
-        self.advanced_features = AdvancedFeatureManager()
-        self.advanced_features.create_decorator("waktu", timing_decorator)
-        self.advanced_features.create_decorator("cache", cache_decorator)
-        self.advanced_features.create_decorator("coba_ulang", universal_retry_decorator)
-        self.advanced_features.create_decorator("jit_compile", jit_compile_decorator)
-        self.advanced_features.create_decorator("jit_force", jit_force_decorator)
-        self.advanced_features.create_decorator("parallel", parallel_decorator)
-        self.advanced_features.create_decorator("gpu", gpu_decorator)
-        self.advanced_features.create_decorator("profile", profile_decorator)
-
-        self._init_type_system(strict_mode=False)
+    def __init__(self, parent=None):
+        """
+        Args:
+            parent: Interpreter whose runtime managers, module manager and
+                event loop are shared. Module interpreters are created this
+                way so an import does not bootstrap a second runtime.
+        """
+        if parent is None:
+            self._init_runtime()
+        else:
+            self._share_runtime(parent)
 
+        self.scope_manager = ScopeManager()
         self.jit_call_counts = {}
         self.jit_execution_times = {}
         self.jit_compiled_functions = {}
-        self.jit_threshold = 10
 
         if JIT_AVAILABLE and JITCompiler:
             self.jit_compiler = JITCompiler()
@@ -122,12 +114,68 @@ class InterpreterBase(NodeVisitor, TypeIntegrationMixin):
         self._register_advanced_feature_builtins()
         self._register_safety_builtins()
         self._register_inline_cache_builtins()
+        self._register_file_builtins()
 
         self.scope_manager.builtin_functions = self.builtin_functions
         self._setup_python_builtins()
         self._setup_compatibility_adapters()
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        if parent is None:
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+
+    def _init_runtime(self):
+        """Create the runtime managers owned by a top-level interpreter."""
+        self.safe_mode = True
+        self.python_integration = PythonIntegration()
+        self.file_ops = FileOperations()
+        self.crypto_ops = CryptoOperations()
+        self.module_manager = RenzmcModuleManager(self)
+        add_examples_path(self)
+        self.advanced_features = AdvancedFeatureManager()
+        self.advanced_features.create_decorator("waktu", timing_decorator)
+        self.advanced_features.create_decorator("cache", cache_decorator)
+        self.advanced_features.create_decorator("coba_ulang", universal_retry_decorator)
+        self.advanced_features.create_decorator("jit_compile", jit_compile_decorator)
+        self.advanced_features.create_decorator("jit_force", jit_force_decorator)
+        self.advanced_features.create_decorator("parallel", parallel_decorator)
+        self.advanced_features.create_decorator("gpu", gpu_decorator)
+        self.advanced_features.create_decorator("profile", profile_decorator)
+
+        self._init_type_system(strict_mode=False)
+        self.jit_threshold = 10
+
+    def _share_runtime(self, parent):
+        """Use ``parent``'s runtime managers instead of creating new ones."""
+        self.safe_mode = parent.safe_mode
+        self.python_integration = parent.python_integration
+        self.file_ops = parent.file_ops
+        self.crypto_ops = parent.crypto_ops
+        self.module_manager = parent.module_manager
+        self.advanced_features = parent.advanced_features
+        self.type_checker = parent.type_checker
+        self.type_validator = parent.type_validator
+        self.type_checking_enabled = parent.type_checking_enabled
+        self.jit_threshold = parent.jit_threshold
+        self.loop = parent.loop
+
+    def _create_module_interpreter(self, module_path=None):
+        """
+        Create the interpreter that executes a RenzmcLang module.
+
+        The module gets its own scopes, function/class tables, builtins and
+        JIT bookkeeping, while the runtime managers, the module manager and
+        the event loop are shared with this interpreter.
+
+        Args:
+            module_path: Path of the module file, used for relative imports
+
+        Returns:
+            The module interpreter
+        """
+        module_interpreter = type(self)(parent=self)
+        if module_path is not None:
+            module_interpreter.current_file = module_path
+        return module_interpreter
 
     def _register_python_integration_builtins(self):
         """Register Python integration builtin functions."""
@@ -143,6 +191,8 @@ class InterpreterBase(NodeVisitor, TypeIntegrationMixin):
                 "impor_otomatis": self._auto_import_python,
                 "konversi_ke_python": self._convert_to_python,
                 "konversi_dari_python": self._convert_from_python,
+                "mode_konversi_python": self._set_python_conversion_mode,
+                "daftar_konverter_python": self._register_python_converter,
                 "bungkus_pintar": self._create_smart_wrapper,
                 "cek_modul_tersedia": self._check_module_available,
                 "getattr": py_builtins.getattr,
@@ -166,6 +216,9 @@ class InterpreterBase(NodeVisitor, TypeIntegrationMixin):
                 "impor_dari_renzmc": self._import_from_renzmc_module,
                 "impor_semua_dari_renzmc": self._import_all_from_renzmc_module,
                 "muat_ulang_modul": self._reload_renzmc_module,
+                "muat_ulang_berubah": self._reload_changed_renzmc_modules,
+                "pantau_modul": self._watch_renzmc_modules,
+                "hentikan_pantau_modul": self._stop_watching_renzmc_modules,
                 "daftar_modul_renzmc": self._list_renzmc_modules,
                 "info_modul_renzmc": self._get_renzmc_module_info,
                 "tambah_jalur_modul": self._add_module_search_path,
@@ -206,3 +259,11 @@ class InterpreterBase(NodeVisitor, TypeIntegrationMixin):
                 "nonaktifkan_cache_inline": self._disable_inline_cache,
             }
         )
+
+    def _register_file_builtins(self):
+        """Register file access builtin functions."""
+        self.builtin_functions.update(
+            {
+                "petakan_file": self.file_ops.map_file,
+            }
+        )
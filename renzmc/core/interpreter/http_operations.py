@@ -23,6 +23,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from renzmc.utils.rate_limiter import limit_per_host
+
 
 class HTTPOperationsMixin:
     """
@@ -31,6 +33,7 @@ class HTTPOperationsMixin:
     Provides methods for making HTTP requests.
     """
 
+    @limit_per_host
     def _http_request(self, url, method="GET", headers=None, data=None, json=None, timeout=30):
         """
         Make an HTTP request.
@@ -79,6 +82,7 @@ class HTTPOperationsMixin:
         except Exception as e:
             raise ValueError(f"Gagal melakukan HTTP request: {str(e)}")
 
+    @limit_per_host
     def _http_get(self, url, headers=None, params=None, timeout=30):
         """
         Make an HTTP GET request.
@@ -118,6 +122,7 @@ class HTTPOperationsMixin:
         except Exception as e:
             raise ValueError(f"Gagal melakukan HTTP GET request: {str(e)}")
 
+    @limit_per_host
     def _http_post(self, url, headers=None, data=None, json=None, timeout=30):
         """
         Make an HTTP POST request.
@@ -158,6 +163,7 @@ class HTTPOperationsMixin:
         except Exception as e:
             raise ValueError(f"Gagal melakukan HTTP POST request: {str(e)}")
 
+    @limit_per_host
     def _http_put(self, url, headers=None, data=None, json=None, timeout=30):
         """
         Make an HTTP PUT request.
@@ -198,6 +204,7 @@ class HTTPOperationsMixin:
         except Exception as e:
             raise ValueError(f"Gagal melakukan HTTP PUT request: {str(e)}")
 
+    @limit_per_host
     def _http_delete(self, url, headers=None, timeout=30):
         """
         Make an HTTP DELETE request.
@@ -23,7 +23,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from renzmc.core.ast import String
+from renzmc.core.ast import FormattedValue, Num, String
 
 try:
     from renzmc.jit import JITCompiler
@@ -38,7 +38,7 @@ class AdvancedVisitorsMixin:
     """
     Mixin class for advanced visitors.
 
-    Provides 14 methods for handling advanced visitors.
+    Provides 15 methods for handling advanced visitors.
     """
 
     def visit_IndexAccess(self, node):
@@ -234,20 +234,32 @@ class AdvancedVisitorsMixin:
         return node
 
     def visit_FormatString(self, node):
-        result = ""
-        for part in node.parts:
-            if isinstance(part, String):
-                result += part.value
+        template = getattr(node, "_template", None)
+        if template is None:
+            template = node._template = _compile_format_string(node)
+        chunks, fields = template
+        if not fields:
+            return chunks[0]
+        pieces = list(chunks)
+        visit = self.visit
+        for index, expr, convert, spec in fields:
+            value = visit(expr)
+            if convert is not None:
+                value = convert(value)
+            if spec is None:
+                pieces[index] = value if type(value) is str else str(value)
             else:
-                try:
-                    value = self.visit(part)
-                    if value is not None:
-                        result += str(value)
-                    else:
-                        result += "None"
-                except Exception as e:
-                    result += f"<Error: {str(e)}>"
-        return result
+                pieces[index] = format(value, spec if type(spec) is str else visit(spec))
+        return "".join(pieces)
+
+    def visit_FormattedValue(self, node):
+        value = self.visit(node.expr)
+        if node.conversion is not None:
+            value = _CONVERSIONS[node.conversion](value)
+        spec = node.format_spec
+        if spec is None:
+            return str(value)
+        return format(value, spec if isinstance(spec, str) else self.visit(spec))
 
     def visit_Unpacking(self, node):
         value = self.visit(node.expr)
@@ -313,3 +325,37 @@ class AdvancedVisitorsMixin:
             return list(value)
         except (TypeError, ValueError) as e:
             self.error(f"Nilai tidak dapat di-unpack: {type(value).__name__} - {e}", node.token)
+
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+def _compile_format_string(node):
+    """
+    Compile an f-string into literal chunks and the fields that fill them.
+
+    Returns ``(chunks, fields)``: ``chunks`` is the list joined into the result,
+    with ``None`` where a field goes, and each field is
+    ``(index, expression, conversion, format_spec)``. Literal parts and numeric
+    constants are folded into the chunks, so only real expressions are
+    evaluated at runtime.
+    """
+    chunks = []
+    fields = []
+    for part in node.parts:
+        expr, conversion, spec = part, None, None
+        if isinstance(part, FormattedValue):
+            expr, conversion, spec = part.expr, part.conversion, part.format_spec
+        if conversion is None and spec is None and isinstance(expr, (String, Num)):
+            text = expr.value if isinstance(expr, String) else str(expr.value)
+            if chunks and chunks[-1] is not None:
+                chunks[-1] += text
+            else:
+                chunks.append(text)
+            continue
+        convert = _CONVERSIONS[conversion] if conversion is not None else None
+        fields.append((len(chunks), expr, convert, spec))
+        chunks.append(None)
+    if not chunks:
+        chunks.append("")
+    return chunks, fields
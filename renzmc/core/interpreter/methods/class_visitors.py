@@ -24,7 +24,6 @@ SOFTWARE.
 """
 
 import builtins as py_builtins
-import importlib
 
 from renzmc.core.ast import (
     Block,
@@ -32,7 +31,10 @@ from renzmc.core.ast import (
     MethodDecl,
     VarDecl,
 )
+from renzmc.core.base_visitor import is_located
 from renzmc.core.error import TypeHintError
+from renzmc.runtime.numeric_array import Larik, from_ndarray
+from renzmc.runtime.python_integration import PythonModule, import_submodule
 from renzmc.utils.error_handler import handle_import_error, log_exception
 
 try:
@@ -48,7 +50,7 @@ class ClassVisitorsMixin:
     """
     Mixin class for class visitors.
 
-    Provides 9 methods for handling class visitors.
+    Provides 10 methods for handling class visitors.
     """
 
     def visit_ClassDecl(self, node):
@@ -72,12 +74,19 @@ class ClassVisitorsMixin:
                 )
             elif isinstance(method, Constructor):
                 constructor = (method.params, method.body, method.param_types)
-        self.classes[name] = {
+        class_info = {
             "methods": methods,
             "constructor": constructor,
             "parent": parent,
             "class_vars": class_vars,
         }
+        # Hot reload updates the existing class so holders of its info see the new methods
+        existing = self.classes.get(name)
+        if existing is not None and getattr(self, "_reloading_module", False):
+            existing.clear()
+            existing.update(class_info)
+        else:
+            self.classes[name] = class_info
 
     def visit_MethodDecl(self, node):
         pass
@@ -106,14 +115,12 @@ class ClassVisitorsMixin:
                 and hasattr(obj, "__package__")
                 and (not isinstance(obj, dict))
             ):
-                try:
-                    submodule_name = f"{obj.__name__}.{attr}"
-                    submodule = importlib.import_module(submodule_name)
+                submodule = import_submodule(f"{obj.__name__}.{attr}")
+                if submodule is not None:
                     setattr(obj, attr, submodule)
                     return submodule
-                except ImportError:
-                    # Module not available - continuing without it
-                    handle_import_error("module", "import operation", "Continuing without module")
+                # Module not available - continuing without it
+                handle_import_error("module", "import operation", "Continuing without module")
             raise AttributeError(f"Objek '{type(obj).__name__}' tidak memiliki atribut '{attr}'")
 
     def visit_MethodCall(self, node):
@@ -121,12 +128,16 @@ class ClassVisitorsMixin:
         method = node.method
         args = [self.visit(arg) for arg in node.args]
         if hasattr(obj, method) and callable(getattr(obj, method)):
+            if isinstance(obj, PythonModule):
+                return self._call_python_module(obj, method, args)
             try:
                 return getattr(obj, method)(*args)
             except KeyboardInterrupt:
                 print(f"\n✓ Operasi '{method}' dihentikan oleh pengguna")
                 return None
             except Exception as e:
+                if is_located(e):
+                    raise
                 obj_type = type(obj).__name__
                 raise RuntimeError(
                     f"Error saat memanggil metode '{method}' pada objek '{obj_type}': {str(e)}"
@@ -134,67 +145,52 @@ class ClassVisitorsMixin:
         if id(obj) in self.instance_scopes:
             class_name = obj.__class__.__name__
             if class_name in self.classes and method in self.classes[class_name]["methods"]:
-                old_instance = self.current_instance
-                old_local_scope = self.local_scope.copy()
-                self.current_instance = id(obj)
-                self.local_scope = {}
-                params, body, return_type, param_types = self.classes[class_name]["methods"][method]
-                self.local_scope["diri"] = obj
-                if params and len(params) > 0:
-                    start_param_idx = 1 if params[0] == "diri" else 0
-                    expected_user_params = len(params) - start_param_idx
-                    if len(args) != expected_user_params:
-                        raise RuntimeError(
-                            f"Metode '{method}' membutuhkan {expected_user_params} parameter, tetapi {len(args)} diberikan"
-                        )
-                    if param_types and len(param_types) > start_param_idx:
-                        for i, (arg, type_hint) in enumerate(
-                            zip(args, param_types[start_param_idx:])
-                        ):
-                            type_name = type_hint.type_name
-                            if type_name in self.type_registry:
-                                expected_type = self.type_registry[type_name]
-                                try:
-                                    if isinstance(expected_type, type) and not isinstance(
-                                        arg, expected_type
-                                    ):
-                                        raise TypeHintError(
-                                            f"Parameter ke-{i + 1} '{params[i + start_param_idx]}' harus bertipe '{type_name}'"
-                                        )
-                                except TypeError as e:
-                                    # Type checking failed - this is expected for non-type objects
-                                    log_exception("type validation", e, level="debug")
-                            elif hasattr(py_builtins, type_name):
-                                expected_type = getattr(py_builtins, type_name)
-                                try:
-                                    if isinstance(expected_type, type) and not isinstance(
-                                        arg, expected_type
-                                    ):
-                                        raise TypeHintError(
-                                            f"Parameter ke-{i + 1} '{params[i + start_param_idx]}' harus bertipe '{type_name}'"
-                                        )
-                                except TypeError as e:
-                                    # Type checking failed - this is expected for non-type objects
-                                    log_exception("type validation", e, level="debug")
-                    for i, param_name in enumerate(params[start_param_idx:]):
-                        self.local_scope[param_name] = args[i]
-                elif len(args) != 0:
-                    raise RuntimeError(
-                        f"Metode '{method}' tidak membutuhkan parameter, tetapi {len(args)} diberikan"
-                    )
-                self.return_value = None
-                self.visit_Block(Block(body))
-                return_value = self.return_value
-                if return_type and return_value is not None:
-                    type_name = return_type.type_name
+                return self._execute_user_method(obj, class_name, method, args)
+        raise AttributeError(f"Objek '{type(obj).__name__}' tidak memiliki metode '{method}'")
+
+    def _call_python_module(self, module, method, args):
+        # Numeric arrays cross the boundary without copying: a larik argument is
+        # handed over as its backing array and a 1-D numeric ndarray result becomes a larik
+        args = [arg.ke_python() if type(arg) is Larik else arg for arg in args]
+        try:
+            result = getattr(module, method)(*args)
+        except KeyboardInterrupt:
+            print(f"\n✓ Operasi '{method}' dihentikan oleh pengguna")
+            return None
+        except Exception as e:
+            if is_located(e):
+                raise
+            raise RuntimeError(
+                f"Error saat memanggil metode '{method}' pada objek 'PythonModule': {str(e)}"
+            ) from e
+        adopted = from_ndarray(result)
+        return result if adopted is None else adopted
+
+    def _execute_user_method(self, obj, class_name, method, args):
+        old_instance = self.current_instance
+        old_local_scope = self.local_scope.copy()
+        self.current_instance = id(obj)
+        self.local_scope = {}
+        params, body, return_type, param_types = self.classes[class_name]["methods"][method]
+        self.local_scope["diri"] = obj
+        if params and len(params) > 0:
+            start_param_idx = 1 if params[0] == "diri" else 0
+            expected_user_params = len(params) - start_param_idx
+            if len(args) != expected_user_params:
+                raise RuntimeError(
+                    f"Metode '{method}' membutuhkan {expected_user_params} parameter, tetapi {len(args)} diberikan"
+                )
+            if param_types and len(param_types) > start_param_idx:
+                for i, (arg, type_hint) in enumerate(zip(args, param_types[start_param_idx:])):
+                    type_name = type_hint.type_name
                     if type_name in self.type_registry:
                         expected_type = self.type_registry[type_name]
                         try:
                             if isinstance(expected_type, type) and not isinstance(
-                                return_value, expected_type
+                                arg, expected_type
                             ):
                                 raise TypeHintError(
-                                    f"Nilai kembali metode '{method}' harus bertipe '{type_name}'"
+                                    f"Parameter ke-{i + 1} '{params[i + start_param_idx]}' harus bertipe '{type_name}'"
                                 )
                         except TypeError as e:
                             # Type checking failed - this is expected for non-type objects
@@ -203,19 +199,53 @@ class ClassVisitorsMixin:
                         expected_type = getattr(py_builtins, type_name)
                         try:
                             if isinstance(expected_type, type) and not isinstance(
-                                return_value, expected_type
+                                arg, expected_type
                             ):
                                 raise TypeHintError(
-                                    f"Nilai kembali metode '{method}' harus bertipe '{type_name}'"
+                                    f"Parameter ke-{i + 1} '{params[i + start_param_idx]}' harus bertipe '{type_name}'"
                                 )
                         except TypeError as e:
                             # Type checking failed - this is expected for non-type objects
                             log_exception("type validation", e, level="debug")
-                self.current_instance = old_instance
-                self.local_scope = old_local_scope
-                self.return_value = None
-                return return_value
-        raise AttributeError(f"Objek '{type(obj).__name__}' tidak memiliki metode '{method}'")
+            for i, param_name in enumerate(params[start_param_idx:]):
+                self.local_scope[param_name] = args[i]
+        elif len(args) != 0:
+            raise RuntimeError(
+                f"Metode '{method}' tidak membutuhkan parameter, tetapi {len(args)} diberikan"
+            )
+        self.return_value = None
+        self.visit_Block(Block(body))
+        return_value = self.return_value
+        if return_type and return_value is not None:
+            type_name = return_type.type_name
+            if type_name in self.type_registry:
+                expected_type = self.type_registry[type_name]
+                try:
+                    if isinstance(expected_type, type) and not isinstance(
+                        return_value, expected_type
+                    ):
+                        raise TypeHintError(
+                            f"Nilai kembali metode '{method}' harus bertipe '{type_name}'"
+                        )
+                except TypeError as e:
+                    # Type checking failed - this is expected for non-type objects
+                    log_exception("type validation", e, level="debug")
+            elif hasattr(py_builtins, type_name):
+                expected_type = getattr(py_builtins, type_name)
+                try:
+                    if isinstance(expected_type, type) and not isinstance(
+                        return_value, expected_type
+                    ):
+                        raise TypeHintError(
+                            f"Nilai kembali metode '{method}' harus bertipe '{type_name}'"
+                        )
+                except TypeError as e:
+                    # Type checking failed - this is expected for non-type objects
+                    log_exception("type validation", e, level="debug")
+        self.current_instance = old_instance
+        self.local_scope = old_local_scope
+        self.return_value = None
+        return return_value
 
     def visit_SelfVar(self, node):
         # Check if 'self' is used as a regular parameter in a function
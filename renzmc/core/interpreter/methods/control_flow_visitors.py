@@ -24,6 +24,7 @@ SOFTWARE.
 """
 
 from renzmc.core.ast import Block
+from renzmc.core.error import resolve_exception_types
 
 try:
     from renzmc.jit import JITCompiler
@@ -125,29 +126,74 @@ class ControlFlowVisitorsMixin:
         self.continue_flag = True
 
     def visit_TryCatch(self, node):
+        compiled = getattr(node, "_compiled_handlers", None)
+        if compiled is None:
+            compiled = self._compile_try_catch(node)
+        try_block, handlers, finally_block = compiled
         try:
-            return self.visit_Block(Block(node.try_block))
+            return self.visit_Block(try_block)
         except Exception as e:
-            for exception_type, var_name, except_block in node.except_blocks:
-                should_catch = False
+            for exception_type, exc_types, var_name, except_block in handlers:
                 if exception_type is None:
-                    should_catch = True
+                    caught = e
                 else:
-                    try:
-                        exc_type = eval(exception_type)
-                        if isinstance(exc_type, type):
-                            should_catch = isinstance(e, exc_type)
-                    except Exception:
-                        should_catch = True
-
-                if should_catch:
+                    if exc_types is None:
+                        exc_types = self._resolve_scope_exception_types(exception_type)
+                    # ``tangkap e`` names the variable rather than an exception type
+                    bare_name = var_name is None and "." not in exception_type
+                    if exc_types:
+                        caught = _match_exception(e, exc_types)
+                    elif exc_types is None or bare_name:
+                        caught = e
+                        if bare_name:
+                            var_name = exception_type
+                    else:
+                        caught = None
+                if caught is not None:
                     if var_name:
-                        self.set_variable(var_name, e)
-                    return self.visit_Block(Block(except_block))
-            raise e
+                        self.set_variable(var_name, caught)
+                    return self.visit_Block(except_block)
+            raise
         finally:
-            if node.finally_block:
-                self.visit_Block(Block(node.finally_block))
+            if finally_block is not None:
+                self.visit_Block(finally_block)
+
+    def _compile_try_catch(self, node):
+        """Resolve ``tangkap`` types and wrap the bodies once per TryCatch node."""
+        handlers = tuple(
+            (
+                exception_type,
+                resolve_exception_types(exception_type) if exception_type else None,
+                var_name,
+                Block(except_block),
+            )
+            for exception_type, var_name, except_block in node.except_blocks
+        )
+        finally_block = Block(node.finally_block) if node.finally_block else None
+        compiled = (Block(node.try_block), handlers, finally_block)
+        node._compiled_handlers = compiled
+        return compiled
+
+    def _resolve_scope_exception_types(self, exception_type):
+        """
+        Resolve a ``tangkap`` type that is not a known exception name, such as
+        ``json.JSONDecodeError`` from an imported Python module.
+
+        Returns None when the name cannot be resolved, which catches everything;
+        a resolved value that is not an exception class catches nothing.
+        """
+        head, *rest = exception_type.split(".")
+        try:
+            value = self.get_variable(head)
+            for attr in rest:
+                value = getattr(value, attr)
+        except Exception:
+            return None
+        attrs = getattr(value, "__dict__", None) or {}
+        value = attrs.get("_obj", attrs.get("_module", value))
+        if isinstance(value, type) and issubclass(value, BaseException):
+            return (value,)
+        return ()
 
     def visit_Raise(self, node):
         exception = self.visit(node.exception)
@@ -188,3 +234,20 @@ class ControlFlowVisitorsMixin:
         finally:
             if not hasattr(self, "_exception_occurred"):
                 context_manager.__exit__(None, None, None)
+
+
+def _match_exception(error, exc_types):
+    """
+    Return the exception in ``error``'s chain that is an instance of ``exc_types``.
+
+    The interpreter reports errors from builtins and Python code as
+    RuntimeError carrying the source position, with the original exception
+    as its context, so plain RuntimeErrors are looked through.
+    """
+    while error is not None:
+        if isinstance(error, exc_types):
+            return error
+        if type(error) is not RuntimeError:
+            return None
+        error = error.__cause__ or error.__context__
+    return None
@@ -25,9 +25,7 @@ SOFTWARE.
 
 
 import builtins as py_builtins
-import os
 import time
-from pathlib import Path
 
 from renzmc.core.ast import Block
 from renzmc.core.error import TypeHintError
@@ -81,6 +79,16 @@ class ExecutionHelpersMixin:
                 if name not in self.jit_compiled_functions:
                     self._compile_function_with_jit(name, params, body, force=True)
 
+            # Deep self-recursion reaches the threshold before any call has
+            # returned, so active frames count towards it as well
+            if (
+                JIT_AVAILABLE
+                and name in self.jit_call_counts
+                and name not in self.jit_compiled_functions
+                and self._recursion_depth[name] > self.jit_threshold
+            ):
+                self._compile_function_with_jit(name, params, body)
+
             if JIT_AVAILABLE and name in self.jit_compiled_functions:
                 compiled_func = self.jit_compiled_functions[name]
                 if compiled_func is not None:
@@ -99,7 +107,7 @@ class ExecutionHelpersMixin:
                         # Unexpected exception - logging for debugging
                         log_exception("operation", e, level="warning")
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             param_values = {}
             for i, arg in enumerate(args):
                 if i >= len(params):
@@ -156,6 +164,8 @@ class ExecutionHelpersMixin:
             self.return_value = None
             for stmt in body:
                 self.visit(stmt)
+                if self.return_value is not None:
+                    break
                 if hasattr(self, "return_flag") and self.return_flag:
                     break
                 if (
@@ -213,7 +223,7 @@ class ExecutionHelpersMixin:
             self.return_value = None
 
             if JIT_AVAILABLE and name in self.jit_call_counts:
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 self.jit_call_counts[name] += 1
                 self.jit_execution_times[name] += execution_time
 
@@ -221,13 +231,7 @@ class ExecutionHelpersMixin:
                     self.jit_call_counts[name] >= self.jit_threshold
                     and name not in self.jit_compiled_functions
                 ):
-                    # Check if function is recursive before auto-compiling
-                    from renzmc.jit.type_inference import TypeInferenceEngine
-
-                    type_inference = TypeInferenceEngine()
-                    complexity = type_inference.analyze_function_complexity(body, name)
-                    if not complexity["has_recursion"]:
-                        self._compile_function_with_jit(name, params, body)
+                    self._compile_function_with_jit(name, params, body)
 
             return return_value
         finally:
@@ -340,162 +344,13 @@ class ExecutionHelpersMixin:
         if module_name in self.modules:
             return self.modules[module_name]
 
-        # Convert dot-separated module name to path (e.g., "Ren.renz" -> "Ren/renz")
-        module_path = module_name.replace(".", os.sep)
-
-        search_paths = [
-            f"{module_path}.rmc",
-            f"modules/{module_path}.rmc",
-            f"examples/{module_path}.rmc",
-            f"examples/modules/{module_path}.rmc",
-            f"lib/{module_path}.rmc",
-            f"rmc_modules/{module_path}.rmc",
-        ]
-        if "__file__" in globals():
-            script_dir = Path(__file__).parent
-            search_paths.extend(
-                [
-                    str(script_dir / f"{module_path}.rmc"),
-                    str(script_dir / "modules" / f"{module_path}.rmc"),
-                    str(script_dir / "lib" / f"{module_path}.rmc"),
-                ]
-            )
-        for file_path in search_paths:
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        source_code = f.read()
-                    # Import Interpreter here to avoid circular import
-                    from renzmc.core.interpreter import Interpreter
-                    from renzmc.core.lexer import Lexer
-                    from renzmc.core.parser import Parser
-
-                    module_interpreter = Interpreter()
-                    lexer = Lexer(source_code)
-                    parser = Parser(lexer)
-                    ast = parser.parse()
-                    module_interpreter.visit(ast)
-
-                    class RenzmcModule:
-
-                        def __init__(self, scope):
-                            self._exports = {}
-                            builtin_names = set(self._get_builtin_names())
-                            for name, value in scope.items():
-                                # Export user-defined items, but skip:
-                                # - Private items (starting with _)
-                                # - Python integration items (starting with py_)
-                                # - Builtin functions that are the same object as the builtin
-                                # (Allow user-defined functions even if they have the same name as builtins)
-                                if name.startswith("_") or name.startswith("py_"):
-                                    continue
-
-                                # Check if it's actually a builtin by comparing object identity
-                                is_builtin = False
-                                if name in builtin_names:
-                                    # Only skip if it's the actual builtin function, not a user-defined one
-                                    try:
-                                        import renzmc.builtins as renzmc_builtins
-
-                                        if hasattr(renzmc_builtins, name):
-                                            builtin_func = getattr(renzmc_builtins, name)
-                                            if value is builtin_func:
-                                                is_builtin = True
-                                    except Exception:
-                                        pass
-
-                                if not is_builtin:
-                                    setattr(self, name, value)
-                                    self._exports[name] = value
-
-                        def _get_builtin_names(self):
-                            return {
-                                "tampilkan",
-                                "panjang",
-                                "jenis",
-                                "ke_teks",
-                                "ke_angka",
-                                "huruf_besar",
-                                "huruf_kecil",
-                                "potong",
-                                "gabung",
-                                "pisah",
-                                "ganti",
-                                "mulai_dengan",
-                                "akhir_dengan",
-                                "berisi",
-                                "hapus_spasi",
-                                "bulat",
-                                "desimal",
-                                "akar",
-                                "pangkat",
-                                "absolut",
-                                "pembulatan",
-                                "pembulatan_atas",
-                                "pembulatan_bawah",
-                                "sinus",
-                                "cosinus",
-                                "tangen",
-                                "tambah",
-                                "hapus",
-                                "hapus_pada",
-                                "masukkan",
-                                "urutkan",
-                                "balikkan",
-                                "hitung",
-                                "indeks",
-                                "extend",
-                                "kunci",
-                                "nilai",
-                                "item",
-                                "hapus_kunci",
-                                "acak",
-                                "waktu",
-                                "tanggal",
-                                "tidur",
-                                "tulis_file",
-                                "baca_file",
-                                "tambah_file",
-                                "file_exists",
-                                "ukuran_file",
-                                "hapus_file",
-                                "json_ke_teks",
-                                "teks_ke_json",
-                                "url_encode",
-                                "url_decode",
-                                "hash_teks",
-                                "base64_encode",
-                                "base64_decode",
-                                "buat_uuid",
-                                "regex_match",
-                                "regex_replace",
-                                "regex_split",
-                                "http_get",
-                                "http_post",
-                                "http_put",
-                                "http_delete",
-                                "panggil",
-                                "daftar_direktori",
-                                "buat_direktori",
-                                "direktori_exists",
-                            }
-
-                        def get_exports(self):
-                            return self._exports.copy()
-
-                        def __getitem__(self, key):
-                            return getattr(self, key)
-
-                        def __contains__(self, key):
-                            return hasattr(self, key)
-
-                    loaded_module = RenzmcModule(module_interpreter.global_scope)
-                    # Cache the loaded module
-                    self.modules[module_name] = loaded_module
-                    return loaded_module
-                except Exception as e:
-                    raise ImportError(f"Gagal memuat modul RenzMC '{module_name}': {str(e)}")
-        return None
+        # Not a RenzmcLang module - let the caller fall back to Python imports
+        if not self.module_manager.find_module(module_name):
+            return None
+
+        loaded_module = self.module_manager.load_module(module_name)
+        self.modules[module_name] = loaded_module
+        return loaded_module
 
     def _smart_getattr(self, obj, name, default=None):
         try:
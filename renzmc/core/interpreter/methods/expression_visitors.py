@@ -23,8 +23,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import operator
+
 from renzmc.core.error import DivisionByZeroError
 from renzmc.core.token import TokenType
+from renzmc.runtime.numeric_array import Larik
 
 try:
     from renzmc.jit import JITCompiler
@@ -34,6 +37,25 @@ except ImportError:
     JIT_AVAILABLE = False
     JITCompiler = None
 
+# Operators applied elementwise when either operand is a Larik
+_ARRAY_OPERATORS = {
+    TokenType.TAMBAH: operator.add,
+    TokenType.KURANG: operator.sub,
+    TokenType.KALI_OP: operator.mul,
+    TokenType.BAGI: operator.truediv,
+    TokenType.SISA_BAGI: operator.mod,
+    TokenType.PEMBAGIAN_BULAT: operator.floordiv,
+    TokenType.PANGKAT: operator.pow,
+    TokenType.SAMA_DENGAN: operator.eq,
+    TokenType.TIDAK_SAMA: operator.ne,
+    TokenType.LEBIH_DARI: operator.gt,
+    TokenType.KURANG_DARI: operator.lt,
+    TokenType.LEBIH_SAMA: operator.ge,
+    TokenType.KURANG_SAMA: operator.le,
+}
+
+_ARRAY_DIVISIONS = (TokenType.BAGI, TokenType.SISA_BAGI, TokenType.PEMBAGIAN_BULAT)
+
 
 class ExpressionVisitorsMixin:
     """
@@ -45,6 +67,10 @@ class ExpressionVisitorsMixin:
     def visit_BinOp(self, node):
         left = self.visit(node.left)
         right = self.visit(node.right)
+        if (isinstance(left, Larik) or isinstance(right, Larik)) and (
+            node.op.type in _ARRAY_OPERATORS
+        ):
+            return self._visit_array_binop(node.op.type, left, right)
         if node.op.type == TokenType.TAMBAH:
             if isinstance(left, str) or isinstance(right, str):
                 return str(left) + str(right)
@@ -111,6 +137,13 @@ class ExpressionVisitorsMixin:
             return left is not right
         raise RuntimeError(f"Operator tidak didukung: {node.op.type}")
 
+    def _visit_array_binop(self, op_type, left, right):
+        if op_type in _ARRAY_DIVISIONS:
+            zero = right.has_zero() if isinstance(right, Larik) else right == 0
+            if zero:
+                raise DivisionByZeroError("Pembagian dengan nol tidak diperbolehkan")
+        return _ARRAY_OPERATORS[op_type](left, right)
+
     def visit_UnaryOp(self, node):
         expr = self.visit(node.expr)
         if node.op.type == TokenType.TAMBAH:
@@ -27,6 +27,7 @@ import asyncio
 import builtins as py_builtins
 
 from renzmc.core.ast import Var
+from renzmc.core.base_visitor import is_located
 from renzmc.core.error import (
     AsyncError,
     TypeHintError,
@@ -55,7 +56,8 @@ class FunctionVisitorsMixin:
         body = node.body
         return_type = node.return_type
         param_types = node.param_types
-        self.functions[name] = (params, body, return_type, param_types)
+        definition = (params, body, return_type, param_types)
+        self.functions[name] = definition
 
         # Only enable JIT tracking if function doesn't have manual JIT decorators
         # Manual decorators handle compilation themselves
@@ -67,13 +69,24 @@ class FunctionVisitorsMixin:
                 self.jit_call_counts[name] = 0
                 self.jit_execution_times[name] = 0.0
 
+        # Hot reload swaps the definition of the existing function object,
+        # so every reference held by importers runs the new body
+        existing = self.global_scope.get(name)
+        if getattr(self, "_reloading_module", False) and getattr(
+            existing, "__renzmc_function__", False
+        ):
+            existing.__renzmc_definition__ = definition
+            return existing
+
         def renzmc_function(*args, **kwargs):
+            params, body, return_type, param_types = renzmc_function.__renzmc_definition__
             return self._execute_user_function(
                 name, params, body, return_type, param_types, list(args), kwargs
             )
 
         renzmc_function.__name__ = name
         renzmc_function.__renzmc_function__ = True
+        renzmc_function.__renzmc_definition__ = definition
         self.global_scope[name] = renzmc_function
 
         # Return the function so decorators can work with it
@@ -92,6 +105,8 @@ class FunctionVisitorsMixin:
                     try:
                         return func(*args, **kwargs)
                     except Exception as e:
+                        if is_located(e):
+                            raise
                         func_name = getattr(func, "__name__", str(type(func).__name__))
                         raise RuntimeError(
                             f"Error dalam pemanggilan fungsi '{func_name}': {str(e)}"
@@ -152,6 +167,8 @@ class FunctionVisitorsMixin:
                     try:
                         return decorator_data(*args, **kwargs)
                     except Exception as e:
+                        if is_located(e):
+                            raise
                         raise RuntimeError(f"Error dalam fungsi terdekorasi '{name}': {str(e)}")
                 else:
                     # Old style: tuple of (decorator_func, original_func)
@@ -174,6 +191,8 @@ class FunctionVisitorsMixin:
                             # For wrapper decorators, call the decorator with function and args
                             return raw_decorator_func(original_func, *args, **kwargs)
                     except Exception as e:
+                        if is_located(e):
+                            raise
                         raise RuntimeError(f"Error dalam fungsi terdekorasi '{name}': {str(e)}")
             
             # Priority 3: Check classes
@@ -187,6 +206,8 @@ class FunctionVisitorsMixin:
                     try:
                         return lambda_func(*args, **kwargs)
                     except Exception as e:
+                        if is_located(e):
+                            raise
                         raise RuntimeError(f"Error dalam lambda '{name}': {str(e)}")
             except NameError as e:
                 # Name not found - this is expected in some contexts
@@ -197,6 +218,8 @@ class FunctionVisitorsMixin:
                 try:
                     return self.builtin_functions[name](*args, **kwargs)
                 except Exception as e:
+                    if is_located(e):
+                        raise
                     raise RuntimeError(f"Error dalam fungsi '{name}': {str(e)}")
             
             # If no function found, raise error
@@ -27,11 +27,15 @@ import builtins as py_builtins
 
 from renzmc.core.ast import (
     AttributeRef,
+    BinOp,
     IndexAccess,
     Var,
 )
 from renzmc.core.error import TypeHintError
 from renzmc.core.token import TokenType
+from renzmc.runtime.numeric_array import Larik
+from renzmc.runtime.output import write_line
+from renzmc.runtime.python_integration import PythonDictView, PythonListView
 from renzmc.utils.error_handler import log_exception
 
 try:
@@ -42,6 +46,9 @@ except ImportError:
     JIT_AVAILABLE = False
     JITCompiler = None
 
+# Containers that accept ``x[i] itu nilai``
+_INDEXABLE = (list, dict, Larik, PythonListView, PythonDictView)
+
 
 class StatementVisitorsMixin:
     """
@@ -51,9 +58,17 @@ class StatementVisitorsMixin:
     """
 
     def visit_Var(self, node):
-        return self.get_variable(node.name)
+        value = self.get_variable(node.name)
+        if type(value) is _PendingText:
+            return value.text()
+        return value
 
     def visit_VarDecl(self, node):
+        operands = getattr(node, "_self_append", _UNCHECKED)
+        if operands is _UNCHECKED:
+            operands = node._self_append = _self_append_operands(node)
+        if operands and self._append_text(node.var_name, operands):
+            return None
         value = self.visit(node.value)
 
         if node.type_hint:
@@ -103,17 +118,58 @@ class StatementVisitorsMixin:
         elif isinstance(node.var, IndexAccess):
             obj = self.visit(node.var.obj)
             index = self.visit(node.var.index)
-            if isinstance(obj, (list, dict)):
+            if isinstance(obj, _INDEXABLE):
                 obj[index] = value
                 return value
             else:
                 raise TypeError(f"Objek tipe '{type(obj).__name__}' tidak mendukung pengindeksan")
         raise RuntimeError(f"Tipe assignment tidak didukung: {type(node.var).__name__}")
 
+    def _append_text(self, name, operands):
+        """
+        Run ``name itu name + a + b ...`` on a local text variable without copying it.
+
+        The variable then holds a _PendingText and the text is joined only
+        when it is read, so building a long text in a loop stays linear.
+        Returns False, before evaluating anything, when this does not apply.
+        """
+        local_scope = self.local_scope
+        if self.current_instance is not None or name not in local_scope:
+            return False
+        current = local_scope[name]
+        if type(current) is str:
+            current = _PendingText(_TextParts(current), 1)
+        elif type(current) is not _PendingText:
+            return False
+        value = current
+        for expr in operands:
+            operand = self.visit(expr)
+            if type(value) is not _PendingText:
+                value = value + operand
+            elif isinstance(operand, Larik):
+                value = self._visit_array_binop(TokenType.TAMBAH, value.text(), operand)
+            else:
+                value = value.append(operand if type(operand) is str else str(operand))
+        self.set_variable(name, value, is_local=True)
+        return True
+
     def visit_CompoundAssign(self, node):
+        if (
+            isinstance(node.var, Var)
+            and node.op.type == TokenType.TAMBAH_SAMA_DENGAN
+            and self.current_instance is None
+            and type(self.local_scope.get(node.var.name)) is _PendingText
+        ):
+            current = self.local_scope[node.var.name]
+            operand = self.visit(node.value)
+            if type(operand) is str:
+                self.set_variable(node.var.name, current.append(operand), is_local=True)
+                return None
+            # Same result and errors as str + operand
+            return self.set_variable(node.var.name, current.text() + operand)
 
         if isinstance(node.var, Var):
-            current_value = self.get_variable(node.var.name)
+            current_value = self.visit_Var(node.var)
         elif isinstance(node.var, IndexAccess):
             obj = self.visit(node.var.obj)
             index = self.visit(node.var.index)
@@ -238,7 +294,7 @@ class StatementVisitorsMixin:
                 elif isinstance(var_node, IndexAccess):
                     obj = self.visit(var_node.obj)
                     index = self.visit(var_node.index)
-                    if isinstance(obj, (list, dict)):
+                    if isinstance(obj, _INDEXABLE):
                         obj[index] = value
                     else:
                         raise TypeError(
@@ -263,7 +319,7 @@ class StatementVisitorsMixin:
 
     def visit_Print(self, node):
         value = self.visit(node.expr)
-        print(value)
+        write_line(value)
         return None
 
     def visit_Input(self, node):
@@ -295,3 +351,67 @@ class StatementVisitorsMixin:
             target[slice_obj] = value
         except Exception as e:
             self.error(f"Kesalahan dalam slice assignment: {str(e)}", node.token)
+
+
+_UNCHECKED = object()
+
+
+def _self_append_operands(node):
+    """Return ``(a, b, ...)`` when VarDecl ``node`` is ``teks itu teks + a + b ...``."""
+    if node.type_hint is not None:
+        return ()
+    operands = []
+    value = node.value
+    while isinstance(value, BinOp) and value.op.type == TokenType.TAMBAH:
+        operands.append(value.right)
+        value = value.left
+    if not (isinstance(value, Var) and value.name == node.var_name):
+        return ()
+    return tuple(reversed(operands))
+
+
+class _TextParts:
+    """Pieces appended to one text variable, plus the longest prefix joined so far."""
+
+    __slots__ = ("parts", "joined", "joined_count")
+
+    def __init__(self, text):
+        self.parts = [text]
+        self.joined = text
+        self.joined_count = 1
+
+
+class _PendingText:
+    """
+    Value of a local variable grown with ``teks itu teks + bagian``.
+
+    It stands for the first ``count`` pieces of ``buffer``. Appending adds a
+    piece and returns a new value instead of changing this one, so a copy of
+    the scope taken earlier (a generator, a saved caller scope) keeps its
+    text. Only the newest value appends in place; an older one starts its
+    own buffer.
+    """
+
+    __slots__ = ("buffer", "count")
+
+    def __init__(self, buffer, count):
+        self.buffer = buffer
+        self.count = count
+
+    def append(self, text):
+        buffer = self.buffer
+        if self.count != len(buffer.parts):
+            buffer = _TextParts(self.text())
+        buffer.parts.append(text)
+        return _PendingText(buffer, len(buffer.parts))
+
+    def text(self):
+        buffer = self.buffer
+        count = self.count
+        if buffer.joined_count == count:
+            return buffer.joined
+        if buffer.joined_count > count:
+            return "".join(buffer.parts[:count])
+        buffer.joined += "".join(buffer.parts[buffer.joined_count : count])
+        buffer.joined_count = count
+        return buffer.joined
@@ -223,6 +223,35 @@ class PythonIntegrationMixin:
         """
         return self.python_integration.convert_python_to_renzmc(obj)
 
+    def _set_python_conversion_mode(self, mode):
+        """
+        Set how Python lists and dicts are converted to RenzmcLang.
+
+        Args:
+            mode: "eager" to copy containers, "lazy" for copy-on-write views
+
+        Returns:
+            The active conversion mode
+        """
+        self.python_integration.set_conversion_mode(mode)
+        return self.python_integration.conversion_mode
+
+    def _register_python_converter(self, py_type, converter):
+        """
+        Register a converter for values of a Python type.
+
+        Args:
+            py_type: The Python type, for example a class from impor_python
+            converter: Function receiving the Python value and returning the
+                value RenzmcLang code should see
+
+        Returns:
+            bool: True if successful
+        """
+        py_type = self.python_integration.convert_renzmc_to_python(py_type)
+        self.python_integration.register_converter(py_type, converter)
+        return True
+
     def _create_smart_wrapper(self, obj):
         """
         Create a smart wrapper for a Python object.
@@ -23,6 +23,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from renzmc.runtime.module_reloader import ModuleReloader
+
 
 class RenzmcModulesMixin:
     """
@@ -117,6 +119,52 @@ class RenzmcModulesMixin:
         except Exception as e:
             raise RuntimeError(f"Error memuat ulang modul RenzmcLang '{module_name}': {str(e)}")
 
+    def _get_module_reloader(self):
+        reloader = getattr(self.module_manager, "reloader", None)
+        if reloader is None:
+            reloader = ModuleReloader(self.module_manager)
+            self.module_manager.reloader = reloader
+        return reloader
+
+    def _watch_renzmc_modules(self, interval=1.0):
+        """
+        Start watching loaded RenzmcLang modules for changes.
+
+        Args:
+            interval: Polling interval in seconds
+
+        Returns:
+            bool: True if the watcher is running
+        """
+        reloader = self._get_module_reloader()
+        reloader.start(interval)
+        return reloader.running
+
+    def _stop_watching_renzmc_modules(self):
+        """
+        Stop watching RenzmcLang modules for changes.
+
+        Returns:
+            bool: True if successful
+        """
+        self._get_module_reloader().stop()
+        return True
+
+    def _reload_changed_renzmc_modules(self):
+        """
+        Hot reload every RenzmcLang module whose file changed.
+
+        Returns:
+            List of names of the reloaded modules
+
+        Raises:
+            RuntimeError: If reload fails
+        """
+        try:
+            return self._get_module_reloader().poll()
+        except Exception as e:
+            raise RuntimeError(f"Error memuat ulang modul RenzmcLang: {str(e)}")
+
     def _list_renzmc_modules(self):
         """
         List all available RenzmcLang modules.
@@ -341,7 +341,7 @@ class ExpressionParser:
             primary = String(token)
         elif token.type == TokenType.FORMAT_STRING:
             self.eat(TokenType.FORMAT_STRING)
-            parts = self.parse_format_string(token.value)
+            parts = self.parse_format_string(token.value, token)
             primary = FormatString(parts, token)
         elif token.type == TokenType.BOOLEAN:
             self.eat(TokenType.BOOLEAN)
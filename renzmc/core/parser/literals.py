@@ -24,8 +24,11 @@ SOFTWARE.
 """
 
 from renzmc.core.ast import (
+    AST,
     Dict,
     DictComp,
+    FormatString,
+    FormattedValue,
     List,
     ListComp,
     Set,
@@ -42,36 +45,71 @@ class LiteralParser:
     Literal parsing methods for data structures.
     """
 
-    def parse_format_string(self, text):
-        import re
-
+    def parse_format_string(self, text, token=None):
         parts = []
-        last_end = 0
-        pattern = "\\{([^{}]*)\\}"
-        for match in re.finditer(pattern, text):
-            if match.start() > last_end:
-                parts.append(String(Token(TokenType.TEKS, text[last_end : match.start()])))
-            expr_text = match.group(1)
-            if expr_text.strip():
-                try:
-                    from renzmc.core.parser import Parser
-
-                    expr_lexer = Lexer(expr_text)
-                    expr_parser = Parser(expr_lexer)
-                    expr_ast = expr_parser.expr()
-                    parts.append(expr_ast)
-                except (LexerError, ParserError) as e:
-                    from renzmc.utils.logging import logger
-
-                    logger.debug(f"F-string expression parsing failed: {e}")
-                    parts.append(String(Token(TokenType.TEKS, "{" + expr_text + "}")))
-            last_end = match.end()
-        if last_end < len(text):
-            parts.append(String(Token(TokenType.TEKS, text[last_end:])))
-        if not parts:
-            parts.append(String(Token(TokenType.TEKS, text)))
+        literal = []
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if char in "{}" and text[i + 1 : i + 2] == char:
+                literal.append(char)
+                i += 2
+                continue
+            end = _format_field_end(text, i + 1) if char == "{" else None
+            if end is None:
+                literal.append(char)
+                i += 1
+                continue
+            if literal:
+                parts.append(String(Token(TokenType.TEKS, "".join(literal))))
+                literal = []
+            field = self.parse_format_field(text[i + 1 : end], token)
+            if field is not None:
+                parts.append(field)
+            i = end + 1
+        if literal or not parts:
+            parts.append(String(Token(TokenType.TEKS, "".join(literal))))
         return parts
 
+    def parse_format_field(self, field, token=None):
+        expr_end = _format_field_split(field)
+        expr_text = field[:expr_end]
+        if not expr_text.strip():
+            return None
+        try:
+            from renzmc.core.parser import Parser
+
+            expr_parser = Parser(Lexer(expr_text))
+            expr_ast = expr_parser.expr()
+            if expr_parser.current_token.type != TokenType.EOF:
+                expr_parser.error(
+                    f"Token tidak terduga '{expr_parser.current_token.value}' di f-string"
+                )
+        except (LexerError, ParserError) as e:
+            from renzmc.utils.logging import logger
+
+            logger.debug(f"F-string expression parsing failed: {e}")
+            return String(Token(TokenType.TEKS, "{" + field + "}"))
+        if token is not None:
+            _relocate(expr_ast, token.line, token.column)
+        rest = field[expr_end:]
+        if not rest:
+            return expr_ast
+        conversion = None
+        if rest.startswith("!"):
+            conversion = rest[1:2]
+            rest = rest[2:]
+            if conversion not in ("r", "s", "a") or rest[:1] not in ("", ":"):
+                self.error(f"Konversi f-string tidak valid: '!{field[expr_end + 1:]}'")
+        format_spec = None
+        if rest:
+            spec = rest[1:]
+            if "{" in spec:
+                format_spec = FormatString(self.parse_format_string(spec, token), token)
+            else:
+                format_spec = spec
+        return FormattedValue(expr_ast, conversion, format_spec, token)
+
     def list_literal(self):
         token = self.current_token
         self.eat(TokenType.DAFTAR_AWAL)
@@ -214,3 +252,56 @@ class LiteralParser:
                 elements.append(self.expr())
         self.eat(TokenType.TUPLE_AKHIR)
         return Tuple(elements, token)
+
+
+def _format_field_end(text, start):
+    """Return the index of the ``}`` closing the f-string field at ``start``, or None."""
+    depth = 0
+    quote = None
+    for i in range(start, len(text)):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            if depth == 0:
+                return i if char == "}" else None
+            depth -= 1
+    return None
+
+
+def _format_field_split(field):
+    """Return where the expression of an f-string field ends and ``!conv``/``:spec`` begin."""
+    depth = 0
+    quote = None
+    for i, char in enumerate(field):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif depth == 0 and (char == ":" or char == "!" and field[i + 1 : i + 2] != "="):
+            return i
+    return len(field)
+
+
+def _relocate(node, line, column):
+    """Give the nodes of an f-string field the position of the f-string itself."""
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, AST):
+            if item.line is not None:
+                item.line = line
+                item.column = column
+            stack.extend(vars(item).values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
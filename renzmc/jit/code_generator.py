@@ -245,6 +245,8 @@ class CodeGenerator:
         args_str = ", ".join(args)
 
         func_name = node.name
+        if func_name is None and isinstance(node.func_expr, Var):
+            func_name = node.func_expr.name
 
         return f"{func_name}({args_str})"
 
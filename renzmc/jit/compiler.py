@@ -38,6 +38,14 @@ except ImportError:
     NUMBA_AVAILABLE = False
 
 
+def _has_integer_type(numba_types) -> bool:
+    return any(
+        isinstance(t, (numba.types.Integer, numba.types.Boolean))
+        or (isinstance(t, numba.types.BaseTuple) and _has_integer_type(t.types))
+        for t in numba_types
+    )
+
+
 class JITCompiler:
 
     def __init__(self):
@@ -47,16 +55,17 @@ class JITCompiler:
         self.compilation_stats: Dict[str, Dict[str, Any]] = {}
 
     def can_compile(self, name: str, params: List[str], body: List) -> bool:
-        if not NUMBA_AVAILABLE:
+        if not NUMBA_AVAILABLE and not self.is_recursive(name, body):
             return False
 
         is_numeric = self.type_inference.is_numeric_function(params, body)
 
         complexity = self.type_inference.analyze_function_complexity(body, name)
 
-        # Skip recursive functions for now - they cause issues with JIT compilation
+        # Recursive functions are worth compiling regardless of their size:
+        # every level of recursion saves a full interpreter call
         if complexity["has_recursion"]:
-            return False
+            return is_numeric
 
         should_compile = is_numeric and (
             complexity["has_loops"] or complexity["operation_count"] > 5
@@ -81,7 +90,12 @@ class JITCompiler:
                 self._record_compilation(name, success=False, reason="empty_code")
                 return None
 
-            compiled_func = self._compile_with_numba(name, python_code, params, interpreter_func)
+            if self.is_recursive(name, body):
+                compiled_func = self._compile_recursive(name, python_code)
+            else:
+                compiled_func = self._compile_with_numba(
+                    name, python_code, params, interpreter_func
+                )
 
             if compiled_func:
                 self.compiled_cache[name] = compiled_func
@@ -100,6 +114,97 @@ class JITCompiler:
             self._record_compilation(name, success=False, reason=error_detail)
             return None
 
+    def is_recursive(self, name: str, body: List) -> bool:
+        return self.type_inference.analyze_function_complexity(body, name)["has_recursion"]
+
+    def _compile_recursive(self, name: str, python_code: str) -> Optional[Callable]:
+        """
+        Compile a self-recursive function.
+
+        Numba can only type a recursive call when the callee is the dispatcher
+        itself and the argument types are known, so every distinct tuple of
+        argument types seen at call time is compiled eagerly as an explicit
+        signature. Numba integers are fixed-width and wrap silently on
+        overflow, so signatures involving integers are left to the generated
+        Python code as well, keeping RenzmcLang's arbitrary-precision results.
+        Calls numba cannot handle (or every call, when numba is not installed)
+        run the generated Python code, whose recursive calls are native Python
+        calls instead of interpreter round-trips.
+        """
+        python_func = self._exec_generated(name, python_code)
+        if python_func is None:
+            return None
+
+        dispatcher = None
+        if NUMBA_AVAILABLE:
+            numba_namespace = {}
+            numba_func = self._exec_generated(name, python_code, numba_namespace)
+            if numba_func is not None:
+                dispatcher = numba.njit(numba_func)
+                # The recursive call must resolve to the dispatcher, not to the
+                # plain Python function numba cannot type
+                numba_namespace[name] = dispatcher
+
+        signatures: Dict[tuple, bool] = {}
+
+        def recursive_wrapper(*args, **kwargs):
+            try:
+                if dispatcher is not None and not kwargs:
+                    key = tuple(type(arg) for arg in args)
+                    supported = signatures.get(key)
+                    if supported is None:
+                        try:
+                            signature = tuple(numba.typeof(arg) for arg in args)
+                            supported = not _has_integer_type(signature)
+                            if supported:
+                                dispatcher.compile(signature)
+                                return_type = dispatcher.overloads[signature].signature.return_type
+                                supported = not _has_integer_type((return_type,))
+                        except Exception:
+                            supported = False
+                        signatures[key] = supported
+                    if supported:
+                        try:
+                            return dispatcher(*args)
+                        except (TypeError, ValueError, OverflowError):
+                            pass
+                return python_func(*args, **kwargs)
+            except RecursionError as e:
+                raise RuntimeError(
+                    f"Kedalaman rekursi maksimum terlampaui dalam fungsi JIT '{name}'. "
+                    f"Periksa apakah fungsi memiliki kondisi berhenti yang benar."
+                ) from e
+
+        recursive_wrapper.__name__ = name
+        recursive_wrapper.__jit_compiled__ = True
+        recursive_wrapper.__jit_signatures__ = signatures
+
+        return recursive_wrapper
+
+    def _exec_generated(
+        self, name: str, python_code: str, namespace: Optional[Dict[str, Any]] = None
+    ) -> Optional[Callable]:
+        if namespace is None:
+            namespace = {}
+        namespace.update(
+            {
+                "range": range,
+                "int": int,
+                "float": float,
+                "abs": abs,
+                "min": min,
+                "max": max,
+                "sum": sum,
+                "len": len,
+                "pow": pow,
+            }
+        )
+        try:
+            exec(python_code, namespace)
+        except Exception:
+            return None
+        return namespace.get(name)
+
     def _compile_with_numba(
         self, name: str, python_code: str, params: List[str], fallback_func: Callable
     ) -> Optional[Callable]:
@@ -207,6 +312,11 @@ class JITCompiler:
         self.compiled_cache.clear()
         self.compilation_stats.clear()
 
+    def invalidate(self, name: str):
+        """Forget the compiled code of ``name`` so its next compilation sees the new body."""
+        self.compiled_cache.pop(name, None)
+        self.compilation_stats.pop(name, None)
+
     def force_compile(
         self, name: str, params: List[str], body: List, interpreter_func: Callable
     ) -> Optional[Callable]:
@@ -214,21 +324,23 @@ class JITCompiler:
             return self.compiled_cache[name]
 
         try:
-            # Check for recursion even in force compile
-            complexity = self.type_inference.analyze_function_complexity(body, name)
-            if complexity["has_recursion"]:
-                self._record_compilation(
-                    name, success=False, reason="recursive_function_not_supported"
-                )
-                return None
-
             python_code = self.code_generator.generate_function(name, params, body)
 
             if not python_code or python_code.strip() == "":
                 self._record_compilation(name, success=False, reason="empty_code")
                 return None
 
-            compiled_func = self._compile_with_numba(name, python_code, params, interpreter_func)
+            if self.is_recursive(name, body):
+                if not self.type_inference.is_numeric_function(params, body):
+                    self._record_compilation(
+                        name, success=False, reason="not_suitable", code=python_code
+                    )
+                    return None
+                compiled_func = self._compile_recursive(name, python_code)
+            else:
+                compiled_func = self._compile_with_numba(
+                    name, python_code, params, interpreter_func
+                )
 
             if compiled_func:
                 self.compiled_cache[name] = compiled_func
@@ -138,8 +138,8 @@ class TypeInferenceEngine:
             return True
 
         elif isinstance(stmt, Return):
-            if hasattr(stmt, "value") and stmt.value:
-                return_type = self.infer_type(stmt.value, context)
+            if stmt.expr:
+                return_type = self.infer_type(stmt.expr, context)
                 return return_type in self.numeric_types or return_type is None
             return True
 
@@ -192,6 +192,8 @@ class TypeInferenceEngine:
             if isinstance(node, (For, While, ForEach)):
                 analysis["has_loops"] = True
                 analysis["loop_depth"] = max(analysis["loop_depth"], depth + 1)
+                if isinstance(node, While):
+                    analyze_node(node.condition, depth)
 
                 body = node.body
                 for stmt in body:
@@ -227,6 +229,7 @@ class TypeInferenceEngine:
                 analyze_node(node.expr, depth)
 
             elif isinstance(node, If):
+                analyze_node(node.condition, depth)
                 for stmt in node.if_body:
                     analyze_node(stmt, depth)
                 if node.else_body:
@@ -234,8 +237,11 @@ class TypeInferenceEngine:
                         analyze_node(stmt, depth)
 
             elif isinstance(node, Return):
-                if hasattr(node, "value") and node.value:
-                    analyze_node(node.value, depth)
+                if node.expr:
+                    analyze_node(node.expr, depth)
+
+            elif isinstance(node, (VarDecl, Assign)):
+                analyze_node(node.value, depth)
 
         for stmt in body:
             analyze_node(stmt)
@@ -37,6 +37,8 @@ Classes:
 
 Functions:
 - Reading: read_text, read_lines, read_bytes, read_json, read_csv
+- Streaming CSV: stream_csv, read_csv_parallel, open_csv_writer (CSVWriter)
+- Memory-Mapped Files: map_file (MappedFile)
 - Writing: write_text, write_lines, write_bytes, write_json, write_csv
 - File Operations: copy, move, delete, exists, size, is_file, is_dir
 - Directory Operations: create_dir, remove_dir, list_dir, walk_dir
@@ -52,9 +54,20 @@ import shutil as py_shutil
 import os as py_os
 import json as py_json
 import csv as py_csv
+import io
+import mmap as py_mmap
+import re as py_re
+import stat as py_stat
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union, TextIO, BinaryIO
 
+from renzmc.utils.process_pool import process_pool
+
+# Upper bound on the bytes one worker parses at a time in read_csv_parallel
+_CSV_RANGE_SIZE = 16 * 1024 * 1024
+
 # File Reading Functions
 
 
@@ -153,6 +166,377 @@ def read_csv(file_path: str, delimiter: str = ",", encoding: str = "utf-8") -> L
         return list(reader)
 
 
+# Streaming CSV
+
+# Column types accepted by name in stream_csv / read_csv_parallel
+_CSV_TYPES = {
+    "int": "int",
+    "bulat": "int",
+    "float": "float",
+    "desimal": "float",
+    "str": "str",
+    "teks": "str",
+    "bool": "bool",
+    "boolean": "bool",
+}
+
+_TRUE_VALUES = frozenset(("1", "true", "benar", "ya", "yes"))
+
+
+def _to_int(value: str):
+    return int(value) if value != "" else None
+
+
+def _to_float(value: str):
+    return float(value) if value != "" else None
+
+
+def _to_bool(value: str):
+    return value.strip().lower() in _TRUE_VALUES if value != "" else None
+
+
+_CSV_CONVERTERS = {"int": _to_int, "float": _to_float, "str": str, "bool": _to_bool}
+_BUILTIN_TYPE_NAMES = {int: "int", float: "float", str: "str", bool: "bool"}
+
+
+def _resolve_converter(spec):
+    if spec is None:
+        return None
+    if isinstance(spec, str):
+        name = _CSV_TYPES.get(spec.lower())
+        if name is None:
+            raise ValueError(
+                f"Tipe kolom '{spec}' tidak dikenal, gunakan: {', '.join(sorted(_CSV_TYPES))}"
+            )
+        return _CSV_CONVERTERS[name]
+    if spec in _BUILTIN_TYPE_NAMES:
+        return _CSV_CONVERTERS[_BUILTIN_TYPE_NAMES[spec]]
+    if callable(spec):
+        return spec
+    raise ValueError(f"Tipe kolom harus berupa nama tipe atau fungsi, bukan '{spec!r}'")
+
+
+def _column_converters(types, header: Optional[List[str]]) -> Optional[List[Any]]:
+    """
+    Build the per-column converter list from a list or a ``{kolom: tipe}`` dict.
+    """
+    if not types:
+        return None
+    if isinstance(types, dict):
+        if header is None:
+            raise ValueError("Tipe kolom berdasarkan nama membutuhkan baris header")
+        unknown = [name for name in types if name not in header]
+        if unknown:
+            raise ValueError(f"Kolom tidak ditemukan di header: {', '.join(map(str, unknown))}")
+        return [_resolve_converter(types.get(name)) for name in header]
+    return [_resolve_converter(spec) for spec in types]
+
+
+def _convert_rows(rows: List[List[str]], converters: Optional[List[Any]]) -> List[List[Any]]:
+    """
+    Convert a batch of rows column by column.
+
+    Each converter is mapped over a whole column at once; ragged batches
+    fall back to converting row by row.
+    """
+    if not converters or not rows:
+        return rows
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        return [
+            [conv(value) if conv else value for conv, value in zip(converters, row)]
+            + row[len(converters) :]
+            for row in rows
+        ]
+    columns = list(zip(*rows))
+    for index, conv in enumerate(converters[:width]):
+        if conv is not None:
+            columns[index] = list(map(conv, columns[index]))
+    return [list(row) for row in zip(*columns)]
+
+
+def stream_csv(
+    file_path: str,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    header: bool = False,
+    as_dict: bool = False,
+    types=None,
+    batch_size: Optional[int] = None,
+):
+    """
+    Baca CSV file secara bertahap tanpa memuat seluruh file ke memori.
+
+    Args:
+        file_path: Path file CSV yang akan dibaca
+        delimiter: Delimiter (default: ',')
+        encoding: Encoding file (default: utf-8)
+        header: Baris pertama adalah header dan tidak ikut dihasilkan
+        as_dict: Hasilkan setiap row sebagai dict berdasarkan header
+            (otomatis memakai baris pertama sebagai header)
+        types: Tipe per kolom, berupa list (``['teks', 'bulat']``) atau dict
+            berdasarkan nama kolom (``{'umur': 'bulat'}``); nilai kosong
+            untuk bulat/desimal menjadi None
+        batch_size: Jika diisi, hasilkan list berisi sebanyak ini row sekaligus
+
+    Yields:
+        Row (list atau dict), atau batch row jika batch_size diisi
+
+    Example:
+        untuk setiap row dari stream_csv('data.csv', as_dict=benar, types={'umur': 'bulat'})
+            tampilkan row['nama'], row['umur']
+        selesai
+    """
+    chunk = batch_size or 1024
+    if chunk < 1:
+        raise ValueError("batch_size harus lebih besar dari 0")
+    with open(file_path, "r", encoding=encoding, newline="") as f:
+        reader = py_csv.reader(f, delimiter=delimiter)
+        fieldnames = None
+        if header or as_dict:
+            fieldnames = next(reader, None)
+            if fieldnames is None:
+                return
+        converters = _column_converters(types, fieldnames)
+        while True:
+            rows = list(islice(reader, chunk))
+            if not rows:
+                return
+            rows = _convert_rows(rows, converters)
+            if as_dict:
+                rows = [dict(zip(fieldnames, row)) for row in rows]
+            if batch_size:
+                yield rows
+            else:
+                yield from rows
+
+
+def _csv_range_offsets(file_path: str, start: int, parts: int) -> List[int]:
+    """
+    Split the bytes after ``start`` into ``parts`` ranges ending on line breaks.
+    """
+    total = py_os.path.getsize(file_path)
+    step = max(1, (total - start) // parts)
+    offsets = [start]
+    with open(file_path, "rb") as f:
+        for index in range(1, parts):
+            target = start + index * step
+            if target <= offsets[-1]:
+                continue
+            if target >= total:
+                break
+            f.seek(target - 1)
+            f.readline()
+            position = f.tell()
+            if position >= total:
+                break
+            if position > offsets[-1]:
+                offsets.append(position)
+    offsets.append(total)
+    return offsets
+
+
+def _parse_csv_range(file_path, start, end, delimiter, encoding, types):
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+    rows = list(py_csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+    return _convert_rows(rows, types and [_resolve_converter(spec) for spec in types])
+
+
+def read_csv_parallel(
+    file_path: str,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    header: bool = False,
+    as_dict: bool = False,
+    types=None,
+    workers: Optional[int] = None,
+    min_size: int = 8 * 1024 * 1024,
+):
+    """
+    Baca CSV file besar secara paralel dengan membagi file per rentang byte.
+
+    File dibagi pada batas baris, jadi field tidak boleh berisi baris baru
+    di dalam tanda kutip. File yang lebih kecil dari ``min_size`` atau mesin
+    dengan satu CPU dibaca secara berurutan.
+
+    Args:
+        file_path: Path file CSV yang akan dibaca
+        delimiter: Delimiter (default: ',')
+        encoding: Encoding file (default: utf-8)
+        header: Baris pertama adalah header dan tidak ikut dihasilkan
+        as_dict: Hasilkan setiap row sebagai dict berdasarkan header
+        types: Tipe per kolom (lihat stream_csv)
+        workers: Jumlah proses (default: jumlah CPU)
+        min_size: Ukuran minimum file (byte) untuk memakai proses paralel
+
+    Yields:
+        Batch row per rentang byte, berurutan sesuai posisi di file
+
+    Example:
+        untuk setiap batch dari read_csv_parallel('besar.csv', types=['teks', 'desimal'])
+            tampilkan panjang(batch)
+        selesai
+    """
+    workers = workers or py_os.cpu_count() or 1
+    fieldnames = None
+    start = 0
+    if header or as_dict:
+        with open(file_path, "rb") as f:
+            first_line = f.readline()
+            start = f.tell()
+        fieldnames = next(py_csv.reader([first_line.decode(encoding)], delimiter=delimiter), [])
+    converters = _column_converters(types, fieldnames)
+    if workers < 2 or py_os.path.getsize(file_path) - start < min_size:
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            text_stream = io.TextIOWrapper(f, encoding=encoding, newline="")
+            reader = py_csv.reader(text_stream, delimiter=delimiter)
+            while True:
+                rows = list(islice(reader, 65536))
+                if not rows:
+                    return
+                rows = _convert_rows(rows, converters)
+                yield [dict(zip(fieldnames, row)) for row in rows] if as_dict else rows
+
+    # Type names are sent to the workers; custom functions convert here
+    worker_types = None
+    if converters and all(conv in _CSV_CONVERTERS.values() or conv is None for conv in converters):
+        names = {conv: name for name, conv in _CSV_CONVERTERS.items()}
+        worker_types = [names.get(conv) for conv in converters]
+        converters = None
+    parts = max(workers * 4, (py_os.path.getsize(file_path) - start) // _CSV_RANGE_SIZE + 1)
+    offsets = _csv_range_offsets(file_path, start, parts)
+    ranges = zip(offsets, offsets[1:])
+    # Only a window of ranges is in flight, so memory stays bounded for any file size
+    with process_pool(workers, preload=(__name__,)) as executor:
+
+        def submit(byte_range):
+            begin, end = byte_range
+            return executor.submit(
+                _parse_csv_range, file_path, begin, end, delimiter, encoding, worker_types
+            )
+
+        pending = deque(map(submit, islice(ranges, workers * 2)))
+        while pending:
+            rows = pending.popleft().result()
+            pending.extend(map(submit, islice(ranges, 1)))
+            rows = _convert_rows(rows, converters)
+            yield [dict(zip(fieldnames, row)) for row in rows] if as_dict else rows
+
+
+class CSVWriter:
+    """
+    Penulis CSV dengan buffer yang menulis ke disk dalam potongan besar.
+
+    Row ditampung di memori dan baru ditulis saat buffer mencapai
+    ``buffer_size`` karakter, saat flush(), atau saat ditutup.
+
+    Example:
+        dengan open_csv_writer('output.csv', fieldnames=['nama', 'umur']) sebagai w:
+            w.write_row({'nama': 'Budi', 'umur': 25})
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        fieldnames: Optional[List[str]] = None,
+        buffer_size: int = 1024 * 1024,
+        append: bool = False,
+    ):
+        self.file_path = file_path
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.buffer_size = buffer_size
+        self.rows_written = 0
+        self._file = open(file_path, "a" if append else "w", encoding=encoding, newline="")
+        self._buffer = io.StringIO()
+        self._writer = py_csv.writer(self._buffer, delimiter=delimiter)
+        if self.fieldnames and not (append and self._file.tell()):
+            self._writer.writerow(self.fieldnames)
+
+    def _as_list(self, row):
+        if isinstance(row, dict):
+            if self.fieldnames is None:
+                raise ValueError("Row dict membutuhkan fieldnames pada CSVWriter")
+            return [row.get(name, "") for name in self.fieldnames]
+        return row
+
+    def write_row(self, row):
+        """Tulis satu row (list atau dict)."""
+        self._writer.writerow(self._as_list(row))
+        self.rows_written += 1
+        if self._buffer.tell() >= self.buffer_size:
+            self.flush()
+
+    def write_rows(self, rows):
+        """Tulis banyak row sekaligus."""
+        rows = iter(rows) if self.fieldnames is None else map(self._as_list, rows)
+        for batch in iter(lambda: list(islice(rows, 4096)), []):
+            self._writer.writerows(batch)
+            self.rows_written += len(batch)
+            if self._buffer.tell() >= self.buffer_size:
+                self.flush()
+
+    def flush(self):
+        """Tulis isi buffer ke file."""
+        data = self._buffer.getvalue()
+        if data:
+            self._file.write(data)
+            self._buffer.seek(0)
+            self._buffer.truncate()
+        self._file.flush()
+
+    def close(self):
+        """Flush buffer dan tutup file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def open_csv_writer(
+    file_path: str,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    fieldnames: Optional[List[str]] = None,
+    buffer_size: int = 1024 * 1024,
+    append: bool = False,
+) -> CSVWriter:
+    """
+    Buka CSVWriter dengan buffer untuk menulis banyak row.
+
+    Args:
+        file_path: Path file CSV yang akan ditulis
+        delimiter: Delimiter (default: ',')
+        encoding: Encoding file (default: utf-8)
+        fieldnames: Nama kolom; ditulis sebagai header dan dipakai untuk row dict
+        buffer_size: Ukuran buffer dalam karakter sebelum ditulis ke disk
+        append: Tambahkan ke akhir file alih-alih menimpa
+
+    Returns:
+        CSVWriter object
+
+    Example:
+        w = open_csv_writer('output.csv')
+        w.write_rows(rows)
+        w.close()
+    """
+    return CSVWriter(file_path, delimiter, encoding, fieldnames, buffer_size, append)
+
+
 # File Writing Functions
 
 
@@ -403,6 +787,200 @@ def walk_dir(dir_path: str):
         yield (dirpath, dirnames, filenames)
 
 
+# Memory-Mapped Files
+
+
+class MappedFile:
+    """
+    File read-only yang dipetakan ke memori dengan mmap.
+
+    Isi file tidak disalin ke memori Python: slice menghasilkan memoryview
+    tanpa salinan, iterasi baris berjalan langsung di atas pemetaan, dan
+    pencarian regex (method ``cari`` atau library ``re``) memindai byte yang
+    dipetakan. Pipe, device, dan file kosong yang tidak dapat dipetakan
+    dibaca sekali ke memori dengan API yang sama.
+
+    Example:
+        dengan map_file('server.log') sebagai f:
+            untuk setiap baris dari f.lines()
+                jika 'ERROR' dalam baris
+                    tampilkan baris
+                selesai
+            selesai
+    """
+
+    def __init__(self, file_path: str, encoding: str = "utf-8"):
+        self.file_path = file_path
+        self.encoding = encoding
+        self._mmap = None
+        with open(file_path, "rb") as f:
+            info = py_os.fstat(f.fileno())
+            if py_stat.S_ISREG(info.st_mode) and info.st_size > 0:
+                try:
+                    self._mmap = py_mmap.mmap(f.fileno(), 0, access=py_mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    self._mmap = None
+            if self._mmap is None:
+                self._data = f.read()
+            else:
+                self._data = self._mmap
+                if hasattr(self._mmap, "madvise") and hasattr(py_mmap, "MADV_SEQUENTIAL"):
+                    self._mmap.madvise(py_mmap.MADV_SEQUENTIAL)
+        self._view = memoryview(self._data)
+
+    @property
+    def is_mapped(self) -> bool:
+        """True jika file benar-benar dipetakan (bukan dibaca ke memori)."""
+        return self._mmap is not None
+
+    @property
+    def closed(self) -> bool:
+        return self._view is None
+
+    def _check_open(self):
+        if self._view is None:
+            raise ValueError(f"File '{self.file_path}' sudah ditutup")
+
+    def __len__(self) -> int:
+        self._check_open()
+        return len(self._view)
+
+    def __getitem__(self, index):
+        self._check_open()
+        return self._view[index]
+
+    def buffer(self):
+        """Objek buffer (mmap atau bytes) untuk dipakai langsung oleh library Python."""
+        self._check_open()
+        return self._data
+
+    def read_bytes(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        """Salin rentang byte menjadi bytes."""
+        self._check_open()
+        return bytes(self._view[start:end])
+
+    def read_text(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Decode rentang byte menjadi teks."""
+        self._check_open()
+        return str(self._view[start:end], self.encoding)
+
+    def find(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        """Posisi pertama ``sub`` (teks atau bytes), atau -1 jika tidak ada."""
+        self._check_open()
+        if isinstance(sub, str):
+            sub = sub.encode(self.encoding)
+        return self._data.find(sub, start, len(self._data) if end is None else end)
+
+    def lines(self, as_bytes: bool = False, keep_ends: bool = False):
+        """
+        Iterasi baris di atas pemetaan tanpa membaca seluruh file.
+
+        Args:
+            as_bytes: Hasilkan memoryview tiap baris alih-alih teks
+            keep_ends: Sertakan karakter baris baru di akhir baris
+
+        Yields:
+            Baris sebagai teks (atau memoryview jika as_bytes)
+        """
+        self._check_open()
+        data, view, encoding = self._data, self._view, self.encoding
+        position, size = 0, len(data)
+        while position < size:
+            newline = data.find(b"\n", position)
+            end = size if newline < 0 else newline + 1
+            stop = end if keep_ends or newline < 0 else newline
+            line = view[position:stop]
+            yield line if as_bytes else str(line, encoding)
+            position = end
+
+    def __iter__(self):
+        return self.lines()
+
+    def _pattern(self, pattern, flags: int = 0):
+        if isinstance(pattern, py_re.Pattern):
+            if isinstance(pattern.pattern, bytes):
+                return pattern
+            flags, pattern = pattern.flags & ~py_re.UNICODE, pattern.pattern
+        if isinstance(pattern, str):
+            pattern = pattern.encode(self.encoding)
+        return py_re.compile(pattern, flags)
+
+    def search(self, pattern, flags: int = 0, start: int = 0):
+        """Cari regex langsung di byte yang dipetakan; hasilkan Match atau None."""
+        self._check_open()
+        return self._pattern(pattern, flags).search(self._data, start)
+
+    def finditer(self, pattern, flags: int = 0):
+        """Iterator semua Match regex di byte yang dipetakan."""
+        self._check_open()
+        return self._pattern(pattern, flags).finditer(self._data)
+
+    def count(self, pattern, flags: int = 0) -> int:
+        """Hitung jumlah kecocokan regex."""
+        return sum(1 for _ in self.finditer(pattern, flags))
+
+    def close(self):
+        """
+        Lepaskan pemetaan.
+
+        Raises:
+            BufferError: Jika masih ada memoryview hasil slice yang dipakai
+        """
+        if self._view is None:
+            return
+        self._view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                self._view = memoryview(self._data)
+                raise BufferError(
+                    f"File '{self.file_path}' tidak dapat ditutup: "
+                    "masih ada slice memoryview yang dipakai, lepaskan dengan release()"
+                )
+        self._view = None
+        self._data = None
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __repr__(self):
+        state = "ditutup" if self.closed else ("mmap" if self.is_mapped else "memori")
+        return f"<MappedFile '{self.file_path}' ({state})>"
+
+    # Indonesian aliases
+    baris = lines
+    cari = search
+    cari_semua = finditer
+    hitung = count
+    tutup = close
+
+
+def map_file(file_path: str, encoding: str = "utf-8") -> MappedFile:
+    """
+    Petakan file ke memori untuk akses read-only tanpa membaca seluruh isinya.
+
+    Args:
+        file_path: Path file yang akan dipetakan
+        encoding: Encoding untuk teks dan pattern regex (default: utf-8)
+
+    Returns:
+        MappedFile object
+
+    Example:
+        f = map_file('access.log')
+        tampilkan f.count('HTTP/1.1" 500')
+        kepala = f[0:100]  # memoryview tanpa salinan
+        f.close()
+    """
+    return MappedFile(file_path, encoding)
+
+
 # File Context Managers
 
 
@@ -550,6 +1128,10 @@ tulis_baris = write_lines
 tulis_bytes = write_bytes
 tulis_json = write_json
 tulis_csv = write_csv
+baca_csv_bertahap = stream_csv
+baca_csv_paralel = read_csv_parallel
+buka_penulis_csv = open_csv_writer
+petakan_file = map_file
 salin = copy
 pindahkan = move
 hapus = delete
@@ -577,6 +1159,11 @@ __all__ = [
     "read_bytes",
     "read_json",
     "read_csv",
+    # Streaming CSV
+    "stream_csv",
+    "read_csv_parallel",
+    "CSVWriter",
+    "open_csv_writer",
     # Writing Functions
     "write_text",
     "write_lines",
@@ -596,6 +1183,9 @@ __all__ = [
     "remove_dir",
     "list_dir",
     "walk_dir",
+    # Memory-Mapped Files
+    "MappedFile",
+    "map_file",
     # Context Managers
     "open_text",
     "open_binary",
@@ -617,6 +1207,10 @@ __all__ = [
     "tulis_bytes",
     "tulis_json",
     "tulis_csv",
+    "baca_csv_bertahap",
+    "baca_csv_paralel",
+    "buka_penulis_csv",
+    "petakan_file",
     "salin",
     "pindahkan",
     "hapus",
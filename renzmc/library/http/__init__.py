@@ -37,6 +37,7 @@ Functions:
 - patch: HTTP PATCH request
 - head: HTTP HEAD request
 - options: HTTP OPTIONS request
+- fetch_many: Banyak request bersamaan dengan batas per host dan retry
 
 Classes:
 - Response: HTTP response object
@@ -52,16 +53,47 @@ Usage:
     post_response = post('https://api.example.com/users', json={'name': 'Budi'})
 """
 
+import http.client
+import random
+import threading
+import time
 import urllib.parse
 import urllib.request
 import urllib.error
 import json as py_json
 import ssl
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Dict, Any, Optional, Union, Tuple
 
 # Global settings
 DEFAULT_TIMEOUT = 30
 DEFAULT_HEADERS = {"User-Agent": "RenzMcLang-HTTP/1.0"}
+DEFAULT_POOL_SIZE = 10
+MAX_REDIRECTS = 10
+
+_ssl_contexts: Dict[bool, ssl.SSLContext] = {}
+_ssl_lock = threading.Lock()
+
+
+def _ssl_context(verify: bool = False) -> ssl.SSLContext:
+    """
+    Shared SSL context; building one per request costs more than the request.
+
+    Without ``verify`` certificates are not checked, as the library has
+    always done for compatibility.
+    """
+    context = _ssl_contexts.get(verify)
+    if context is None:
+        with _ssl_lock:
+            context = _ssl_contexts.get(verify)
+            if context is None:
+                context = ssl.create_default_context()
+                if not verify:
+                    context.check_hostname = False
+                    context.verify_mode = ssl.CERT_NONE
+                _ssl_contexts[verify] = context
+    return context
 
 
 class HTTPResponse:
@@ -69,12 +101,20 @@ class HTTPResponse:
     HTTP Response object yang menyimpan hasil dari request.
     """
 
-    def __init__(self, response: urllib.request.addinfourl, content: bytes = None):
+    def __init__(
+        self,
+        response: urllib.request.addinfourl,
+        content: bytes = None,
+        url: str = None,
+        release=None,
+    ):
         self._response = response
         self._content = content
-        self._url = response.geturl()
-        self._status_code = response.getcode()
+        self._url = url or response.geturl()
+        self._status_code = getattr(response, "status", None) or response.getcode()
         self._headers = dict(response.headers)
+        # Called with True once a streamed body was fully read, False otherwise
+        self._release = release
 
     @property
     def url(self) -> str:
@@ -94,9 +134,7 @@ class HTTPResponse:
     @property
     def text(self) -> str:
         """Response body sebagai string."""
-        if self._content is not None:
-            return self._content.decode("utf-8")
-        return self._response.read().decode("utf-8")
+        return self.content().decode("utf-8")
 
     def json(self) -> Dict[str, Any]:
         """Parse response body sebagai JSON."""
@@ -104,9 +142,56 @@ class HTTPResponse:
 
     def content(self) -> bytes:
         """Response body sebagai bytes."""
+        if self._content is None:
+            self._content = self._response.read()
+            self._finish(True)
+        return self._content
+
+    def iter_content(self, chunk_size: int = 65536):
+        """
+        Baca body response per potongan tanpa memuat seluruhnya.
+
+        Untuk request dengan ``stream=True``; koneksi dikembalikan ke pool
+        setelah body habis dibaca.
+
+        Example:
+            untuk setiap potongan dari respon.iter_content(8192)
+                f.write(potongan)
+            selesai
+        """
         if self._content is not None:
-            return self._content
-        return self._response.read()
+            for start in range(0, len(self._content), chunk_size):
+                yield self._content[start : start + chunk_size]
+            return
+        try:
+            while True:
+                chunk = self._response.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except BaseException:
+            self._finish(False)
+            raise
+        self._finish(True)
+
+    def close(self):
+        """Tutup response yang belum dibaca habis."""
+        if self._release is not None:
+            self._finish(False)
+        else:
+            self._response.close()
+
+    def _finish(self, complete: bool):
+        release, self._release = self._release, None
+        if release is not None:
+            release(complete)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
 
     def ok(self) -> bool:
         """Cek apakah request berhasil (status code 200-299)."""
@@ -127,21 +212,204 @@ class HTTPError(Exception):
         super().__init__(message)
         self.status_code = status_code
 
+    def ok(self) -> bool:
+        """Selalu salah; memudahkan pengecekan hasil fetch_many."""
+        return False
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections to one scheme://host:port."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], maxsize: int, context):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.context = context
+        self._idle = deque()
+        self._lock = threading.Lock()
+
+    def get(self, timeout) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)``."""
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+        if self.scheme == "https":
+            connection = http.client.HTTPSConnection(
+                self.host, self.port, timeout=timeout, context=self.context
+            )
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        return connection, False
+
+    def put(self, connection: http.client.HTTPConnection):
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, deque()
+        for connection in idle:
+            connection.close()
+
 
 class HTTPSession:
     """
     HTTP Session untuk connection pooling dan persistent connections.
+
+    Koneksi keep-alive disimpan per host (maksimal ``pool_size`` koneksi
+    menganggur per host) dan dipakai ulang antar request, dengan satu SSL
+    context untuk semua koneksi HTTPS. Jika proxy diatur lewat environment,
+    request dikirim lewat urllib seperti fungsi modul.
+
+    Example:
+        dengan HTTPSession(pool_size=4) sebagai sesi:
+            untuk i dari 1 sampai 100
+                data = sesi.get('https://api.example.com/status').json()
+            selesai
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Optional[float] = None,
+        verify: bool = False,
+        max_redirects: int = MAX_REDIRECTS,
+    ):
         self.headers = DEFAULT_HEADERS.copy()
-        self.timeout = DEFAULT_TIMEOUT
-
-    def request(self, method: str, url: str, **kwargs) -> HTTPResponse:
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        self.pool_size = pool_size
+        self.verify = verify
+        self.max_redirects = max_redirects
+        self.stats = {"requests": 0, "connections_created": 0, "connections_reused": 0}
+        self._pools: Dict[Tuple[str, str, Optional[int]], _ConnectionPool] = {}
+        self._lock = threading.Lock()
+        self._proxies = urllib.request.getproxies()
+
+    def _pool(self, scheme: str, host: str, port: Optional[int]) -> _ConnectionPool:
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    context = _ssl_context(self.verify) if scheme == "https" else None
+                    pool = _ConnectionPool(scheme, host, port, self.pool_size, context)
+                    self._pools[key] = pool
+        return pool
+
+    def _count(self, key: str):
+        # fetch_many shares one session between threads; += on a dict item is not atomic
+        with self._lock:
+            self.stats[key] += 1
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any] = None,
+        data: Union[str, bytes, Dict] = None,
+        json: Dict[str, Any] = None,
+        headers: Dict[str, str] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+    ) -> HTTPResponse:
         """
         Perform HTTP request dengan method tertentu.
+
+        Args:
+            method: HTTP method
+            url: URL untuk request
+            params: Query parameters
+            data: Body (form dict, string, atau bytes)
+            json: JSON body
+            headers: Header tambahan untuk request ini
+            timeout: Timeout dalam detik (default: timeout sesi)
+            allow_redirects: Ikuti redirect
+            stream: Jangan baca body sekarang; gunakan iter_content()
+
+        Returns:
+            HTTPResponse object
         """
-        return _make_request(method, url, headers=self.headers, timeout=self.timeout, **kwargs)
+        timeout = self.timeout if timeout is None else timeout
+        url, body, request_headers = _prepare_request(
+            url, params, data, json, {**self.headers, **(headers or {})}
+        )
+        self._count("requests")
+        for _ in range(self.max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                raise HTTPError(f"Skema URL tidak didukung: {url}")
+            if parts.scheme in self._proxies and not urllib.request.proxy_bypass(parts.hostname):
+                return _make_request(
+                    method,
+                    url,
+                    data=body,
+                    headers=request_headers,
+                    timeout=timeout,
+                    allow_redirects=allow_redirects,
+                )
+            response = self._send(method, parts, body, request_headers, timeout, stream)
+            location = response.headers.get("Location") or response.headers.get("location")
+            if not (allow_redirects and response.status_code in (301, 302, 303, 307, 308)):
+                return response
+            if not location:
+                return response
+            response.close()
+            url = urllib.parse.urljoin(url, location)
+            if response.status_code in (301, 302, 303) and method != "HEAD":
+                method, body = "GET", None
+                request_headers = {
+                    k: v for k, v in request_headers.items() if k.lower() != "content-type"
+                }
+        raise HTTPError(f"Terlalu banyak redirect (lebih dari {self.max_redirects})")
+
+    def _send(self, method, parts, body, headers, timeout, stream) -> HTTPResponse:
+        pool = self._pool(parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        url = urllib.parse.urlunsplit(parts)
+        while True:
+            connection, reused = pool.get(timeout)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine):
+                connection.close()
+                # The server dropped an idle keep-alive connection; retry on a new one
+                if reused:
+                    continue
+                raise HTTPError(f"Koneksi ke {parts.hostname} terputus")
+            except Exception as e:
+                connection.close()
+                raise HTTPError(str(e))
+        self._count("connections_reused" if reused else "connections_created")
+
+        def release(complete: bool):
+            if complete and not response.will_close:
+                pool.put(connection)
+            else:
+                connection.close()
+
+        if stream and method != "HEAD":
+            return HTTPResponse(response, url=url, release=release)
+        try:
+            content = response.read()
+        except Exception as e:
+            connection.close()
+            raise HTTPError(str(e))
+        release(True)
+        return HTTPResponse(response, content, url=url)
 
     def get(self, url: str, **kwargs) -> HTTPResponse:
         """HTTP GET request."""
@@ -163,19 +431,34 @@ class HTTPSession:
         """HTTP PATCH request."""
         return self.request("PATCH", url, **kwargs)
 
+    def head(self, url: str, **kwargs) -> HTTPResponse:
+        """HTTP HEAD request."""
+        return self.request("HEAD", url, **kwargs)
 
-def _make_request(
-    method: str,
+    def close(self):
+        """Tutup semua koneksi yang sedang menganggur."""
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def _prepare_request(
     url: str,
     params: Dict[str, Any] = None,
     data: Union[str, bytes, Dict] = None,
     json: Dict[str, Any] = None,
     headers: Dict[str, str] = None,
-    timeout: int = DEFAULT_TIMEOUT,
-    allow_redirects: bool = True,
-) -> HTTPResponse:
+) -> Tuple[str, Optional[bytes], Dict[str, str]]:
     """
-    Internal function untuk membuat HTTP request.
+    Build the final URL, encoded body and headers for a request.
     """
     if headers is None:
         headers = DEFAULT_HEADERS.copy()
@@ -199,15 +482,30 @@ def _make_request(
         headers["Content-Type"] = "application/x-www-form-urlencoded"
     elif isinstance(data, str):
         data = data.encode("utf-8")
+    return url, data, headers
+
+
+def _make_request(
+    method: str,
+    url: str,
+    params: Dict[str, Any] = None,
+    data: Union[str, bytes, Dict] = None,
+    json: Dict[str, Any] = None,
+    headers: Dict[str, str] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    allow_redirects: bool = True,
+) -> HTTPResponse:
+    """
+    Internal function untuk membuat HTTP request.
+    """
+    url, data, headers = _prepare_request(url, params, data, json, headers)
 
     # Create request
     req = urllib.request.Request(url, data=data, headers=headers, method=method)
 
     try:
-        # Create SSL context yang tidak verify certificates (untuk compatibility)
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+        # SSL context yang tidak verify certificates (untuk compatibility)
+        ssl_context = _ssl_context()
 
         with urllib.request.urlopen(req, timeout=timeout, context=ssl_context) as response:
             content = response.read()
@@ -340,6 +638,204 @@ def options(
     return _make_request("OPTIONS", url, headers=headers, timeout=timeout, **kwargs)
 
 
+# Concurrent Requests
+
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Only idempotent methods are retried by default: a POST/PATCH that timed out may
+# already have been processed by the server, and repeating it duplicates the write
+RETRY_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+
+def _request_spec(item, method: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    if isinstance(item, str):
+        return {"method": method, "url": item, **kwargs}
+    if isinstance(item, dict) and "url" in item:
+        return {"method": method, **kwargs, **item}
+    raise ValueError(f"Request harus berupa URL atau dict dengan kunci 'url', bukan {item!r}")
+
+
+class _HostLimiter:
+    """Caps simultaneous requests per host."""
+
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str):
+        if not self.limit:
+            return _NO_LIMIT
+        host = urllib.parse.urlsplit(url).netloc
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            with self._lock:
+                semaphore = self._semaphores.setdefault(
+                    host, threading.BoundedSemaphore(self.limit)
+                )
+        return semaphore
+
+
+class _NoLimit:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NO_LIMIT = _NoLimit()
+
+
+def _fetch_one(session, spec, host_limiter, retries, backoff, retry_statuses, retry_methods):
+    spec = dict(spec)
+    method = spec.pop("method").upper()
+    url = spec.pop("url")
+    if method not in retry_methods:
+        retries = 0
+    attempt = 0
+    while True:
+        try:
+            with host_limiter(url):
+                response = session.request(method, url, **spec)
+        except HTTPError as e:
+            if attempt >= retries:
+                return e
+        else:
+            if response.status_code not in retry_statuses or attempt >= retries:
+                return response
+        # Exponential backoff with jitter so retries from many threads spread out
+        time.sleep(backoff * (2**attempt) * (0.5 + random.random()))
+        attempt += 1
+
+
+def fetch_many(
+    requests,
+    concurrency: int = 32,
+    per_host: Optional[int] = 8,
+    timeout: Optional[float] = None,
+    retries: int = 2,
+    backoff: float = 0.5,
+    ordered: bool = True,
+    method: str = "GET",
+    session: Optional[HTTPSession] = None,
+    retry_statuses=RETRY_STATUSES,
+    retry_methods=RETRY_METHODS,
+    **kwargs,
+):
+    """
+    Jalankan banyak HTTP request secara bersamaan.
+
+    Request dijalankan oleh thread pool di atas satu HTTPSession, sehingga
+    koneksi keep-alive dipakai ulang per host. Request yang gagal karena
+    koneksi atau status di ``retry_statuses`` diulang dengan backoff
+    eksponensial. Kegagalan akhir tidak menghentikan batch: hasilnya berupa
+    objek HTTPError di posisi request tersebut.
+
+    Secara default hanya method idempoten (GET, HEAD, OPTIONS, PUT, DELETE)
+    yang diulang. POST/PATCH yang timeout bisa saja sudah diproses server,
+    sehingga mengulangnya dapat menggandakan data; sertakan method tersebut
+    di ``retry_methods`` hanya jika server aman menerima request ganda.
+
+    Args:
+        requests: List URL, atau dict berisi 'url' dan opsional 'method',
+            'params', 'data', 'json', 'headers', 'timeout'
+        concurrency: Jumlah request yang berjalan bersamaan
+        per_host: Batas request bersamaan ke satu host (None: tanpa batas)
+        timeout: Timeout per request dalam detik
+        retries: Jumlah pengulangan maksimal per request
+        backoff: Jeda dasar pengulangan dalam detik (dikali dua tiap percobaan)
+        ordered: True untuk list hasil sesuai urutan input; False untuk
+            generator (indeks, hasil) sesuai urutan selesai
+        method: HTTP method default
+        session: HTTPSession yang dipakai (default: sesi baru untuk batch ini)
+        retry_statuses: Status code yang diulang
+        retry_methods: HTTP method yang boleh diulang (default: RETRY_METHODS)
+        **kwargs: Argumen default untuk setiap request (headers, params, ...)
+
+    Returns:
+        List HTTPResponse/HTTPError, atau generator (indeks, hasil)
+
+    Example:
+        hasil = ambil_banyak(daftar_url, concurrency=32)
+        untuk setiap r dari hasil
+            jika r.ok()
+                proses(r.json())
+            selesai
+        selesai
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency harus lebih besar dari 0")
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    specs = (_request_spec(item, method, kwargs) for item in requests)
+    results = _run_concurrent(
+        specs,
+        concurrency,
+        per_host,
+        retries,
+        backoff,
+        frozenset(retry_statuses),
+        frozenset(m.upper() for m in retry_methods),
+        session,
+    )
+    if not ordered:
+        return results
+    collected = {}
+    for index, result in results:
+        collected[index] = result
+    return [collected[index] for index in range(len(collected))]
+
+
+def _run_concurrent(
+    specs, concurrency, per_host, retries, backoff, retry_statuses, retry_methods, session
+):
+    own_session = session is None
+    if own_session:
+        session = HTTPSession(pool_size=per_host or concurrency)
+    host_limiter = _HostLimiter(per_host)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = {}
+    try:
+        # Keep a bounded window of submitted work so huge inputs stay lazy
+        window = concurrency * 4
+        specs = enumerate(specs)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                item = next(specs, None)
+                if item is None:
+                    exhausted = True
+                    break
+                index, spec = item
+                future = executor.submit(
+                    _fetch_one,
+                    session,
+                    spec,
+                    host_limiter,
+                    retries,
+                    backoff,
+                    retry_statuses,
+                    retry_methods,
+                )
+                pending[future] = index
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = HTTPError(str(e))
+                yield index, result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if own_session:
+            session.close()
+
+
 # Utility Functions
 
 
@@ -368,14 +864,21 @@ def set_default_timeout(timeout: int):
     DEFAULT_TIMEOUT = timeout
 
 
-def create_session() -> HTTPSession:
+def create_session(
+    pool_size: int = DEFAULT_POOL_SIZE, timeout: Optional[float] = None, verify: bool = False
+) -> HTTPSession:
     """
     Create HTTP session object.
 
+    Args:
+        pool_size: Jumlah maksimal koneksi keep-alive menganggur per host
+        timeout: Timeout default dalam detik
+        verify: Verifikasi sertifikat SSL
+
     Returns:
         HTTPSession object
     """
-    return HTTPSession()
+    return HTTPSession(pool_size=pool_size, timeout=timeout, verify=verify)
 
 
 # Indonesian Aliases
@@ -392,6 +895,7 @@ error_http = HTTPError
 atur_header_default = set_default_header
 atur_timeout_default = set_default_timeout
 buat_sesi = create_session
+ambil_banyak = fetch_many
 
 __all__ = [
     # Classes
@@ -406,6 +910,7 @@ __all__ = [
     "patch",
     "head",
     "options",
+    "fetch_many",
     # Utility Functions
     "set_default_header",
     "set_default_timeout",
@@ -424,4 +929,5 @@ __all__ = [
     "atur_header_default",
     "atur_timeout_default",
     "buat_sesi",
+    "ambil_banyak",
 ]
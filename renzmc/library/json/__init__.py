@@ -34,10 +34,14 @@ Functions:
 - dumps: Convert Python object menjadi JSON string
 - load: Parse JSON dari file object
 - dump: Write JSON ke file object
+- read_ndjson / write_ndjson: Baca dan tulis NDJSON (satu JSON per baris) secara bertahap
+- iter_array: Iterasi elemen array JSON tingkat atas tanpa memuat seluruh dokumen
+- set_backend / get_backend: Pilih backend parsing (ujson, orjson, atau json bawaan)
 
 Classes:
 - JSONDecoder: Custom decoder untuk parsing JSON
 - JSONEncoder: Custom encoder untuk serialisasi JSON
+- NDJSONWriter: Penulis NDJSON dengan buffer
 
 Usage:
     dari json impor loads, dumps
@@ -54,6 +58,118 @@ from typing import Any, Dict, List, Union, Optional
 JSONType = Union[Dict[str, Any], List[Any], str, int, float, bool, None]
 
 
+# Backend Selection
+
+try:
+    import ujson as _ujson
+except ImportError:
+    _ujson = None
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Backends accepted by set_backend()
+BACKENDS = ("ujson", "orjson", "json")
+# Picked automatically in this order. ujson is left out because it accepts input
+# the stdlib rejects (leading zeros, raw control characters in strings); orjson
+# rejects everything the stdlib does, and rejected input falls back to the stdlib
+DEFAULT_BACKENDS = ("orjson", "json")
+
+
+def _ujson_dumps(obj, ensure_ascii, sort_keys):
+    return _ujson.dumps(
+        obj, ensure_ascii=ensure_ascii, sort_keys=sort_keys, escape_forward_slashes=False
+    )
+
+
+def _orjson_dumps(obj, ensure_ascii, sort_keys):
+    if ensure_ascii:
+        return None
+    option = _orjson.OPT_NON_STR_KEYS | (_orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return _orjson.dumps(obj, option=option).decode("utf-8")
+
+
+def _stdlib_dumps(obj, ensure_ascii, sort_keys):
+    return py_json.dumps(obj, ensure_ascii=ensure_ascii, sort_keys=sort_keys, separators=(",", ":"))
+
+
+# (loads, compact dumps) per backend, None when not installed
+_BACKEND_FUNCTIONS = {
+    "ujson": _ujson and (_ujson.loads, _ujson_dumps),
+    "orjson": _orjson and (_orjson.loads, _orjson_dumps),
+    "json": (py_json.loads, _stdlib_dumps),
+}
+
+_backend_name = "json"
+_backend_loads = py_json.loads
+_backend_dumps = _stdlib_dumps
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Pilih backend untuk parsing dan serialisasi JSON.
+
+    Tanpa argumen, backend tercepat yang terpasang dipilih sesuai urutan
+    ``DEFAULT_BACKENDS``. orjson lebih cepat tetapi membaca integer di atas
+    64 bit sebagai float dan menulis NaN sebagai null. ujson hanya dipakai
+    jika dipilih eksplisit karena menerima JSON yang ditolak modul bawaan
+    (misalnya ``01`` atau tab mentah di dalam string).
+
+    Args:
+        name: "ujson", "orjson", atau "json" (bawaan Python)
+
+    Returns:
+        Nama backend yang aktif
+
+    Raises:
+        ValueError: Jika backend tidak dikenal atau tidak terpasang
+    """
+    global _backend_name, _backend_loads, _backend_dumps
+    if name is None:
+        name = next(n for n in DEFAULT_BACKENDS if _BACKEND_FUNCTIONS[n])
+    if name == "stdlib":
+        name = "json"
+    if name not in _BACKEND_FUNCTIONS:
+        raise ValueError(f"Backend JSON '{name}' tidak dikenal, gunakan: {', '.join(BACKENDS)}")
+    if not _BACKEND_FUNCTIONS[name]:
+        raise ValueError(f"Backend JSON '{name}' tidak terpasang")
+    _backend_name = name
+    _backend_loads, _backend_dumps = _BACKEND_FUNCTIONS[name]
+    return name
+
+
+def get_backend() -> str:
+    """Nama backend JSON yang sedang aktif."""
+    return _backend_name
+
+
+def _fast_loads(s):
+    try:
+        return _backend_loads(s)
+    except (ValueError, TypeError, OverflowError):
+        if _backend_loads is py_json.loads:
+            raise
+        # Input the backend rejects (NaN, huge numbers, invalid JSON) gets the
+        # stdlib's result or its JSONDecodeError
+        return py_json.loads(s)
+
+
+def _fast_dumps(obj, ensure_ascii=False, sort_keys=False) -> str:
+    """Compact JSON text through the active backend, falling back to the stdlib."""
+    try:
+        result = _backend_dumps(obj, ensure_ascii, sort_keys)
+    except (TypeError, ValueError, OverflowError):
+        result = None
+    if result is None:
+        result = _stdlib_dumps(obj, ensure_ascii, sort_keys)
+    return result
+
+
+set_backend()
+
+
 def loads(
     s: str,
     *,
@@ -91,9 +207,19 @@ def loads(
         data = loads(json_str)
         # data = {"nama": "Budi", "umur": 25}
     """
+    if (
+        cls is None
+        and object_hook is None
+        and parse_float is None
+        and parse_int is None
+        and parse_constant is None
+        and object_pairs_hook is None
+        and not kw
+    ):
+        return _fast_loads(s)
+    # ``encoding`` is accepted for compatibility; json.loads no longer takes it
     return py_json.loads(
         s,
-        encoding=encoding,
         cls=cls,
         object_hook=object_hook,
         parse_float=parse_float,
@@ -148,6 +274,17 @@ def dumps(
         #   "umur": 25
         # }
     """
+    if (
+        separators in ((",", ":"), [",", ":"])
+        and indent is None
+        and cls is None
+        and default is None
+        and not skipkeys
+        and check_circular
+        and allow_nan
+        and not kw
+    ):
+        return _fast_dumps(obj, ensure_ascii, sort_keys)
     return py_json.dumps(
         obj,
         skipkeys=skipkeys,
@@ -194,6 +331,16 @@ def load(
         dengan open('data.json', 'r') sebagai f:
             data = load(f)
     """
+    if (
+        cls is None
+        and object_hook is None
+        and parse_float is None
+        and parse_int is None
+        and parse_constant is None
+        and object_pairs_hook is None
+        and not kw
+    ):
+        return _fast_loads(fp.read())
     return py_json.load(
         fp,
         cls=cls,
@@ -259,6 +406,246 @@ def dump(
     )
 
 
+# Streaming JSON
+
+
+def _open_source(source, mode: str, encoding: str):
+    """Return (file object, should_close) for a path or an already open file."""
+    if hasattr(source, "read") or hasattr(source, "write"):
+        return source, False
+    if "b" in mode:
+        return open(source, mode), True
+    return open(source, mode, encoding=encoding), True
+
+
+def read_ndjson(
+    source,
+    batch_size: Optional[int] = None,
+    skip_invalid: bool = False,
+    encoding: str = "utf-8",
+):
+    """
+    Baca NDJSON (satu dokumen JSON per baris) secara bertahap.
+
+    Args:
+        source: Path file atau file object
+        batch_size: Jika diisi, hasilkan list berisi sebanyak ini objek sekaligus
+        skip_invalid: Lewati baris yang bukan JSON valid alih-alih error
+        encoding: Encoding file (default: utf-8)
+
+    Yields:
+        Objek per baris, atau batch objek jika batch_size diisi
+
+    Raises:
+        JSONDecodeError: Jika ada baris tidak valid dan skip_invalid salah
+
+    Example:
+        untuk setiap event dari read_ndjson('events.ndjson')
+            tampilkan event['tipe']
+        selesai
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size harus lebih besar dari 0")
+    f, should_close = _open_source(source, "r", encoding)
+    try:
+        batch = []
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                item = _fast_loads(line)
+            except py_json.JSONDecodeError as e:
+                if skip_invalid:
+                    continue
+                raise py_json.JSONDecodeError(
+                    f"JSON tidak valid di baris {line_number}: {e.msg}", e.doc, e.pos
+                ) from None
+            if batch_size is None:
+                yield item
+                continue
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        if should_close:
+            f.close()
+
+
+class NDJSONWriter:
+    """
+    Penulis NDJSON dengan buffer.
+
+    Setiap objek diserialisasi sebagai satu baris JSON ringkas melalui
+    backend aktif, lalu ditulis ke file dalam potongan besar.
+
+    Example:
+        dengan NDJSONWriter('events.ndjson') sebagai w:
+            w.write({'tipe': 'klik', 'id': 1})
+    """
+
+    def __init__(
+        self,
+        target,
+        append: bool = False,
+        buffer_size: int = 1024 * 1024,
+        ensure_ascii: bool = False,
+        encoding: str = "utf-8",
+    ):
+        self._file, self._should_close = _open_source(target, "a" if append else "w", encoding)
+        self.buffer_size = buffer_size
+        self.ensure_ascii = ensure_ascii
+        self.count = 0
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, obj):
+        """Tulis satu objek sebagai satu baris."""
+        line = _fast_dumps(obj, self.ensure_ascii)
+        self._buffer.append(line)
+        self._buffer.append("\n")
+        self._buffered += len(line) + 1
+        self.count += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, objects):
+        """Tulis banyak objek sekaligus."""
+        for obj in objects:
+            self.write(obj)
+
+    def flush(self):
+        """Tulis isi buffer ke file."""
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self):
+        """Flush buffer dan tutup file (jika dibuka oleh writer)."""
+        self.flush()
+        if self._should_close:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def write_ndjson(target, objects, append: bool = False, encoding: str = "utf-8") -> int:
+    """
+    Tulis objek-objek sebagai NDJSON.
+
+    Args:
+        target: Path file atau file object
+        objects: Iterable objek (boleh generator)
+        append: Tambahkan ke akhir file alih-alih menimpa
+        encoding: Encoding file (default: utf-8)
+
+    Returns:
+        Jumlah objek yang ditulis
+
+    Example:
+        write_ndjson('hasil.ndjson', [{'id': 1}, {'id': 2}])
+    """
+    with NDJSONWriter(target, append=append, encoding=encoding) as writer:
+        writer.write_many(objects)
+    return writer.count
+
+
+def iter_array(source, chunk_size: int = 65536, encoding: str = "utf-8"):
+    """
+    Iterasi elemen array JSON tingkat atas tanpa memuat seluruh dokumen.
+
+    File dibaca per potongan dan setiap elemen di-parse begitu lengkap,
+    sehingga memori yang dipakai sebanding dengan elemen terbesar.
+
+    Args:
+        source: Path file atau file object berisi array JSON
+        chunk_size: Jumlah karakter yang dibaca per potongan
+        encoding: Encoding file (default: utf-8)
+
+    Yields:
+        Elemen array satu per satu
+
+    Raises:
+        JSONDecodeError: Jika dokumen bukan array JSON yang valid
+
+    Example:
+        untuk setiap item dari iter_array('dump.json')
+            proses(item)
+        selesai
+    """
+    decoder = py_json.JSONDecoder()
+    f, should_close = _open_source(source, "r", encoding)
+    try:
+        buffer = ""
+        position = 0
+        eof = False
+        read_size = chunk_size
+
+        def fill():
+            nonlocal buffer, position, eof
+            chunk = f.read(read_size)
+            if not chunk:
+                eof = True
+                return
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        def skip_whitespace():
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n":
+                    position += 1
+                if position < len(buffer) or eof:
+                    return
+                fill()
+
+        skip_whitespace()
+        if position >= len(buffer) or buffer[position] != "[":
+            raise py_json.JSONDecodeError("Dokumen bukan array JSON", buffer, position)
+        position += 1
+        first = True
+        while True:
+            skip_whitespace()
+            if position >= len(buffer):
+                raise py_json.JSONDecodeError("Array JSON tidak ditutup", buffer, position)
+            if buffer[position] == "]":
+                return
+            if not first:
+                if buffer[position] != ",":
+                    raise py_json.JSONDecodeError("Diharapkan ',' atau ']'", buffer, position)
+                position += 1
+                skip_whitespace()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except py_json.JSONDecodeError:
+                    if eof:
+                        raise
+                    end = None
+                # A value ending exactly at the buffer edge may continue (numbers)
+                if end is not None and (end < len(buffer) or eof):
+                    break
+                fill()
+                # Grow reads so an element larger than a chunk is re-parsed few times
+                read_size = min(read_size * 2, 64 * 1024 * 1024)
+            read_size = chunk_size
+            position = end
+            first = False
+            yield item
+    finally:
+        if should_close:
+            f.close()
+
+
 # Custom JSON Decoder
 
 
@@ -309,6 +696,10 @@ tulis_ke_file = dump
 parser_json = JSONDecoder
 encoder_json = JSONEncoder
 error_json = JSONDecodeError
+baca_ndjson = read_ndjson
+tulis_ndjson = write_ndjson
+penulis_ndjson = NDJSONWriter
+iterasi_array = iter_array
 
 # Utility Functions
 
@@ -331,6 +722,9 @@ def validate_json(s: str) -> bool:
     """
     Validasi apakah string adalah JSON yang valid.
 
+    Selalu memakai parser bawaan, sehingga hasilnya tidak bergantung pada
+    backend yang aktif.
+
     Args:
         s: String yang akan divalidasi
 
@@ -338,9 +732,9 @@ def validate_json(s: str) -> bool:
         True jika valid, False jika tidak
     """
     try:
-        loads(s)
+        py_json.loads(s)
         return True
-    except JSONDecodeError:
+    except py_json.JSONDecodeError:
         return False
 
 
@@ -363,6 +757,16 @@ __all__ = [
     "dumps",
     "load",
     "dump",
+    # Streaming
+    "read_ndjson",
+    "write_ndjson",
+    "iter_array",
+    "NDJSONWriter",
+    # Backend
+    "BACKENDS",
+    "DEFAULT_BACKENDS",
+    "set_backend",
+    "get_backend",
     # Classes
     "JSONDecoder",
     "JSONEncoder",
@@ -376,6 +780,10 @@ __all__ = [
     "parser_json",
     "encoder_json",
     "error_json",
+    "baca_ndjson",
+    "tulis_ndjson",
+    "penulis_ndjson",
+    "iterasi_array",
     # Utility Functions
     "format_json",
     "validate_json",
@@ -28,11 +28,33 @@ RenzMcLang Regular Expression Library
 
 Library untuk regular expression operations dengan fungsi-fungsi 
 dalam bahasa Indonesia.
+
+Fungsi pencarian juga menerima file dari fileio.map_file sebagai string,
+sehingga regex berjalan langsung di atas isi file yang dipetakan.
 """
 
 import re as python_re
 
 
+def _target(pattern, string, flags=0):
+    """
+    Let regex functions scan a mapped file (fileio.MappedFile) in place.
+
+    Text patterns are encoded with the file's encoding and the search runs
+    over the mapped bytes, so matches are bytes; other targets are returned
+    unchanged.
+    """
+    buffer = getattr(string, "buffer", None)
+    encoding = getattr(string, "encoding", None)
+    if buffer is None or not callable(buffer) or not isinstance(encoding, str):
+        return pattern, string, flags
+    if isinstance(pattern, python_re.Pattern) and isinstance(pattern.pattern, str):
+        pattern, flags = pattern.pattern, pattern.flags & ~python_re.UNICODE
+    if isinstance(pattern, str):
+        pattern = pattern.encode(encoding)
+    return pattern, buffer(), flags
+
+
 def cocok(pattern, string, flags=0):
     """
     Cek apakah pattern cocok di awal string.
@@ -46,6 +68,7 @@ def cocok(pattern, string, flags=0):
         Match object jika cocok, None jika tidak
     """
     try:
+        pattern, string, flags = _target(pattern, string, flags)
         return python_re.match(pattern, string, flags)
     except python_re.error as e:
         raise ValueError(f"Pattern regex tidak valid: {str(e)}")
@@ -64,6 +87,7 @@ def cari(pattern, string, flags=0):
         Match object jika ditemukan, None jika tidak
     """
     try:
+        pattern, string, flags = _target(pattern, string, flags)
         return python_re.search(pattern, string, flags)
     except python_re.error as e:
         raise ValueError(f"Pattern regex tidak valid: {str(e)}")
@@ -82,6 +106,7 @@ def cari_semua(pattern, string, flags=0):
         list: List semua matches
     """
     try:
+        pattern, string, flags = _target(pattern, string, flags)
         return python_re.findall(pattern, string, flags)
     except python_re.error as e:
         raise ValueError(f"Pattern regex tidak valid: {str(e)}")
@@ -100,6 +125,7 @@ def cari_iterasi(pattern, string, flags=0):
         iterator: Iterator untuk matches
     """
     try:
+        pattern, string, flags = _target(pattern, string, flags)
         return python_re.finditer(pattern, string, flags)
     except python_re.error as e:
         raise ValueError(f"Pattern regex tidak valid: {str(e)}")
@@ -210,6 +236,7 @@ def full_cocok(pattern, string, flags=0):
         Match object jika cocok, None jika tidak
     """
     try:
+        pattern, string, flags = _target(pattern, string, flags)
         return python_re.fullmatch(pattern, string, flags)
     except python_re.error as e:
         raise ValueError(f"Pattern regex tidak valid: {str(e)}")
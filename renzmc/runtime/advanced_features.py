@@ -25,6 +25,7 @@ SOFTWARE.
 
 import functools
 
+from renzmc.core.base_visitor import is_located
 from renzmc.core.error import RenzmcRuntimeError
 
 
@@ -86,6 +87,8 @@ class RenzmcDecorator:
             try:
                 return self.actual_decorator(func, *args, **kwargs)
             except Exception as e:
+                if is_located(e):
+                    raise
                 raise RenzmcRuntimeError(f"Error dalam decorator '{self.name}': {str(e)}")
 
         return wrapper
@@ -480,15 +483,20 @@ def profile_decorator(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        tracemalloc.start()
+        # Leave tracing alone when something else (or an outer call) started it
+        owns_tracing = not tracemalloc.is_tracing()
+        if owns_tracing:
+            tracemalloc.start()
         start_time = time.perf_counter()
         start_memory = tracemalloc.get_traced_memory()[0]
 
-        result = func(*args, **kwargs)
-
-        end_time = time.perf_counter()
-        end_memory = tracemalloc.get_traced_memory()[0]
-        tracemalloc.stop()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            end_time = time.perf_counter()
+            end_memory = tracemalloc.get_traced_memory()[0]
+            if owns_tracing:
+                tracemalloc.stop()
 
         execution_time = end_time - start_time
         memory_used = (end_memory - start_memory) / 1024 / 1024
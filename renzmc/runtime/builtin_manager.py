@@ -1,5 +1,6 @@
 import renzmc.builtins as renzmc_builtins
 from renzmc.library.manager import get_library_manager
+from renzmc.runtime import output
 
 
 class BuiltinManager:
@@ -25,9 +26,9 @@ class BuiltinManager:
             "zip": zip,
             "all": all,
             "any": any,
-            "sum": sum,
-            "min": min,
-            "max": max,
+            "sum": renzmc_builtins.total,
+            "min": renzmc_builtins.terkecil,
+            "max": renzmc_builtins.terbesar,
             "abs": abs,
             "round": round,
             "pow": pow,
@@ -43,6 +44,7 @@ class BuiltinManager:
             "berisi": renzmc_builtins.berisi,
             "hapus_spasi": renzmc_builtins.hapus_spasi,
             "format_teks": renzmc_builtins.format_teks,
+            "PembangunTeks": renzmc_builtins.PembangunTeks,
             "adalah_huruf": renzmc_builtins.adalah_huruf,
             "adalah_angka": renzmc_builtins.adalah_angka,
             "adalah_alfanumerik": renzmc_builtins.adalah_alfanumerik,
@@ -85,7 +87,9 @@ class BuiltinManager:
             "hapus_pada": renzmc_builtins.hapus_pada,
             "hitung": renzmc_builtins.hitung,
             "indeks": renzmc_builtins.indeks,
+            "larik": renzmc_builtins.larik,
             "masukkan": renzmc_builtins.masukkan,
+            "rata_rata": renzmc_builtins.rata_rata,
             "salin": renzmc_builtins.salin,
             "salin_dalam": renzmc_builtins.salin_dalam,
             "tambah": renzmc_builtins.tambah,
@@ -104,6 +108,8 @@ class BuiltinManager:
             "is_async_function": renzmc_builtins.is_async_function,
             "impor_semua_python": renzmc_builtins.impor_semua_python,
             "reload_python": renzmc_builtins.reload_python,
+            # Output
+            "flush": output.flush,
         }
 
         # Add library management functions
@@ -116,6 +116,33 @@ class FileOperations:
             logger.error(f"Unexpected error deleting file '{filename}': {e}", exc_info=True)
             raise RuntimeError(f"Error menghapus file: {e}")
 
+    @file_rate_limiter
+    def map_file(self, filename: str, encoding: str = "utf-8"):
+        # The size limit of read_file does not apply: nothing is loaded up front
+        from renzmc.library.fileio import MappedFile
+
+        try:
+            filepath = self.validator.validate_path(filename)
+            if not filepath.exists():
+                raise FileNotFoundError(f"File tidak ditemukan: {filename}")
+            if filepath.is_dir():
+                raise ValueError(f"Bukan file: {filename}")
+            mapped = MappedFile(str(filepath), encoding)
+            logger.info(
+                f"Mapped file: {filename} ({len(mapped)} bytes, "
+                f"{'mmap' if mapped.is_mapped else 'dibaca ke memori'})"
+            )
+            return mapped
+        except ValidationError as e:
+            logger.error(f"Validation error mapping file '{filename}': {e}")
+            raise
+        except FileNotFoundError:
+            logger.error(f"File not found: {filename}")
+            raise
+        except PermissionError:
+            logger.error(f"Permission denied mapping file: {filename}")
+            raise PermissionError(f"Tidak ada izin untuk membaca file: {filename}")
+
     @file_rate_limiter
     def file_exists(self, filename: str) -> bool:
         try:
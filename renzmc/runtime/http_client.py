@@ -27,6 +27,8 @@ from typing import Any, Dict, Optional
 
 import requests
 
+from renzmc.utils.rate_limiter import limit_per_host
+
 
 class HTTPResponse:
 
@@ -60,6 +62,7 @@ class HTTPClient:
         self.default_timeout = 30
         self.default_headers = {"User-Agent": "RenzMcLang"}
 
+    @limit_per_host
     def get(
         self,
         url: str,
@@ -83,6 +86,7 @@ class HTTPClient:
         except Exception as e:
             raise RuntimeError(f"HTTP GET error: {e}")
 
+    @limit_per_host
     def post(
         self,
         url: str,
@@ -108,6 +112,7 @@ class HTTPClient:
         except Exception as e:
             raise RuntimeError(f"HTTP POST error: {e}")
 
+    @limit_per_host
     def put(
         self,
         url: str,
@@ -133,6 +138,7 @@ class HTTPClient:
         except Exception as e:
             raise RuntimeError(f"HTTP PUT error: {e}")
 
+    @limit_per_host
     def delete(
         self, url: str, headers: Optional[Dict] = None, timeout: Optional[int] = None
     ) -> HTTPResponse:
@@ -149,6 +155,7 @@ class HTTPClient:
         except Exception as e:
             raise RuntimeError(f"HTTP DELETE error: {e}")
 
+    @limit_per_host
     def patch(
         self,
         url: str,
@@ -97,6 +97,9 @@ class InlineCache:
         if name is None and scope_id is None:
             self.cache.clear()
             return
+        if name is not None and scope_id is not None:
+            self.cache.pop((name, scope_id), None)
+            return
 
         keys_to_remove = []
         for cache_key in self.cache:
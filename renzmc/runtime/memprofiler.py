@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import functools
+import os
+import sys
+import tracemalloc
+import types
+from collections import defaultdict
+
+from renzmc.runtime.tracing import (
+    Tracer,
+    call_traced,
+    entry_points,
+    traced_function,
+    traced_method,
+)
+
+# Calls before a function's growth counts towards leak detection
+LEAK_WARMUP_CALLS = 1
+# Minimum measured calls, and the share of them that must grow memory
+LEAK_MIN_CALLS = 5
+LEAK_GROWTH_RATIO = 0.8
+# Average growth per call below this is the interpreter's own bookkeeping
+# (bounded caches, scope copies), not something the function keeps
+LEAK_MIN_BYTES = 512
+# Objects visited per structure when measuring retained size
+SIZE_LIMIT = 200_000
+
+
+class MemoryProfiler(Tracer):
+    """
+    Attribute Python heap allocations to RenzmcLang source.
+
+    Installed like a Tracer, but each positioned AST node reads the
+    tracemalloc counter before and after it runs. The difference minus what
+    its child nodes already claimed is the node's own net allocation, kept
+    per ``(file, line, node type)`` so a line that builds a list is told
+    apart from one that builds a dict or an instance on the same line.
+
+    Each user function or method call is also measured as a whole; a
+    function whose calls keep leaving memory behind is reported as a
+    possible leak. At the end, the interpreter structures that can grow
+    without bound (``instance_scopes``, module caches, ``_GLOBAL_CACHE``,
+    ...) are measured.
+    """
+
+    def __init__(self, top=20):
+        super().__init__()
+        self.top = top
+        self.site_bytes = defaultdict(int)
+        self.site_evaluations = defaultdict(int)
+        self.call_stats = defaultdict(lambda: [0, 0, 0])  # calls, growing calls, bytes
+        self.snapshot = None
+        self.peak = 0
+        self.current = 0
+        self._children = [0]
+        self.structures = []
+        self._interpreters = []
+        self._owns_tracemalloc = False
+
+    def start(self):
+        """Start tracemalloc (unless already tracing) and install the profiler."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        return super().start()
+
+    def stop(self):
+        """Uninstall, take the final snapshot and stop tracemalloc if we started it."""
+        if not self.active:
+            return self
+        super().stop()
+        if tracemalloc.is_tracing():
+            self.current, self.peak = tracemalloc.get_traced_memory()
+            self.snapshot = tracemalloc.take_snapshot().filter_traces(
+                (
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, __file__),
+                )
+            )
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+                self._owns_tracemalloc = False
+        # Measured now so the interpreters seen during the run can be released
+        self.structures = self.retained_structures()
+        self._interpreters.clear()
+        return self
+
+    def _wrappers(self):
+        visitor, functions, methods = entry_points()
+        return (
+            (visitor, "visit", _measured_visit),
+            (
+                functions,
+                "_execute_user_function",
+                lambda t, f: traced_function(t, f, _measured_call),
+            ),
+            (methods, "_execute_user_method", lambda t, f: traced_method(t, f, _measured_call)),
+        )
+
+    def leaks(self):
+        """Return (name, calls, bytes per call) for functions that grow on most calls."""
+        suspects = []
+        for name, (calls, growing, total) in self.call_stats.items():
+            if (
+                calls >= LEAK_MIN_CALLS
+                and total >= calls * LEAK_MIN_BYTES
+                and growing >= calls * LEAK_GROWTH_RATIO
+            ):
+                suspects.append((name, calls, total / calls))
+        suspects.sort(key=lambda item: item[1] * item[2], reverse=True)
+        return suspects
+
+    def retained_structures(self):
+        """Return (name, entries, bytes) for interpreter caches and scopes, largest first."""
+        from renzmc.runtime import advanced_features
+        from renzmc.runtime.renzmc_module_system import parsed_module_cache
+
+        structures = [
+            ("_GLOBAL_CACHE", advanced_features._GLOBAL_CACHE),
+            ("cache parse modul", parsed_module_cache._entries),
+        ]
+        for index, interpreter in enumerate(self._interpreters):
+            label = os.path.basename(getattr(interpreter, "current_file", None) or "<stdin>")
+            if len(self._interpreters) > 1:
+                label = f"{label}#{index}"
+            scopes = interpreter.scope_manager
+            structures.extend(
+                [
+                    (f"instance_scopes ({label})", scopes.instance_scopes),
+                    (f"global_scope ({label})", scopes.global_scope),
+                    (f"inline_cache ({label})", scopes.inline_cache.cache),
+                    (f"loaded_modules ({label})", interpreter.module_manager.loaded_modules),
+                    (f"jit_compiled_functions ({label})", interpreter.jit_compiled_functions),
+                ]
+            )
+        measured = [(name, len(value), _deep_size(value)) for name, value in structures]
+        measured.sort(key=lambda item: item[2], reverse=True)
+        return measured
+
+    def report(self):
+        """Return the text report."""
+        lines = [
+            f"Profil Memori RenzmcLang: puncak {_format_bytes(self.peak)}, "
+            f"masih dialokasikan {_format_bytes(self.current)}",
+            "",
+            "Alokasi per baris dan jenis node (eksklusif, dikurangi yang dibebaskan di node itu):",
+            f"{'bytes':>12} {'evaluasi':>9}  lokasi",
+        ]
+        sites = sorted(self.site_bytes.items(), key=lambda item: item[1], reverse=True)
+        for (file, line, kind), size in sites[: self.top]:
+            if size <= 0:
+                break
+            location = f"{_display_path(file)}:{line}"
+            evaluations = self.site_evaluations[(file, line, kind)]
+            lines.append(f"{_format_bytes(size):>12} {evaluations:>9}  {location} ({kind})")
+
+        suspects = self.leaks()
+        lines.append("")
+        if suspects:
+            lines.append("Kemungkinan kebocoran (memori bertambah di hampir setiap panggilan):")
+            for name, calls, per_call in suspects[: self.top]:
+                lines.append(
+                    f"{'+' + _format_bytes(per_call):>12} per panggilan  {name} ({calls} panggilan)"
+                )
+        else:
+            lines.append("Tidak ada fungsi yang memorinya terus bertambah antar panggilan.")
+
+        lines.append("")
+        lines.append("Struktur interpreter terbesar yang masih ditahan:")
+        lines.append(f"{'bytes':>12} {'entri':>9}  struktur")
+        for name, entries, size in self.structures:
+            lines.append(f"{_format_bytes(size):>12} {entries:>9}  {name}")
+
+        if self.snapshot is not None:
+            lines.append("")
+            lines.append("Situs alokasi Python teratas (tracemalloc):")
+            for stat in self.snapshot.statistics("lineno")[: self.top]:
+                frame = stat.traceback[0]
+                lines.append(
+                    f"{_format_bytes(stat.size):>12} {stat.count:>9}  "
+                    f"{_display_path(frame.filename)}:{frame.lineno}"
+                )
+        return "\n".join(lines)
+
+
+def _measured_visit(profiler, visit):
+    node_counts = profiler.node_counts
+    site_bytes = profiler.site_bytes
+    site_evaluations = profiler.site_evaluations
+    interpreters = profiler._interpreters
+    children = profiler._children
+    traced = tracemalloc.get_traced_memory
+
+    @functools.wraps(visit)
+    def wrapper(self, node):
+        node_counts[type(node).__name__] += 1
+        line = getattr(node, "line", None)
+        if line is None:
+            # Blocks and the program have no position: their allocations
+            # belong to the enclosing node
+            return visit(self, node)
+        if self not in interpreters:
+            interpreters.append(self)
+        before = traced()[0]
+        children.append(0)
+        try:
+            return visit(self, node)
+        finally:
+            total = traced()[0] - before
+            key = (getattr(self, "current_file", None), line, type(node).__name__)
+            site_bytes[key] += total - children.pop()
+            site_evaluations[key] += 1
+            children[-1] += total
+
+    return wrapper
+
+
+def _jit_compilations(interpreters):
+    # Every compilation attempt, successful or not, adds a jit_compiled_functions entry
+    return sum(len(interpreter.jit_compiled_functions) for interpreter in interpreters)
+
+
+def _measured_call(profiler, name, args, func, *call_args):
+    interpreters = profiler._interpreters
+    compiled = _jit_compilations(interpreters)
+    before = tracemalloc.get_traced_memory()[0]
+    try:
+        return call_traced(profiler, name, args, func, *call_args)
+    finally:
+        grown = tracemalloc.get_traced_memory()[0] - before
+        stats = profiler.call_stats[name]
+        calls = profiler.function_calls[name]
+        # The first calls fill caches and lazily created state, and a call
+        # that JIT-compiles a function holds the one-time compiled code
+        if calls > LEAK_WARMUP_CALLS and _jit_compilations(interpreters) == compiled:
+            stats[0] += 1
+            stats[1] += grown > 0
+            stats[2] += grown
+
+
+def _deep_size(root, limit=SIZE_LIMIT):
+    """Approximate bytes reachable from ``root`` through containers and instance dicts."""
+    seen = set()
+    stack = [root]
+    total = 0
+    while stack and len(seen) < limit:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        # Shared code and definitions are not retained by the structure
+        if obj is not root and isinstance(obj, (type, types.ModuleType)) or callable(obj):
+            continue
+        total += sys.getsizeof(obj, 0)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return total
+
+
+def _display_path(path):
+    if not path:
+        return "<stdin>"
+    try:
+        relative = os.path.relpath(path)
+    except ValueError:
+        return path
+    return path if relative.startswith("..") else relative
+
+
+def _format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import threading
+
+
+class ModuleReloader:
+    """
+    Hot reload service for RenzmcLang modules.
+
+    Changes are detected by polling file modification times, so no
+    OS-specific file notifications are needed. Detection can run on a
+    background thread with ``start``; the reload itself is applied only when
+    ``poll`` is called, so module code is never re-executed while the program
+    is in the middle of running it. A long-running script calls ``poll``
+    (``muat_ulang_berubah()``) once per iteration of its main loop.
+    """
+
+    def __init__(self, module_manager, interval=1.0):
+        self.module_manager = module_manager
+        self.interval = interval
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval=None):
+        """Start watching loaded modules on a background thread."""
+        if interval is not None:
+            self.interval = interval
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="renzmc-module-reloader", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background watcher."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+        self._thread = None
+
+    def poll(self):
+        """
+        Apply pending module changes.
+
+        With the watcher running this is a cheap flag check until a change
+        is detected; without it every loaded module is checked directly.
+
+        Returns:
+            List of names of the reloaded modules
+        """
+        if self.running:
+            if not self._changed.is_set():
+                return []
+            self._changed.clear()
+        return self.module_manager.refresh_changed_modules()
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if self.module_manager.changed_modules():
+                    self._changed.set()
+            except Exception:
+                continue
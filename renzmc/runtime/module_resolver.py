@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import time
+from threading import Lock
+
+MODULE_EXTENSIONS = (".rmc", ".renzmc")
+
+
+class DirectoryIndex:
+    """
+    Process-wide cache of directory listings used for module resolution.
+
+    Each directory is scanned once with ``os.scandir`` and its module files
+    and sub-directories are kept in memory together with the directory's
+    modification time. A listing is rescanned only when that mtime changes,
+    so resolving an import costs one ``stat`` per directory instead of a
+    probe per candidate file.
+    """
+
+    def __init__(self):
+        self._listings = {}
+        self._lock = Lock()
+        self.scans = 0
+
+    def listing(self, directory):
+        """
+        Get the cached listing for ``directory``.
+
+        Returns:
+            Tuple ``(mtime_ns, files, dirs)`` or None if the directory does
+            not exist
+        """
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._listings.pop(directory, None)
+            return None
+
+        with self._lock:
+            cached = self._listings.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached
+
+        files = set()
+        dirs = set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            dirs.add(entry.name)
+                        elif entry.name.endswith(MODULE_EXTENSIONS):
+                            files.add(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+
+        listing = (mtime, frozenset(files), frozenset(dirs))
+        with self._lock:
+            self._listings[directory] = listing
+            self.scans += 1
+        return listing
+
+    def invalidate(self, directory=None):
+        with self._lock:
+            if directory is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(os.path.abspath(directory), None)
+
+
+directory_index = DirectoryIndex()
+
+
+class ModuleResolver:
+    """
+    Resolve dotted RenzmcLang module names to files.
+
+    Results, including failed lookups, are cached per name together with the
+    mtimes of every directory that was consulted. A cached answer stays
+    valid until one of those directories changes or the search paths are
+    modified.
+    """
+
+    def __init__(self, search_paths, index=None):
+        self.search_paths = search_paths
+        self.index = index or directory_index
+        self._resolved = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, module_name):
+        """
+        Find the file for ``module_name``.
+
+        Returns:
+            Absolute path of the module file, or None if it is not found
+        """
+        cached = self._resolved.get(module_name)
+        if cached is not None and self._is_fresh(cached[1]):
+            self.hits += 1
+            return cached[0]
+
+        self.misses += 1
+        parts = module_name.split(".")
+        consulted = {}
+        result = None
+        for search_path in self.search_paths:
+            result = self._resolve_in(search_path, parts, consulted)
+            if result is not None:
+                break
+        self._resolved[module_name] = (result, tuple(consulted.items()))
+        return result
+
+    def resolve_in(self, directory, module_name):
+        """Resolve ``module_name`` relative to a single directory."""
+        parts = module_name.split(".") if module_name else []
+        return self._resolve_in(os.path.abspath(directory), parts, {})
+
+    def explain(self, module_name):
+        """
+        Describe how ``module_name`` is resolved.
+
+        Returns:
+            Dictionary with the candidates checked per search path, the
+            resolved path and the time spent, both cold and from cache
+        """
+        self._resolved.pop(module_name, None)
+        steps = []
+        parts = module_name.split(".")
+        start = time.perf_counter()
+        for search_path in self.search_paths:
+            if self._resolve_in(search_path, parts, {}, steps) is not None:
+                break
+        cold_time = time.perf_counter() - start
+
+        result = self.resolve(module_name)
+        start = time.perf_counter()
+        self.resolve(module_name)
+        cached_time = time.perf_counter() - start
+
+        return {
+            "module": module_name,
+            "path": result,
+            "steps": steps,
+            "search_paths": list(self.search_paths),
+            "cold_time": cold_time,
+            "cached_time": cached_time,
+        }
+
+    def invalidate(self, module_name=None):
+        if module_name is None:
+            self._resolved.clear()
+        else:
+            self._resolved.pop(module_name, None)
+
+    def get_stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_names": len(self._resolved),
+            "directory_scans": self.index.scans,
+        }
+
+    def _is_fresh(self, consulted):
+        for directory, mtime in consulted:
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                return False
+        return True
+
+    def _resolve_in(self, directory, parts, consulted, steps=None):
+        *packages, leaf = parts if parts else ("",)
+        for package in packages:
+            listing = self._listing(directory, consulted)
+            if listing is None or package not in listing[2]:
+                if steps is not None:
+                    steps.append((os.path.join(directory, package), False))
+                return None
+            directory = os.path.join(directory, package)
+
+        listing = self._listing(directory, consulted)
+        if listing is None:
+            if steps is not None:
+                steps.append((directory, False))
+            return None
+
+        for ext in MODULE_EXTENSIONS:
+            # A module file takes precedence over a package of the same name
+            if leaf:
+                candidate = f"{leaf}{ext}"
+                found = candidate in listing[1]
+                if steps is not None:
+                    steps.append((os.path.join(directory, candidate), found))
+                if found:
+                    return os.path.join(directory, candidate)
+
+            package_dir = os.path.join(directory, leaf) if leaf else directory
+            package_listing = (
+                self._listing(package_dir, consulted) if not leaf or leaf in listing[2] else None
+            )
+            init_file = f"__init__{ext}"
+            found = package_listing is not None and init_file in package_listing[1]
+            if steps is not None:
+                steps.append((os.path.join(package_dir, init_file), found))
+            if found:
+                return os.path.join(package_dir, init_file)
+        return None
+
+    def _listing(self, directory, consulted):
+        listing = self.index.listing(directory)
+        consulted[directory] = listing[0] if listing is not None else None
+        return listing
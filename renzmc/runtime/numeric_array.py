@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import array
+import math
+import operator
+import sys
+from itertools import repeat
+
+from renzmc.core.error import RenzmcTypeError
+
+_numpy = None
+_numpy_checked = False
+
+# Element type names accepted by larik(), with their array/NumPy codes
+_ELEMENT_TYPES = {
+    "bulat": ("q", "int64"),
+    "int": ("q", "int64"),
+    "desimal": ("d", "float64"),
+    "float": ("d", "float64"),
+}
+
+# Integer operators checked for wrap-around on the NumPy backend
+_WRAPPING_OPS = (operator.add, operator.sub, operator.mul, operator.pow)
+
+
+def get_numpy():
+    """Import NumPy on first use; returns None when it is not installed."""
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def _wrapped(op, x, y, result):
+    """
+    Mask of elements where a NumPy integer ``op(x, y)`` wrapped around.
+
+    NumPy integer arrays overflow silently, while the array.array backend
+    raises OverflowError; this lets both backends behave the same.
+    """
+    numpy = get_numpy()
+    x = numpy.asarray(x)
+    y = numpy.asarray(y)
+    signed = result.dtype.kind == "i"
+    with numpy.errstate(all="ignore"):
+        if op is operator.add:
+            return ((x ^ result) & (y ^ result)) < 0 if signed else result < x
+        if op is operator.sub:
+            return ((x ^ y) & (x ^ result)) < 0 if signed else x < y
+        info = numpy.iinfo(result.dtype)
+        if op is operator.mul:
+            nonzero = y != 0
+            mask = nonzero & (result // numpy.where(nonzero, y, 1) != x)
+            if signed:
+                mask |= ((x == -1) & (y == info.min)) | ((y == -1) & (x == info.min))
+            return mask
+        exact = numpy.power(x.astype("float64"), y)
+        return (exact > info.max) | (exact < info.min)
+
+
+def _typecode_for(values):
+    for value in values:
+        if isinstance(value, float):
+            return "d"
+        if not isinstance(value, int):
+            raise RenzmcTypeError(f"Larik hanya dapat berisi angka, bukan '{type(value).__name__}'")
+    return "q"
+
+
+class Larik:
+    """
+    Typed numeric array for RenzmcLang.
+
+    Backed by a NumPy array when NumPy is installed and by a memoryview over
+    ``array.array`` otherwise. Arithmetic and comparisons work elementwise
+    against another array or a scalar, slices are views that share memory
+    with the original, and reductions run in C instead of per element in
+    the interpreter.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data=(), tipe=None):
+        if isinstance(data, Larik):
+            data = data._data
+        numpy = get_numpy()
+        if tipe is not None and tipe not in _ELEMENT_TYPES:
+            raise RenzmcTypeError(
+                f"Tipe larik '{tipe}' tidak dikenal, gunakan: {', '.join(_ELEMENT_TYPES)}"
+            )
+        if numpy is not None:
+            dtype = _ELEMENT_TYPES[tipe][1] if tipe else None
+            if isinstance(data, numpy.ndarray) and dtype is None:
+                self._data = data
+            else:
+                if not isinstance(data, (numpy.ndarray, memoryview, array.array)):
+                    data = list(data)
+                self._data = numpy.asarray(data, dtype=dtype)
+            if self._data.ndim != 1:
+                raise RenzmcTypeError("Larik hanya mendukung data satu dimensi")
+        elif isinstance(data, memoryview) and tipe is None:
+            self._data = data
+        else:
+            values = data if isinstance(data, (array.array, memoryview)) else list(data)
+            typecode = _ELEMENT_TYPES[tipe][0] if tipe else None
+            if typecode is None:
+                typecode = values.format if isinstance(values, memoryview) else None
+                typecode = typecode or getattr(values, "typecode", None)
+                typecode = typecode or _typecode_for(values)
+            self._data = memoryview(array.array(typecode, values))
+
+    @classmethod
+    def _wrap(cls, data):
+        result = cls.__new__(cls)
+        result._data = data
+        return result
+
+    @property
+    def uses_numpy(self):
+        return not isinstance(self._data, memoryview)
+
+    @property
+    def tipe(self):
+        kind = self._data.dtype.kind if self.uses_numpy else self._data.format
+        return "desimal" if kind in ("f", "d") else "bulat"
+
+    # Sequence protocol
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Larik._wrap(self._data[index])
+        value = self._data[index]
+        return value.item() if self.uses_numpy else value
+
+    def __setitem__(self, index, value):
+        if isinstance(value, Larik):
+            value = value._data
+        self._data[index] = value
+
+    def __iter__(self):
+        if self.uses_numpy:
+            return iter(self._data.tolist())
+        return iter(self._data)
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def __getattr__(self, name):
+        # A NumPy-backed larik keeps the ndarray API (shape, mean(), reshape(), ...)
+        # for everything Larik does not define itself
+        if name.startswith("_") or not self.uses_numpy:
+            raise AttributeError(f"'larik' tidak memiliki atribut '{name}'")
+        return getattr(self._data, name)
+
+    def __bool__(self):
+        if len(self) == 1:
+            return bool(self[0])
+        raise ValueError(
+            "Nilai kebenaran larik dengan lebih dari satu elemen ambigu, "
+            "gunakan semua() atau ada()"
+        )
+
+    # Elementwise operations
+
+    def _elementwise(self, op, other, reflected=False):
+        other_data = other._data if isinstance(other, Larik) else other
+        if self.uses_numpy:
+            if isinstance(other_data, memoryview):
+                other_data = get_numpy().asarray(other_data)
+            x, y = (other_data, self._data) if reflected else (self._data, other_data)
+            result = op(x, y)
+            if (
+                op in _WRAPPING_OPS
+                and result.dtype.kind in "iu"
+                and _wrapped(op, x, y, result).any()
+            ):
+                raise OverflowError("Hasil operasi larik melebihi rentang bilangan bulat")
+            return Larik._wrap(result)
+
+        if isinstance(other_data, (memoryview, array.array)):
+            if len(other_data) != len(self._data):
+                raise ValueError(
+                    f"Panjang larik tidak sama: {len(self._data)} dan {len(other_data)}"
+                )
+            operands = (other_data, self._data) if reflected else (self._data, other_data)
+        else:
+            scalars = repeat(other_data, len(self._data))
+            operands = (scalars, self._data) if reflected else (self._data, scalars)
+        values = list(map(op, *operands))
+        return Larik._wrap(memoryview(array.array(_typecode_for(values), values)))
+
+    def has_zero(self):
+        """Return True if any element is zero."""
+        if self.uses_numpy:
+            return not self._data.all()
+        return 0 in self._data
+
+    def __add__(self, other):
+        return self._elementwise(operator.add, other)
+
+    def __radd__(self, other):
+        return self._elementwise(operator.add, other, True)
+
+    def __sub__(self, other):
+        return self._elementwise(operator.sub, other)
+
+    def __rsub__(self, other):
+        return self._elementwise(operator.sub, other, True)
+
+    def __mul__(self, other):
+        return self._elementwise(operator.mul, other)
+
+    def __rmul__(self, other):
+        return self._elementwise(operator.mul, other, True)
+
+    def __truediv__(self, other):
+        return self._elementwise(operator.truediv, other)
+
+    def __rtruediv__(self, other):
+        return self._elementwise(operator.truediv, other, True)
+
+    def __floordiv__(self, other):
+        return self._elementwise(operator.floordiv, other)
+
+    def __rfloordiv__(self, other):
+        return self._elementwise(operator.floordiv, other, True)
+
+    def __mod__(self, other):
+        return self._elementwise(operator.mod, other)
+
+    def __rmod__(self, other):
+        return self._elementwise(operator.mod, other, True)
+
+    def __pow__(self, other):
+        return self._elementwise(operator.pow, other)
+
+    def __rpow__(self, other):
+        return self._elementwise(operator.pow, other, True)
+
+    def __eq__(self, other):
+        return self._elementwise(operator.eq, other)
+
+    def __ne__(self, other):
+        return self._elementwise(operator.ne, other)
+
+    def __lt__(self, other):
+        return self._elementwise(operator.lt, other)
+
+    def __le__(self, other):
+        return self._elementwise(operator.le, other)
+
+    def __gt__(self, other):
+        return self._elementwise(operator.gt, other)
+
+    def __ge__(self, other):
+        return self._elementwise(operator.ge, other)
+
+    def __neg__(self):
+        return self._elementwise(operator.mul, -1)
+
+    def __abs__(self):
+        if self.uses_numpy:
+            if self._data.dtype.kind == "i" and self._has_int_min():
+                raise OverflowError("Hasil operasi larik melebihi rentang bilangan bulat")
+            return Larik._wrap(abs(self._data))
+        return Larik(map(abs, self._data))
+
+    __hash__ = None
+
+    # Reductions
+
+    def _has_int_min(self):
+        return bool((self._data == get_numpy().iinfo(self._data.dtype).min).any())
+
+    def jumlah(self):
+        if self.uses_numpy:
+            data = self._data
+            if data.dtype.kind in "iu" and len(data):
+                # Exact like the array.array backend when the int64 sum could wrap
+                bound = max(abs(int(data.min())), abs(int(data.max())))
+                if bound * len(data) > get_numpy().iinfo("int64").max:
+                    return sum(data.tolist())
+            return data.sum().item()
+        if self._data.format == "d":
+            return math.fsum(self._data)
+        return sum(self._data)
+
+    def minimum(self):
+        if not len(self):
+            raise ValueError("minimum() dari larik kosong")
+        return self._data.min().item() if self.uses_numpy else min(self._data)
+
+    def maksimum(self):
+        if not len(self):
+            raise ValueError("maksimum() dari larik kosong")
+        return self._data.max().item() if self.uses_numpy else max(self._data)
+
+    def rata_rata(self):
+        if not len(self):
+            raise ValueError("rata_rata() dari larik kosong")
+        return self.jumlah() / len(self)
+
+    def semua(self):
+        return bool(self._data.all()) if self.uses_numpy else all(self._data)
+
+    def ada(self):
+        return bool(self._data.any()) if self.uses_numpy else any(self._data)
+
+    # In-place helpers used by the list builtins
+
+    def urutkan(self, terbalik=False):
+        if self.uses_numpy:
+            self._data.sort()
+            if terbalik:
+                self._data[:] = self._data[::-1].copy()
+        else:
+            self._data[:] = array.array(self._data.format, sorted(self._data, reverse=terbalik))
+        return self
+
+    def balikkan(self):
+        if self.uses_numpy:
+            self._data[:] = self._data[::-1].copy()
+        else:
+            self._data[:] = array.array(self._data.format, self._data[::-1])
+        return self
+
+    def hitung(self, value):
+        if self.uses_numpy:
+            return int(get_numpy().count_nonzero(self._data == value))
+        return self._data.tolist().count(value)
+
+    def indeks(self, value):
+        if self.uses_numpy:
+            found = get_numpy().flatnonzero(self._data == value)
+            if not len(found):
+                raise ValueError(f"Item '{value}' tidak ditemukan dalam larik")
+            return int(found[0])
+        try:
+            return self._data.tolist().index(value)
+        except ValueError:
+            raise ValueError(f"Item '{value}' tidak ditemukan dalam larik")
+
+    # Conversion
+
+    def ke_list(self):
+        return self._data.tolist()
+
+    def ke_memoryview(self):
+        return memoryview(self._data) if self.uses_numpy else self._data
+
+    def ke_python(self):
+        """Return the backing NumPy array, or an ``array.array`` copy without NumPy."""
+        if self.uses_numpy:
+            return self._data
+        return array.array(self._data.format, self._data)
+
+    def salin(self):
+        if self.uses_numpy:
+            return Larik._wrap(self._data.copy())
+        return Larik._wrap(memoryview(array.array(self._data.format, self._data)))
+
+    def __array__(self, dtype=None, copy=None):
+        numpy = get_numpy()
+        return numpy.asarray(self._data, dtype=dtype)
+
+    def __repr__(self):
+        return f"larik({self.ke_list()})"
+
+    def __str__(self):
+        return str(self.ke_list())
+
+
+def from_ndarray(obj):
+    """
+    Wrap a one-dimensional integer or float NumPy array in a Larik that shares its memory.
+
+    Returns None for anything else: other dimensions or element types, NumPy
+    subclasses such as masked arrays, and untyped buffers like ``array.array``
+    or memoryview, which callers leave as they are (``larik(x)`` adopts them
+    explicitly).
+    """
+    numpy = sys.modules.get("numpy")
+    if (
+        numpy is not None
+        and type(obj) is numpy.ndarray
+        and obj.ndim == 1
+        and obj.dtype.kind in "iuf"
+    ):
+        return Larik._wrap(obj)
+    return None
+
+
+def larik(data=(), tipe=None):
+    """Create a numeric array from ``data``; ``tipe`` is "bulat" or "desimal"."""
+    return Larik(data, tipe)
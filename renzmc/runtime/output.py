@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import io
+import os
+import sys
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class OutputStream:
+    """
+    Line writer behind ``tampilkan``, bound to one text stream.
+
+    When the stream is a ``TextIOWrapper`` (the normal ``sys.stdout``), each
+    line is encoded once and written straight to its binary buffer, skipping
+    ``print`` and the text layer. The stream is switched to ``write_through``
+    so text written by ``print`` elsewhere reaches the same buffer right
+    away and lines stay in order. Lines are flushed one by one only when
+    the stream is line buffered, which Python does only for a terminal.
+    Other streams (``io.StringIO``, captured output) get plain ``write``
+    calls.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.binary = None
+        self.line_buffering = False
+        if isinstance(stream, io.TextIOWrapper) and not stream.closed:
+            stream.reconfigure(write_through=True)
+            self.line_buffering = stream.line_buffering
+            self.binary = stream.buffer
+            self.encoding = stream.encoding
+            self.errors = stream.errors or "strict"
+
+    def write_line(self, text):
+        binary = self.binary
+        if binary is None:
+            self.stream.write(text + "\n")
+            return
+        binary.write((text + os.linesep).encode(self.encoding, self.errors))
+        if self.line_buffering:
+            binary.flush()
+
+
+_output = None
+
+
+def configure(buffer_size=None):
+    """
+    Give ``sys.stdout`` a binary buffer of ``buffer_size`` bytes.
+
+    Without a size, ``DEFAULT_BUFFER_SIZE`` is used, or 0 when Python runs
+    unbuffered (``python -u``, ``PYTHONUNBUFFERED``). The new stream is line buffered when stdout is a terminal or
+    ``buffer_size`` is 0. Streams without a file descriptor are left
+    untouched. Returns the stream now in ``sys.stdout``.
+    """
+    stream = sys.stdout
+    if buffer_size is None:
+        # python -u and PYTHONUNBUFFERED make stdout write through
+        buffer_size = 0 if getattr(stream, "write_through", False) else DEFAULT_BUFFER_SIZE
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return stream
+    stream.flush()
+    raw = io.FileIO(fd, "w", closefd=False)
+    binary = io.BufferedWriter(raw, buffer_size or io.DEFAULT_BUFFER_SIZE)
+    sys.stdout = io.TextIOWrapper(
+        binary,
+        encoding=stream.encoding,
+        errors=stream.errors,
+        line_buffering=buffer_size == 0 or raw.isatty(),
+        write_through=True,
+    )
+    _bind(sys.stdout)
+    return sys.stdout
+
+
+def _bind(stream):
+    global _output
+    _output = OutputStream(stream)
+    return _output
+
+
+def write_line(value):
+    """Write ``value`` and a newline to ``sys.stdout``, as ``tampilkan`` does."""
+    output = _output
+    if output is None or output.stream is not sys.stdout:
+        output = _bind(sys.stdout)
+    output.write_line(value if type(value) is str else str(value))
+
+
+def flush():
+    """Write everything ``tampilkan`` has buffered to stdout."""
+    sys.stdout.flush()
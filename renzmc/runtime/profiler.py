@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+DEFAULT_INTERVAL = 0.001
+
+
+class SamplingProfiler:
+    """
+    Sampling profiler that reports time in RenzmcLang source terms.
+
+    A background thread wakes every ``interval`` seconds and reads the Python
+    stack of the profiled thread. The interpreter is never instrumented: each
+    ``visit`` frame already holds the AST node being evaluated, so the node's
+    line and the interpreter's ``current_file`` give the RenzmcLang location,
+    and ``_execute_user_function`` / ``_execute_user_method`` frames mark
+    function boundaries. Each sample is weighted by the wall time since the previous
+    one, so scheduling jitter does not skew the totals.
+
+    Calls that run through a JIT-compiled function have no AST frames; they
+    are labelled ``nama [jit]`` and reported in their own section.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.function_self = defaultdict(float)
+        self.function_total = defaultdict(float)
+        self.line_self = defaultdict(float)
+        self.line_total = defaultdict(float)
+        self.stacks = defaultdict(int)
+        self.sample_count = 0
+        self.sampled_time = 0.0
+        self.duration = 0.0
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._target_id = None
+        self._started_at = None
+        self._codes = None
+        self._paths = {}
+
+    def start(self, thread_id=None):
+        """Start sampling ``thread_id`` (default: the calling thread)."""
+        if self._thread is not None:
+            return
+        self._codes = _interpreter_codes()
+        self._target_id = thread_id or threading.get_ident()
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="renzmc-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread to finish."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.duration += time.perf_counter() - self._started_at
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def _run(self):
+        last = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            if frame is None:
+                continue
+            stack = self._walk(frame)
+            del frame
+            if stack:
+                self._record(stack, elapsed)
+
+    def _walk(self, frame):
+        """
+        Turn a Python stack into RenzmcLang frames, outermost first.
+
+        Each frame is ``(function, file, line, is_jit)`` where ``line`` is the
+        line executing in that function: the innermost node for the leaf, the
+        call site for its callers.
+        """
+        visit_code, function_code, method_code, jit_file = self._codes
+        frames = []
+        file = line = None
+        jit = False
+        while frame is not None:
+            code = frame.f_code
+            if code is visit_code:
+                if line is None:
+                    f_locals = frame.f_locals
+                    node_line = getattr(f_locals.get("node"), "line", None)
+                    if isinstance(node_line, int):
+                        line = node_line
+                        file = getattr(f_locals.get("self"), "current_file", None)
+            elif code is function_code:
+                frames.append((str(frame.f_locals.get("name")), file, line, jit))
+                file = line = None
+                jit = False
+            elif code is method_code:
+                f_locals = frame.f_locals
+                label = f"{f_locals.get('class_name')}.{f_locals.get('method')}"
+                frames.append((label, file, line, jit))
+                file = line = None
+                jit = False
+            elif line is None and code.co_filename == jit_file:
+                jit = True
+            frame = frame.f_back
+        if line is None and not frames:
+            # Not inside the interpreter (parsing, startup, shutdown)
+            return None
+        frames.append(("<module>", file, line, False))
+        frames.reverse()
+        return tuple(frames)
+
+    def _record(self, stack, elapsed):
+        self.sample_count += 1
+        self.sampled_time += elapsed
+
+        seen_functions = set()
+        seen_lines = set()
+        names = []
+        for function, file, line, jit in stack:
+            key = (function, jit)
+            if key not in seen_functions:
+                seen_functions.add(key)
+                self.function_total[key] += elapsed
+            if line is not None:
+                location = (file, line, function)
+                if location not in seen_lines:
+                    seen_lines.add(location)
+                    self.line_total[location] += elapsed
+            names.append(self._frame_name(function, file, line, jit))
+
+        function, file, line, jit = stack[-1]
+        self.function_self[(function, jit)] += elapsed
+        if line is not None:
+            self.line_self[(file, line, function)] += elapsed
+        self.stacks[";".join(names)] += 1
+
+    def _display_path(self, path):
+        if path is None:
+            return "<stdin>"
+        display = self._paths.get(path)
+        if display is None:
+            try:
+                display = os.path.relpath(path)
+            except ValueError:
+                display = path
+            if display.startswith(".."):
+                display = path
+            self._paths[path] = display
+        return display
+
+    def _frame_name(self, function, file, line, jit):
+        if jit:
+            return f"{function} [jit]"
+        location = self._display_path(file)
+        if line is not None:
+            location = f"{location}:{line}"
+        return f"{function} ({location})".replace(";", ",")
+
+    def collapsed_stacks(self):
+        """Return stacks in the collapsed format read by flamegraph.pl and speedscope."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def write_collapsed(self, path):
+        """Write collapsed stacks to ``path``."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed_stacks())
+
+    def report(self, limit=20):
+        """Return a text report of self and total time per function and per line."""
+        total = self.sampled_time or 1.0
+        lines = [
+            f"Profil RenzmcLang: {self.sample_count} sampel, "
+            f"interval {self.interval * 1000:.1f} ms, durasi {self.duration:.3f} s",
+        ]
+
+        def function_rows(jit):
+            keys = [key for key in self.function_total if key[1] is jit]
+            keys.sort(key=lambda key: self.function_total[key], reverse=True)
+            return [
+                _row(self.function_self[key], self.function_total[key], total, key[0])
+                for key in keys[:limit]
+            ]
+
+        lines.append("")
+        lines.append("Fungsi (urut berdasarkan waktu total):")
+        lines.append(_HEADER + "Fungsi")
+        lines.extend(function_rows(False))
+
+        jit_rows = function_rows(True)
+        if jit_rows:
+            lines.append("")
+            lines.append("Fungsi JIT:")
+            lines.append(_HEADER + "Fungsi")
+            lines.extend(jit_rows)
+
+        locations = sorted(
+            self.line_total,
+            key=lambda key: (self.line_self.get(key, 0.0), self.line_total[key]),
+            reverse=True,
+        )
+        lines.append("")
+        lines.append("Baris (urut berdasarkan waktu self):")
+        lines.append(_HEADER + "Lokasi")
+        for file, line, function in locations[:limit]:
+            key = (file, line, function)
+            label = f"{self._display_path(file)}:{line} ({function})"
+            lines.append(_row(self.line_self.get(key, 0.0), self.line_total[key], total, label))
+
+        return "\n".join(lines)
+
+
+_HEADER = f"{'self (s)':>10} {'self %':>7} {'total (s)':>10} {'total %':>7}  "
+
+
+def _row(self_time, total_time, sampled, label):
+    return (
+        f"{self_time:>10.3f} {self_time / sampled * 100:>6.1f}% "
+        f"{total_time:>10.3f} {total_time / sampled * 100:>6.1f}%  {label}"
+    )
+
+
+def _interpreter_codes():
+    """
+    Code objects that mark AST evaluation, function calls and JIT frames.
+
+    Unwrapped so that an active tracer's wrappers do not hide the originals.
+    """
+    from renzmc.core.base_visitor import NodeVisitor
+    from renzmc.core.interpreter.methods.class_visitors import ClassVisitorsMixin
+    from renzmc.core.interpreter.methods.execution_helpers import ExecutionHelpersMixin
+
+    try:
+        from renzmc.jit.compiler import JITCompiler
+
+        jit_file = JITCompiler.__init__.__code__.co_filename
+    except ImportError:
+        jit_file = None
+    return (
+        inspect.unwrap(NodeVisitor.visit).__code__,
+        inspect.unwrap(ExecutionHelpersMixin._execute_user_function).__code__,
+        inspect.unwrap(ClassVisitorsMixin._execute_user_method).__code__,
+        jit_file,
+    )
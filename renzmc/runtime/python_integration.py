@@ -24,22 +24,273 @@ SOFTWARE.
 """
 
 import builtins as py_builtins
+import copy as py_copy
 import importlib
 import sys
+import types as module_types
+import weakref
+from collections.abc import MutableMapping, MutableSequence
 
 from renzmc.core.error import (
     RenzmcAttributeError,
     RenzmcImportError,
     RenzmcTypeError,
 )
+from renzmc.runtime.numeric_array import Larik, from_ndarray
+
+# Values that cross the interop boundary unchanged in both directions
+_PLAIN_TYPES = frozenset((int, float, str, bool, bytes, type(None)))
+
+CONVERSION_MODES = ("eager", "lazy")
+
+
+def _identity(obj):
+    return obj
+
+
+def _is_ndarray(obj):
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def _is_plain_sequence(items):
+    return all(type(item) in _PLAIN_TYPES for item in items)
+
+
+def _is_plain_mapping(mapping):
+    return _is_plain_sequence(mapping) and _is_plain_sequence(mapping.values())
+
+
+class PythonListView(MutableSequence):
+    """
+    Lazy copy-on-write view of a Python list.
+
+    Items are converted to RenzmcLang values only when they are read. The
+    first write converts the list into a private copy, so the Python list is
+    never modified from RenzmcLang code. A view that was never written to
+    is passed back to Python as the original list.
+
+    A view is a ``MutableSequence`` but not a ``list`` instance. Index
+    assignment and the list builtins accept it; ``list`` type hints do not,
+    and ``copy()`` (``salin`` in RenzmcLang) returns a real list.
+    """
+
+    __slots__ = ("_source", "_integration", "_copy", "_children")
+
+    def __init__(self, source, integration_manager):
+        self._source = source
+        self._integration = integration_manager
+        self._copy = None
+        # Nested views handed out before the first write, so writes made
+        # through them are kept when this view is materialized
+        self._children = {}
+
+    def _materialize(self):
+        if self._copy is None:
+            convert = self._integration.convert_python_to_renzmc
+            children = self._children
+            self._copy = [
+                children[index] if index in children else convert(item)
+                for index, item in enumerate(self._source)
+            ]
+            self._children = {}
+        return self._copy
+
+    def _is_modified(self):
+        return self._copy is not None or any(
+            child._is_modified() for child in self._children.values()
+        )
+
+    def _to_python(self):
+        if not self._is_modified():
+            return self._source
+        self._materialize()
+        return [self._integration.convert_renzmc_to_python(item) for item in self._copy]
+
+    def __getitem__(self, index):
+        if self._copy is not None:
+            return self._copy[index]
+        if isinstance(index, slice):
+            return PythonListView(self._source[index], self._integration)
+        if index < 0:
+            # Children are keyed by position, whichever end it was read from
+            index += len(self._source)
+        if index in self._children:
+            return self._children[index]
+        item = self._integration.convert_python_to_renzmc(self._source[index])
+        if isinstance(item, (PythonListView, PythonDictView)):
+            self._children[index] = item
+        return item
+
+    def __setitem__(self, index, value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self._materialize()[index]
+
+    def __len__(self):
+        return len(self._source if self._copy is None else self._copy)
+
+    def __iter__(self):
+        if self._copy is not None or self._children:
+            return iter(self._materialize())
+        return map(self._integration.convert_python_to_renzmc, self._source)
+
+    def insert(self, index, value):
+        self._materialize().insert(index, value)
+
+    def sort(self, *args, **kwargs):
+        self._materialize().sort(*args, **kwargs)
+
+    def copy(self):
+        return list(self)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return py_copy.deepcopy(self.copy(), memo)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, PythonListView)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    __hash__ = None
+
+
+class PythonDictView(MutableMapping):
+    """
+    Lazy copy-on-write view of a Python dict.
+
+    Keys and values are converted on access. The first write converts the
+    dict into a private copy; an untouched view is passed back to Python as
+    the original dict.
+
+    Like ``PythonListView`` it is a ``MutableMapping`` rather than a ``dict``
+    instance, so ``dict`` type hints do not accept it; ``copy()`` returns a
+    real dict.
+    """
+
+    __slots__ = ("_source", "_integration", "_copy", "_children")
+
+    def __init__(self, source, integration_manager):
+        self._source = source
+        self._integration = integration_manager
+        self._copy = None
+        # Nested views handed out before the first write, so writes made
+        # through them are kept when this view is materialized
+        self._children = {}
+
+    def _materialize(self):
+        if self._copy is None:
+            convert = self._integration.convert_python_to_renzmc
+            children = self._children
+            self._copy = {
+                convert(k): children[k] if k in children else convert(v)
+                for k, v in self._source.items()
+            }
+            self._children = {}
+        return self._copy
+
+    def _is_modified(self):
+        return self._copy is not None or any(
+            child._is_modified() for child in self._children.values()
+        )
+
+    def _to_python(self):
+        if not self._is_modified():
+            return self._source
+        self._materialize()
+        convert = self._integration.convert_renzmc_to_python
+        return {convert(k): convert(v) for k, v in self._copy.items()}
+
+    def __getitem__(self, key):
+        if self._copy is not None:
+            return self._copy[key]
+        key = self._integration.convert_renzmc_to_python(key)
+        if key in self._children:
+            return self._children[key]
+        item = self._integration.convert_python_to_renzmc(self._source[key])
+        if isinstance(item, (PythonListView, PythonDictView)):
+            self._children[key] = item
+        return item
+
+    def __setitem__(self, key, value):
+        self._materialize()[key] = value
+
+    def __delitem__(self, key):
+        del self._materialize()[key]
+
+    def __len__(self):
+        return len(self._source if self._copy is None else self._copy)
+
+    def __iter__(self):
+        if self._copy is not None or self._children:
+            return iter(self._materialize())
+        return map(self._integration.convert_python_to_renzmc, self._source)
+
+    def __contains__(self, key):
+        if self._copy is not None:
+            return key in self._copy
+        try:
+            return self._integration.convert_renzmc_to_python(key) in self._source
+        except TypeError:
+            return False
+
+    def copy(self):
+        return dict(self.items())
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return py_copy.deepcopy(self.copy(), memo)
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, PythonDictView)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    __hash__ = None
+
+
+# Submodule names whose import already failed
+_failed_imports = set()
+
+
+def import_submodule(full_name):
+    """
+    Import ``full_name`` and return it, or None if it cannot be imported.
+
+    Failures are remembered so repeated misses do not hit the import system
+    again; ``PythonModule.invalidate`` forgets them for its package.
+    """
+    if full_name in _failed_imports:
+        return None
+    try:
+        return importlib.import_module(full_name)
+    except ImportError:
+        _failed_imports.add(full_name)
+        return None
 
 
 class SmartPythonWrapper:
 
     def __init__(self, obj, integration_manager):
-        self._obj = obj
-        self._integration = integration_manager
-        self._obj_type = type(obj).__name__
+        # Bypass __setattr__, which would otherwise run for every field
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_integration", integration_manager)
+        object.__setattr__(self, "_obj_type", type(obj).__name__)
 
     def __getattr__(self, name):
         try:
@@ -472,6 +723,18 @@ class SmartPythonWrapper:
 
 
 class PythonModule:
+    """
+    RenzmcLang view of a Python module.
+
+    Wrappers are interned per module through ``for_module``. Callable
+    attributes and submodules are resolved once and then stored on the
+    wrapper itself, so ``math.sqrt`` in a loop is a plain instance dict hit;
+    failed submodule imports are remembered as well. ``invalidate`` drops
+    everything after the module is reloaded.
+    """
+
+    # Wrappers by module identity; each wrapper keeps its module alive
+    _instances = {}
 
     def __init__(self, module):
         self._module = module
@@ -479,16 +742,51 @@ class PythonModule:
         self._cached_attributes = {}
         self._submodule_cache = {}
 
+    @classmethod
+    def for_module(cls, module):
+        """Return the shared wrapper for ``module``."""
+        wrapper = cls._instances.get(id(module))
+        if wrapper is None or wrapper._module is not module:
+            wrapper = cls(module)
+            cls._instances[id(module)] = wrapper
+        return wrapper
+
     def __getattr__(self, name):
         try:
             attr = getattr(self._module, name)
-            if hasattr(attr, "__name__") and hasattr(attr, "__file__"):
-                return PythonModule(attr)
-            return attr
         except AttributeError:
-            raise RenzmcAttributeError(
-                f"Modul Python '{self._module_name}' tidak memiliki atribut '{name}'"
-            )
+            attr = self._import_submodule(name)
+            if attr is None:
+                raise RenzmcAttributeError(
+                    f"Modul Python '{self._module_name}' tidak memiliki atribut '{name}'"
+                )
+        if hasattr(attr, "__name__") and hasattr(attr, "__file__"):
+            attr = PythonModule.for_module(attr)
+        if callable(attr):
+            # Plain values are re-read each time since modules may rebind them
+            self.__dict__[name] = attr
+            self._cached_attributes[name] = attr
+        return attr
+
+    def _import_submodule(self, name):
+        if name in self._submodule_cache:
+            return self._submodule_cache[name]
+        submodule = None
+        if hasattr(self._module, "__path__"):
+            submodule = import_submodule(f"{self._module_name}.{name}")
+        self._submodule_cache[name] = submodule
+        return submodule
+
+    def invalidate(self):
+        """Forget cached attributes and submodule lookups."""
+        for name in self._cached_attributes:
+            self.__dict__.pop(name, None)
+        self._cached_attributes.clear()
+        self._submodule_cache.clear()
+        prefix = f"{self._module_name}."
+        _failed_imports.difference_update(
+            [name for name in _failed_imports if name.startswith(prefix)]
+        )
 
     def __getitem__(self, key):
         try:
@@ -545,10 +843,34 @@ class PythonModule:
 
 class PythonIntegration:
 
-    def __init__(self):
+    def __init__(self, conversion_mode="eager"):
         self.imported_modules = {}
         self.module_aliases = {}
         self.from_imports = {}
+        self.conversion_mode = conversion_mode
+        # User converters by type, and the strategy memoized per type
+        self._converters = {}
+        self._strategies = {}
+        self._wrappers = weakref.WeakValueDictionary()
+
+    def set_conversion_mode(self, mode):
+        """
+        Choose how Python lists and dicts are converted to RenzmcLang.
+
+        ``"eager"`` converts them into new RenzmcLang containers, so neither
+        side sees the other's later changes; containers holding only plain
+        values (numbers, text, booleans, bytes, None) are copied in one step
+        instead of item by item. ``"lazy"`` returns copy-on-write views that
+        convert items only when accessed and hands RenzmcLang containers to
+        Python as they are, so Python code that mutates its arguments
+        changes the RenzmcLang value.
+        """
+        if mode not in CONVERSION_MODES:
+            raise RenzmcTypeError(
+                f"Mode konversi '{mode}' tidak dikenal, gunakan salah satu dari: "
+                f"{', '.join(CONVERSION_MODES)}"
+            )
+        self.conversion_mode = mode
 
     def setup_python_builtins(self, global_scope):
         for name in dir(py_builtins):
@@ -573,7 +895,7 @@ class PythonIntegration:
                         )
                 self.from_imports[module_name] = imported_items
                 return imported_items
-            wrapped_module = PythonModule(module)
+            wrapped_module = PythonModule.for_module(module)
             if alias:
                 self.module_aliases[alias] = wrapped_module
             return wrapped_module
@@ -657,9 +979,9 @@ class PythonIntegration:
             if module_name not in self.imported_modules:
                 module = importlib.import_module(module_name)
                 self.imported_modules[module_name] = module
-                return PythonModule(module)
+                return PythonModule.for_module(module)
             else:
-                return PythonModule(self.imported_modules[module_name])
+                return PythonModule.for_module(self.imported_modules[module_name])
         except ImportError:
             return None
 
@@ -694,7 +1016,9 @@ class PythonIntegration:
             if module_name in self.imported_modules:
                 module = importlib.reload(self.imported_modules[module_name])
                 self.imported_modules[module_name] = module
-                return PythonModule(module)
+                wrapper = PythonModule.for_module(module)
+                wrapper.invalidate()
+                return wrapper
             else:
                 raise RenzmcImportError(f"Modul Python '{module_name}' belum diimpor")
         except Exception as e:
@@ -746,7 +1070,7 @@ class PythonIntegration:
             else:
                 module = importlib.import_module(full_name)
                 self.imported_modules[full_name] = module
-            return PythonModule(module)
+            return PythonModule.for_module(module)
         except ImportError as e:
             raise RenzmcImportError(
                 f"Tidak dapat mengimpor submodul '{submodule_name}' dari '{parent_module}': {str(e)}"
@@ -772,89 +1096,139 @@ class PythonIntegration:
         except Exception as e:
             raise Exception(f"Error saat evaluasi ekspresi Python: {str(e)}")
 
+    def register_converter(self, py_type, converter):
+        """
+        Register a converter for values of ``py_type`` coming from Python.
+
+        The converter is called with the Python value and returns the value
+        RenzmcLang code sees. It also applies to subclasses of ``py_type``
+        that have no converter of their own.
+        """
+        if not isinstance(py_type, type):
+            raise RenzmcTypeError("Konverter hanya dapat didaftarkan untuk sebuah tipe Python")
+        if not callable(converter):
+            raise RenzmcTypeError("Konverter harus berupa fungsi yang dapat dipanggil")
+        self._converters[py_type] = converter
+        self._strategies.clear()
+
+    def unregister_converter(self, py_type):
+        """Remove the converter registered for ``py_type``."""
+        removed = self._converters.pop(py_type, None) is not None
+        if removed:
+            self._strategies.clear()
+        return removed
+
     def convert_python_to_renzmc(self, obj):
-        if obj is None:
-            return None
-        if isinstance(obj, (int, float, str, bool, bytes)):
-            return obj
+        obj_type = type(obj)
+        strategy = self._strategies.get(obj_type)
+        if strategy is None:
+            strategy, cacheable = self._resolve_strategy(obj)
+            if cacheable:
+                self._strategies[obj_type] = strategy
+        return strategy(obj)
+
+    def _resolve_strategy(self, obj):
+        """
+        Pick the conversion strategy for ``obj``.
+
+        Returns:
+            Tuple ``(strategy, cacheable)``; the strategy depends only on
+            ``type(obj)`` unless ``cacheable`` is False
+        """
+        obj_type = type(obj)
+        for base in obj_type.__mro__:
+            converter = self._converters.get(base)
+            if converter is not None:
+                return converter, True
+        if obj is None or isinstance(obj, (int, float, str, bool, bytes)):
+            return _identity, True
+        if isinstance(obj, module_types.ModuleType):
+            return PythonModule.for_module, True
         if self._is_module_object(obj):
-            return PythonModule(obj)
+            # Module-like instance attributes, not a property of the type
+            return PythonModule.for_module, False
         if isinstance(obj, type):
-            return self.create_smart_wrapper(obj)
+            return self.create_smart_wrapper, True
+        if isinstance(obj, (PythonListView, PythonDictView)):
+            return _identity, True
+        if _is_ndarray(obj):
+            return self._convert_ndarray, True
         if hasattr(obj, "__iter__") and hasattr(obj, "__next__"):
+            return self.create_smart_wrapper, True
+        if hasattr(obj, "__iter__"):
+            if isinstance(obj, dict):
+                return self._convert_dict, True
+            if isinstance(obj, list):
+                return self._convert_list, True
+            if isinstance(obj, tuple):
+                return self._convert_tuple, True
+            if isinstance(obj, set):
+                return self._convert_set, True
+            return self.create_smart_wrapper, True
+        if callable(obj):
+            return self._wrap_callable, True
+        return self.create_smart_wrapper, True
+
+    def _convert_ndarray(self, obj):
+        adopted = from_ndarray(obj)
+        return self.create_smart_wrapper(obj) if adopted is None else adopted
+
+    def _convert_dict(self, obj):
+        if self.conversion_mode == "lazy":
+            return PythonDictView(obj, self)
+        if _is_plain_mapping(obj):
+            return dict(obj)
+        try:
+            return {
+                self.convert_python_to_renzmc(k): self.convert_python_to_renzmc(v)
+                for k, v in obj.items()
+            }
+        except (TypeError, RecursionError):
             return self.create_smart_wrapper(obj)
-        if hasattr(obj, "__iter__") and (not isinstance(obj, (str, bytes))):
-            try:
-                if isinstance(obj, dict):
-                    return {
-                        self.convert_python_to_renzmc(k): self.convert_python_to_renzmc(v)
-                        for k, v in obj.items()
-                    }
-                elif isinstance(obj, list):
-                    return [self.convert_python_to_renzmc(item) for item in obj]
-                elif isinstance(obj, tuple):
-                    return tuple((self.convert_python_to_renzmc(item) for item in obj))
-                elif isinstance(obj, set):
-                    return {self.convert_python_to_renzmc(item) for item in obj}
-                else:
-                    return self.create_smart_wrapper(obj)
-            except (TypeError, RecursionError):
-                return self.create_smart_wrapper(obj)
-        if callable(obj) and (not isinstance(obj, type)):
-
-            def enhanced_wrapper(*args, **kwargs):
-                try:
-                    py_args = [self.convert_renzmc_to_python(arg) for arg in args]
-                    py_kwargs = {k: self.convert_renzmc_to_python(v) for k, v in kwargs.items()}
-                    result = obj(*py_args, **py_kwargs)
-                    return self.convert_python_to_renzmc(result)
-                except Exception as e:
-                    raise RenzmcTypeError(f"Error dalam pemanggilan fungsi Python: {str(e)}")
 
-            try:
-                enhanced_wrapper.__name__ = getattr(obj, "__name__", "python_function")
-                enhanced_wrapper.__doc__ = getattr(obj, "__doc__", None)
-            except (TypeError, AttributeError):
-                pass
-            return enhanced_wrapper
-        if hasattr(obj, "__dict__") or hasattr(obj, "__getattr__"):
-            return self.create_smart_wrapper(obj)
-        special_methods = [
-            "__getitem__",
-            "__setitem__",
-            "__len__",
-            "__contains__",
-            "__enter__",
-            "__exit__",
-            "__add__",
-            "__sub__",
-            "__mul__",
-            "__call__",
-            "__getattribute__",
-            "__delattr__",
-            "__hash__",
-            "__repr__",
-            "__str__",
-            "__bool__",
-            "__format__",
-            "__sizeof__",
-        ]
-        if any((hasattr(obj, method) for method in special_methods)):
-            return self.create_smart_wrapper(obj)
-        if self._is_coroutine_or_async(obj):
-            return self.create_smart_wrapper(obj)
-        if self._is_file_like(obj):
-            return self.create_smart_wrapper(obj)
-        if isinstance(obj, BaseException):
-            return self.create_smart_wrapper(obj)
+    def _convert_list(self, obj):
+        if self.conversion_mode == "lazy":
+            return PythonListView(obj, self)
+        if _is_plain_sequence(obj):
+            return list(obj)
         try:
-            import json
+            return [self.convert_python_to_renzmc(item) for item in obj]
+        except RecursionError:
+            return self.create_smart_wrapper(obj)
 
-            json.dumps(obj)
+    def _convert_tuple(self, obj):
+        if _is_plain_sequence(obj):
             return obj
-        except (TypeError, ValueError):
+        try:
+            return tuple((self.convert_python_to_renzmc(item) for item in obj))
+        except RecursionError:
+            return self.create_smart_wrapper(obj)
+
+    def _convert_set(self, obj):
+        if _is_plain_sequence(obj):
+            return set(obj)
+        try:
+            return {self.convert_python_to_renzmc(item) for item in obj}
+        except (TypeError, RecursionError):
             return self.create_smart_wrapper(obj)
 
+    def _wrap_callable(self, obj):
+        def enhanced_wrapper(*args, **kwargs):
+            try:
+                py_args = [self.convert_renzmc_to_python(arg) for arg in args]
+                py_kwargs = {k: self.convert_renzmc_to_python(v) for k, v in kwargs.items()}
+                result = obj(*py_args, **py_kwargs)
+                return self.convert_python_to_renzmc(result)
+            except Exception as e:
+                raise RenzmcTypeError(f"Error dalam pemanggilan fungsi Python: {str(e)}")
+
+        try:
+            enhanced_wrapper.__name__ = getattr(obj, "__name__", "python_function")
+            enhanced_wrapper.__doc__ = getattr(obj, "__doc__", None)
+        except (TypeError, AttributeError):
+            pass
+        return enhanced_wrapper
+
     def convert_renzmc_to_python(self, obj):
         if obj is None:
             return None
@@ -864,18 +1238,34 @@ class PythonIntegration:
             return obj._obj
         if isinstance(obj, PythonModule):
             return obj._module
+        if isinstance(obj, (PythonListView, PythonDictView)):
+            return obj._to_python()
+        if isinstance(obj, Larik):
+            return obj.ke_python()
+        if self.conversion_mode == "lazy" and type(obj) in (list, dict, tuple, set):
+            # Containers are handed over as they are; wrappers nested inside
+            # still proxy attribute access and calls to the Python object
+            return obj
         if hasattr(obj, "__iter__") and (not isinstance(obj, (str, bytes))):
             try:
                 if isinstance(obj, dict):
+                    if _is_plain_mapping(obj):
+                        return dict(obj)
                     return {
                         self.convert_renzmc_to_python(k): self.convert_renzmc_to_python(v)
                         for k, v in obj.items()
                     }
                 elif isinstance(obj, list):
+                    if _is_plain_sequence(obj):
+                        return list(obj)
                     return [self.convert_renzmc_to_python(item) for item in obj]
                 elif isinstance(obj, tuple):
+                    if _is_plain_sequence(obj):
+                        return obj
                     return tuple((self.convert_renzmc_to_python(item) for item in obj))
                 elif isinstance(obj, set):
+                    if _is_plain_sequence(obj):
+                        return set(obj)
                     return {self.convert_renzmc_to_python(item) for item in obj}
                 else:
                     try:
@@ -891,7 +1281,12 @@ class PythonIntegration:
         return obj
 
     def create_smart_wrapper(self, obj):
-        return SmartPythonWrapper(obj, self)
+        # One proxy per live object; the entry goes away with the proxy
+        wrapper = self._wrappers.get(id(obj))
+        if wrapper is None or wrapper._obj is not obj:
+            wrapper = SmartPythonWrapper(obj, self)
+            self._wrappers[id(obj)] = wrapper
+        return wrapper
 
     def enable_star_imports(self, module_name, global_scope):
         try:
@@ -927,8 +1322,6 @@ class PythonIntegration:
             return True
         if hasattr(obj, "__name__") and hasattr(obj, "__package__"):
             return True
-        import types as module_types
-
         return isinstance(obj, module_types.ModuleType)
 
     def _is_coroutine_or_async(self, obj):
@@ -24,23 +24,139 @@ SOFTWARE.
 """
 
 import os
-
+from threading import Lock
+
+from renzmc.core.ast import (
+    AsyncFuncDecl,
+    ClassDecl,
+    Decorator,
+    FromImport,
+    FuncDecl,
+    Import,
+    MultiVarDecl,
+    Program,
+    PythonImport,
+    TypeAlias,
+    VarDecl,
+)
 from renzmc.core.error import (
     RenzmcImportError,
     RenzmcNameError,
 )
+from renzmc.runtime.module_resolver import MODULE_EXTENSIONS, ModuleResolver
+
+_MISSING = object()
+
+# Top-level statements re-executed when a module is hot reloaded
+_DEFINITION_NODES = (
+    FuncDecl,
+    AsyncFuncDecl,
+    ClassDecl,
+    Decorator,
+    VarDecl,
+    MultiVarDecl,
+    TypeAlias,
+    Import,
+    FromImport,
+    PythonImport,
+)
+
+
+class ParsedModuleCache:
+    """
+    Process-wide cache of parsed RenzmcLang modules.
+
+    Entries are keyed by absolute file path and remember the file's
+    modification time and size, so a module is read, lexed and parsed once
+    per version no matter how many interpreters import it.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _file_signature(module_path):
+        stat = os.stat(module_path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, module_path):
+        module_path = os.path.abspath(module_path)
+        try:
+            signature = self._file_signature(module_path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(module_path)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+        return None
+
+    def put(self, module_path, ast, signature=None):
+        module_path = os.path.abspath(module_path)
+        if signature is None:
+            signature = self._file_signature(module_path)
+        with self._lock:
+            self._entries[module_path] = (signature, ast)
+
+    def load(self, module_path):
+        ast = self.get(module_path)
+        if ast is not None:
+            return ast
+
+        from renzmc.core.lexer import Lexer
+        from renzmc.core.parser import Parser
+
+        self.misses += 1
+        signature = self._file_signature(module_path)
+        with open(module_path, "r", encoding="utf-8") as f:
+            module_code = f.read()
+        ast = Parser(Lexer(module_code)).parse()
+        self.put(module_path, ast, signature)
+        return ast
+
+    def signature(self, module_path):
+        """Return the (mtime, size) signature of the cached parse, if any."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(module_path))
+        return entry[0] if entry is not None else None
+
+    def invalidate(self, module_path=None):
+        with self._lock:
+            if module_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(module_path), None)
+
+    def get_stats(self):
+        with self._lock:
+            size = len(self._entries)
+        return {"entries": size, "hits": self.hits, "misses": self.misses}
+
+
+parsed_module_cache = ParsedModuleCache()
 
 
 class RenzmcModule:
 
-    def __init__(self, module_path, module_name, module_dict):
+    def __init__(self, module_path, module_name, module_dict, builtin_functions=None):
         self.module_path = module_path
         self.module_name = module_name
         self._module_dict = module_dict
+        self._builtin_functions = builtin_functions or {}
+        self._interpreter = None
+        self._preloaded = {}
+        self._signature = None
+        self._categorize()
+
+    def _categorize(self):
         self._classes = {}
         self._functions = {}
         self._variables = {}
-        for name, value in module_dict.items():
+        for name, value in self._module_dict.items():
             if hasattr(value, "__class__") and value.__class__.__name__ == "RenzmcClass":
                 self._classes[name] = value
             elif callable(value):
@@ -69,6 +185,33 @@ class RenzmcModule:
             "variables": list(self._variables.keys()),
         }
 
+    def _update(self, module_dict):
+        """Update the module namespace in place after a hot reload."""
+        self._module_dict.update(module_dict)
+        self._categorize()
+
+    def get_exports(self):
+        """
+        Return the names ``impor modul`` copies into the importing scope.
+
+        Private (``_``) and Python builtin (``py_``) names are skipped, as are
+        values that are the very same object as the builtin of that name.
+        """
+        exports = {}
+        for name, value in self._module_dict.items():
+            if name.startswith("_") or name.startswith("py_"):
+                continue
+            if self._builtin_functions.get(name) is value:
+                continue
+            exports[name] = value
+        return exports
+
+    def __getitem__(self, key):
+        return self._module_dict[key]
+
+    def __contains__(self, key):
+        return key in self._module_dict
+
 
 class RenzmcModuleManager:
 
@@ -76,7 +219,9 @@ class RenzmcModuleManager:
         self.interpreter = interpreter_instance
         self.loaded_modules = {}
         self.module_search_paths = []
-        self.module_cache = {}
+        self.module_cache = parsed_module_cache
+        self._modules_by_path = {}
+        self.resolver = ModuleResolver(self.module_search_paths)
         self.add_search_path(".")
         self.add_search_path("./lib")
         self.add_search_path("./modules")
@@ -85,6 +230,7 @@ class RenzmcModuleManager:
         abs_path = os.path.abspath(path)
         if abs_path not in self.module_search_paths:
             self.module_search_paths.append(abs_path)
+            self.resolver.invalidate()
 
     def find_module(self, module_name):
         """
@@ -92,26 +238,17 @@ class RenzmcModuleManager:
         Examples:
         - "math_utils" -> searches for "math_utils.rmc"
         - "Ren.renz" -> searches for "Ren/renz.rmc"
-        """
-        extensions = [".rmc", ".renzmc"]
-
-        # Convert dot-separated module name to path
-        # e.g., "Ren.renz" becomes "Ren/renz"
-        module_path = module_name.replace(".", os.sep)
 
-        for search_path in self.module_search_paths:
-            for ext in extensions:
-                # Try direct file path
-                module_file = os.path.join(search_path, f"{module_path}{ext}")
-                if os.path.isfile(module_file):
-                    return module_file
-
-                # Try as package with __init__ file
-                package_init = os.path.join(search_path, module_path, f"__init__{ext}")
-                if os.path.isfile(package_init):
-                    return package_init
+        Lookups go through the search path index, so each directory is
+        scanned once and re-scanned only when its mtime changes.
+        """
+        return self.resolver.resolve(module_name)
 
-        return None
+    def explain_import(self, module_name):
+        """
+        Explain how ``module_name`` would be resolved, for ``rmc --explain-import``.
+        """
+        return self.resolver.explain(module_name)
 
     def load_module(self, module_name, alias=None):
         cache_key = alias or module_name
@@ -120,46 +257,135 @@ class RenzmcModuleManager:
         module_path = self.find_module(module_name)
         if not module_path:
             raise RenzmcImportError(f"Tidak dapat menemukan modul RenzmcLang '{module_name}'")
-        try:
-            with open(module_path, "r", encoding="utf-8") as f:
-                module_code = f.read()
+        module_obj = self.load_module_from_path(module_path, module_name)
+        self.loaded_modules[cache_key] = module_obj
+        return module_obj
 
-            # Save old scopes
-            old_global_scope = self.interpreter.global_scope.copy()
-            old_local_scope = self.interpreter.local_scope.copy()
-
-            # Create a new temporary global scope for the module
-            module_scope = {}
-            self.interpreter.global_scope = module_scope
-            self.interpreter.local_scope = module_scope
+    def load_module_from_path(self, module_path, module_name):
+        """
+        Execute the module file at ``module_path`` once per interpreter.
 
-            from renzmc.core.lexer import Lexer
-            from renzmc.core.parser import Parser
+        The parsed AST comes from the process-wide ``parsed_module_cache`` and
+        the module runs in a module interpreter that shares the host
+        interpreter's runtime managers, so importing a module costs its own
+        code only. A file reached under several names is executed once.
+        """
+        module_path = os.path.abspath(module_path)
+        if module_path in self._modules_by_path:
+            return self._modules_by_path[module_path]
+        try:
+            ast = self.module_cache.load(module_path)
+            module_interpreter = self.interpreter._create_module_interpreter(module_path)
+            preloaded = dict(module_interpreter.global_scope)
+            module_interpreter.visit(ast)
+            module_scope = self._module_scope(module_interpreter, preloaded)
+        except RenzmcImportError:
+            raise
+        except Exception as e:
+            raise RenzmcImportError(f"Error memuat modul '{module_name}': {str(e)}")
+        module_obj = RenzmcModule(
+            module_path, module_name, module_scope, self.interpreter.builtin_functions
+        )
+        module_obj._interpreter = module_interpreter
+        module_obj._preloaded = preloaded
+        module_obj._signature = self.module_cache.signature(module_path)
+        self._modules_by_path[module_path] = module_obj
+        return module_obj
+
+    @staticmethod
+    def _module_scope(module_interpreter, preloaded):
+        # Only names bound by the module itself belong to it
+        return {
+            name: value
+            for name, value in module_interpreter.global_scope.items()
+            if preloaded.get(name, _MISSING) is not value
+        }
 
-            # Create a fresh lexer for the parser
-            lexer = Lexer(module_code)
-            parser = Parser(lexer)
-            ast = parser.parse()
-            self.interpreter.visit(ast)
+    def changed_modules(self):
+        """
+        Return the loaded modules whose file changed since they were loaded.
+        """
+        changed = []
+        for module_path, module_obj in list(self._modules_by_path.items()):
+            try:
+                stat = os.stat(module_path)
+            except OSError:
+                continue
+            if (stat.st_mtime_ns, stat.st_size) != module_obj._signature:
+                changed.append(module_obj)
+        return changed
+
+    def refresh_module(self, module_obj):
+        """
+        Hot reload a loaded module in place.
 
-            # Capture everything that was added to the module scope
-            module_obj = RenzmcModule(module_path, module_name, module_scope)
-            self.loaded_modules[cache_key] = module_obj
+        The changed file is re-parsed and only its top-level definitions are
+        executed again, inside the module's own interpreter. Functions keep
+        their identity and receive the new body, so names imported elsewhere
+        with ``dari ... impor`` see the change; classes are updated in place,
+        so existing instances call the new methods. Inline and JIT caches of
+        the affected functions are invalidated.
 
-            # Restore old scopes
-            self.interpreter.global_scope = old_global_scope
-            self.interpreter.local_scope = old_local_scope
+        Returns:
+            The refreshed module
+        """
+        module_interpreter = module_obj._interpreter
+        if module_interpreter is None:
+            return self.reload_module(module_obj.module_name)
 
-            return module_obj
+        try:
+            ast = self.module_cache.load(module_obj.module_path)
+            definitions = [
+                statement
+                for statement in ast.statements
+                if isinstance(statement, _DEFINITION_NODES)
+            ]
+            module_interpreter._reloading_module = True
+            try:
+                module_interpreter.visit(Program(definitions))
+            finally:
+                module_interpreter._reloading_module = False
         except Exception as e:
-            raise RenzmcImportError(f"Error memuat modul '{module_name}': {str(e)}")
+            raise RenzmcImportError(
+                f"Error memuat ulang modul '{module_obj.module_name}': {str(e)}"
+            )
+
+        module_obj._update(self._module_scope(module_interpreter, module_obj._preloaded))
+        module_obj._signature = self.module_cache.signature(module_obj.module_path)
+
+        for statement in definitions:
+            name = getattr(statement, "name", None)
+            if name is None:
+                continue
+            module_interpreter.jit_compiled_functions.pop(name, None)
+            if module_interpreter.jit_compiler is not None:
+                module_interpreter.jit_compiler.invalidate(name)
+            if name in module_interpreter.jit_call_counts:
+                module_interpreter.jit_call_counts[name] = 0
+                module_interpreter.jit_execution_times[name] = 0.0
+        module_interpreter.scope_manager.inline_cache.clear()
+        self.interpreter.scope_manager.inline_cache.clear()
+        return module_obj
+
+    def refresh_changed_modules(self):
+        """
+        Hot reload every loaded module whose file changed.
+
+        Returns:
+            List of names of the reloaded modules
+        """
+        reloaded = []
+        for module_obj in self.changed_modules():
+            self.refresh_module(module_obj)
+            reloaded.append(module_obj.module_name)
+        return reloaded
 
     def import_from_module(self, module_name, items):
         module = self.load_module(module_name)
         imported_items = {}
         for item in items:
-            if hasattr(module, item):
-                imported_items[item] = getattr(module, item)
+            if item in module:
+                imported_items[item] = module[item]
             else:
                 raise RenzmcImportError(
                     f"Tidak dapat mengimpor '{item}' dari modul '{module_name}'"
@@ -186,8 +412,16 @@ class RenzmcModuleManager:
         return None
 
     def reload_module(self, module_name):
-        if module_name in self.loaded_modules:
-            del self.loaded_modules[module_name]
+        module = self.loaded_modules.get(module_name)
+        if module is not None and module._interpreter is not None:
+            return self.refresh_module(module)
+        self.loaded_modules.pop(module_name, None)
+        module_path = module.module_path if module else self.find_module(module_name)
+        if module_path:
+            module_path = os.path.abspath(module_path)
+            self._modules_by_path.pop(module_path, None)
+            self.module_cache.invalidate(module_path)
+        self.resolver.invalidate(module_name)
         return self.load_module(module_name)
 
     def resolve_relative_import(self, module_name, relative_level, current_file_path):
@@ -212,23 +446,9 @@ class RenzmcModuleManager:
         for _ in range(relative_level):
             current_dir = os.path.dirname(current_dir)
 
-        # If module_name is provided, append it
-        if module_name:
-            module_path = os.path.join(current_dir, module_name.replace(".", os.sep))
-        else:
-            module_path = current_dir
-
-        # Try to find the module file
-        extensions = [".rmc", ".renzmc"]
-        for ext in extensions:
-            test_path = f"{module_path}{ext}"
-            if os.path.isfile(test_path):
-                return test_path
-
-            # Try as package with __init__ file
-            init_path = os.path.join(module_path, f"__init__{ext}")
-            if os.path.isfile(init_path):
-                return init_path
+        resolved = self.resolver.resolve_in(current_dir, module_name)
+        if resolved is not None:
+            return resolved
 
         raise RenzmcImportError(
             f"Tidak dapat menemukan modul relatif: {module_name} " f"(level: {relative_level})"
@@ -259,11 +479,11 @@ class RenzmcModuleManager:
 
     def list_available_modules(self):
         modules = []
-        extensions = [".rmc", ".renzmc"]
         for search_path in self.module_search_paths:
-            if os.path.isdir(search_path):
-                for file in os.listdir(search_path):
-                    for ext in extensions:
+            listing = self.resolver.index.listing(search_path)
+            if listing is not None:
+                for file in sorted(listing[1]):
+                    for ext in MODULE_EXTENSIONS:
                         if file.endswith(ext):
                             module_name = file[: -len(ext)]
                             if module_name not in modules:
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import functools
+import json
+import time
+from collections import defaultdict
+
+_active = None
+_originals = None
+
+
+class Tracer:
+    """
+    Execution hooks and counters for the interpreter.
+
+    While a tracer is started, ``NodeVisitor.visit`` and the user function and
+    method entry points are swapped for counting wrappers at class level.
+    When no tracer is active the original methods are restored, so disabled
+    tracing costs nothing on the hot path. Only one tracer is active at a
+    time; starting another replaces it, like ``sys.settrace``.
+
+    Hooks:
+        on_call(name, args): before a user function or method runs
+        on_return(name, result, elapsed_ns): after it returns or raises
+            (``result`` is None when it raised)
+        on_line(file, line, node): when execution reaches a node on a
+            different line than the node enclosing it
+
+    All timings use ``time.perf_counter_ns``.
+    """
+
+    def __init__(self, time_nodes=False):
+        """
+        Args:
+            time_nodes: Also accumulate inclusive time per node type. This
+                adds two clock reads to every node evaluation.
+        """
+        self.time_nodes = time_nodes
+        self.node_counts = defaultdict(int)
+        self.node_time_ns = defaultdict(int)
+        self.function_calls = defaultdict(int)
+        self.function_time_ns = defaultdict(int)
+        self.line_counts = defaultdict(int)
+        self._call_hooks = []
+        self._return_hooks = []
+        self._line_hooks = []
+        self._depth = defaultdict(int)
+        self._current_line = None
+        self._started_ns = None
+        self.duration_ns = 0
+
+    def on_call(self, hook):
+        """Register ``hook(name, args)``; returns the hook so it can be used as a decorator."""
+        self._call_hooks.append(hook)
+        return hook
+
+    def on_return(self, hook):
+        """Register ``hook(name, result, elapsed_ns)``."""
+        self._return_hooks.append(hook)
+        return hook
+
+    def on_line(self, hook):
+        """Register ``hook(file, line, node)``."""
+        self._line_hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook):
+        """Unregister ``hook`` from every event it was registered for."""
+        for hooks in (self._call_hooks, self._return_hooks, self._line_hooks):
+            while hook in hooks:
+                hooks.remove(hook)
+
+    @property
+    def active(self):
+        return _active is self
+
+    def start(self):
+        """Install this tracer, replacing any other active tracer."""
+        global _active
+        if _active is self:
+            return self
+        if _active is not None:
+            _active.stop()
+        _install(self)
+        _active = self
+        self._started_ns = time.perf_counter_ns()
+        return self
+
+    def stop(self):
+        """Uninstall this tracer and restore the untraced interpreter methods."""
+        global _active
+        if _active is not self:
+            return self
+        _uninstall()
+        _active = None
+        self.duration_ns += time.perf_counter_ns() - self._started_ns
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    def reset(self):
+        """Clear all counters; hooks stay registered."""
+        for counter in (
+            self.node_counts,
+            self.node_time_ns,
+            self.function_calls,
+            self.function_time_ns,
+            self.line_counts,
+        ):
+            counter.clear()
+        self.duration_ns = 0
+        if self.active:
+            self._started_ns = time.perf_counter_ns()
+
+    def _wrappers(self):
+        """Return (class, attribute, wrapper factory) triples swapped in while active."""
+        visitor, functions, methods = entry_points()
+        return (
+            (visitor, "visit", traced_visit),
+            (functions, "_execute_user_function", traced_function),
+            (methods, "_execute_user_method", traced_method),
+        )
+
+    def to_dict(self):
+        """Return all counters as plain JSON-compatible data."""
+        duration_ns = self.duration_ns
+        if self.active:
+            duration_ns += time.perf_counter_ns() - self._started_ns
+        data = {
+            "duration_ns": duration_ns,
+            "nodes": {
+                kind: {"count": count, "time_ns": self.node_time_ns.get(kind)}
+                for kind, count in sorted(self.node_counts.items())
+            },
+            "functions": {
+                name: {"calls": calls, "time_ns": self.function_time_ns[name]}
+                for name, calls in sorted(self.function_calls.items())
+            },
+            "lines": [
+                {"file": file or "<stdin>", "line": line, "count": count}
+                for (file, line), count in self._sorted_lines()
+            ],
+        }
+        if not self.time_nodes:
+            for entry in data["nodes"].values():
+                del entry["time_ns"]
+        return data
+
+    def _sorted_lines(self):
+        return sorted(self.line_counts.items(), key=lambda item: (item[0][0] or "", item[0][1]))
+
+    def to_json(self, indent=2):
+        """Return the counters as a JSON document."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def to_prometheus(self):
+        """Return the counters in the Prometheus text exposition format."""
+        out = []
+
+        def metric(name, help_text, samples):
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} counter")
+            for labels, value in samples:
+                rendered = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels)
+                out.append(f"{name}{{{rendered}}} {value}")
+
+        metric(
+            "renzmc_node_evaluations_total",
+            "AST nodes evaluated, by node type.",
+            [((("type", kind),), count) for kind, count in sorted(self.node_counts.items())],
+        )
+        if self.time_nodes:
+            metric(
+                "renzmc_node_seconds_total",
+                "Inclusive time spent evaluating AST nodes, by node type.",
+                [
+                    ((("type", kind),), _seconds(ns))
+                    for kind, ns in sorted(self.node_time_ns.items())
+                ],
+            )
+        metric(
+            "renzmc_function_calls_total",
+            "Calls to user-defined functions and methods.",
+            [((("function", name),), calls) for name, calls in sorted(self.function_calls.items())],
+        )
+        metric(
+            "renzmc_function_seconds_total",
+            "Inclusive time in user-defined functions and methods, outermost calls only.",
+            [
+                ((("function", name),), _seconds(ns))
+                for name, ns in sorted(self.function_time_ns.items())
+            ],
+        )
+        metric(
+            "renzmc_line_executions_total",
+            "Times execution entered a source line.",
+            [
+                ((("file", file or "<stdin>"), ("line", line)), count)
+                for (file, line), count in self._sorted_lines()
+            ],
+        )
+        return "\n".join(out) + "\n"
+
+    def write(self, path):
+        """Write counters to ``path``: Prometheus text for ``.prom``/``.txt``, JSON otherwise."""
+        if path.endswith((".prom", ".txt")):
+            content = self.to_prometheus()
+        else:
+            content = self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def get_active_tracer():
+    """Return the active Tracer, or None when tracing is disabled."""
+    return _active
+
+
+def _seconds(ns):
+    return f"{ns / 1e9:.9f}"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def entry_points():
+    """Return the classes defining visit, user function and user method execution."""
+    from renzmc.core.base_visitor import NodeVisitor
+    from renzmc.core.interpreter.methods.class_visitors import ClassVisitorsMixin
+    from renzmc.core.interpreter.methods.execution_helpers import ExecutionHelpersMixin
+
+    return NodeVisitor, ExecutionHelpersMixin, ClassVisitorsMixin
+
+
+def _install(tracer):
+    global _originals
+    _originals = []
+    for owner, attr, make_wrapper in tracer._wrappers():
+        original = owner.__dict__[attr]
+        _originals.append((owner, attr, original))
+        setattr(owner, attr, make_wrapper(tracer, original))
+
+
+def _uninstall():
+    global _originals
+    for owner, attr, original in _originals or ():
+        setattr(owner, attr, original)
+    _originals = None
+
+
+def traced_visit(tracer, visit):
+    """Wrap ``visit`` to count nodes and lines and fire line hooks for ``tracer``."""
+    node_counts = tracer.node_counts
+    node_time_ns = tracer.node_time_ns
+    line_counts = tracer.line_counts
+    line_hooks = tracer._line_hooks
+    time_nodes = tracer.time_nodes
+    clock = time.perf_counter_ns
+
+    @functools.wraps(visit)
+    def wrapper(self, node):
+        kind = type(node).__name__
+        node_counts[kind] += 1
+        line = getattr(node, "line", None)
+        previous = tracer._current_line
+        if line is not None and line != previous:
+            tracer._current_line = line
+            file = getattr(self, "current_file", None)
+            line_counts[(file, line)] += 1
+            for hook in line_hooks:
+                hook(file, line, node)
+        start = clock() if time_nodes else 0
+        try:
+            return visit(self, node)
+        finally:
+            if time_nodes:
+                node_time_ns[kind] += clock() - start
+            tracer._current_line = previous
+
+    return wrapper
+
+
+def call_traced(tracer, name, args, func, *call_args):
+    """Run ``func(*call_args)`` as user function ``name``, firing hooks and counting it."""
+    for hook in tracer._call_hooks:
+        hook(name, args)
+    depth = tracer._depth[name]
+    tracer._depth[name] = depth + 1
+    # A call starts a fresh line context, so a body line equal to the call
+    # site's line (recursion on one line) still counts as entered
+    call_line = tracer._current_line
+    tracer._current_line = None
+    result = None
+    start = time.perf_counter_ns()
+    try:
+        result = func(*call_args)
+        return result
+    finally:
+        elapsed = time.perf_counter_ns() - start
+        tracer._current_line = call_line
+        tracer._depth[name] = depth
+        tracer.function_calls[name] += 1
+        # Recursive calls are already inside the outermost call's time
+        if depth == 0:
+            tracer.function_time_ns[name] += elapsed
+        for hook in tracer._return_hooks:
+            hook(name, result, elapsed)
+
+
+def traced_function(tracer, execute, call=call_traced):
+    """Wrap ``_execute_user_function`` so each call goes through ``call``."""
+
+    @functools.wraps(execute)
+    def wrapper(self, name, params, body, return_type, param_types, args, kwargs):
+        return call(
+            tracer,
+            name,
+            args,
+            execute,
+            self,
+            name,
+            params,
+            body,
+            return_type,
+            param_types,
+            args,
+            kwargs,
+        )
+
+    return wrapper
+
+
+def traced_method(tracer, execute, call=call_traced):
+    """Wrap ``_execute_user_method`` so each call goes through ``call``."""
+
+    @functools.wraps(execute)
+    def wrapper(self, obj, class_name, method, args):
+        return call(
+            tracer, f"{class_name}.{method}", args, execute, self, obj, class_name, method, args
+        )
+
+    return wrapper
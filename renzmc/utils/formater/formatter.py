@@ -841,16 +841,22 @@ class RenzmcFormatter:
         if hasattr(node, "parts"):
             formatted_parts = []
             for part in node.parts:
+                suffix = ""
+                if isinstance(part, FormattedValue):
+                    if part.conversion:
+                        suffix += f"!{part.conversion}"
+                    if isinstance(part.format_spec, str):
+                        suffix += f":{part.format_spec}"
+                    part = part.expr
                 if hasattr(part, "value"):  # String part
                     value = part.value
                     if (value.startswith('"') and value.endswith('"')) or (
                         value.startswith("'") and value.endswith("'")
                     ):
-                        formatted_parts.append(value[1:-1])  # Remove existing quotes
-                    else:
-                        formatted_parts.append(value)
+                        value = value[1:-1]  # Remove existing quotes
+                    formatted_parts.append(value.replace("{", "{{").replace("}", "}}"))
                 elif hasattr(part, "name"):  # Variable part
-                    formatted_parts.append(f"{{{part.name}}}")
+                    formatted_parts.append(f"{{{part.name}{suffix}}}")
                 else:
                     formatted_parts.append(str(part))
 
@@ -23,47 +23,197 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import time
-from collections import defaultdict
+import urllib.parse
 from functools import wraps
 from threading import Lock
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_SHARDS = 16
+_PURGE_THRESHOLD = 4096
+
+
+class RateLimitExceeded(RuntimeError):
+    pass
+
+
+class _Shard:
+    __slots__ = ("lock", "tats")
+
+    def __init__(self):
+        self.lock = Lock()
+        self.tats: Dict[Hashable, float] = {}
 
 
 class RateLimiter:
+    """
+    GCRA (token bucket) rate limiter with per-key buckets.
+
+    Each key stores a single theoretical arrival time, so admission is O(1)
+    regardless of max_calls. Up to ``max_calls`` calls may burst at once;
+    after that calls are spaced ``period / max_calls`` seconds apart. Keys
+    are spread over sharded locks so unrelated keys do not contend.
 
-    def __init__(self, max_calls: int = 100, period: int = 60):
+    With ``block=True`` callers over the limit sleep until admitted (up to
+    ``max_wait`` seconds); otherwise RateLimitExceeded is raised.
+    """
+
+    def __init__(
+        self,
+        max_calls: int = 100,
+        period: float = 60,
+        block: bool = False,
+        max_wait: Optional[float] = None,
+    ):
+        if max_calls < 1 or period <= 0:
+            raise ValueError("max_calls dan period harus lebih besar dari 0")
         self.max_calls = max_calls
         self.period = period
-        self.calls = defaultdict(list)
-        self.lock = Lock()
+        self.block = block
+        self.max_wait = max_wait
+        self._interval = period / max_calls
+        self._tolerance = period - self._interval
+        self._shards = tuple(_Shard() for _ in range(_SHARDS))
+
+    def _shard(self, key: Hashable) -> _Shard:
+        return self._shards[hash(key) % _SHARDS]
+
+    def _reserve(self, key: Hashable, max_wait: Optional[float]) -> Optional[float]:
+        """Reserve a slot; return seconds to wait before using it, or None if refused."""
+        shard = self._shard(key)
+        with shard.lock:
+            now = time.monotonic()
+            tats = shard.tats
+            tat = tats.get(key, now)
+            if tat < now:
+                tat = now
+            wait = tat - now - self._tolerance
+            if wait > 0 and max_wait is not None and wait > max_wait:
+                return None
+            if len(tats) > _PURGE_THRESHOLD and key not in tats:
+                # Buckets whose arrival time has passed are full again; drop them
+                for stale in [k for k, t in tats.items() if t <= now]:
+                    del tats[stale]
+            tats[key] = tat + self._interval
+            return wait if wait > 0 else 0.0
+
+    def _max_wait(self, block: Optional[bool], timeout: Optional[float]) -> Optional[float]:
+        if block is None:
+            block = self.block
+        if not block:
+            return 0.0
+        return self.max_wait if timeout is None else timeout
+
+    def _exceeded(self, key: Hashable) -> RateLimitExceeded:
+        return RateLimitExceeded(
+            f"⚠️ Rate limit tercapai untuk '{key}'\nMaksimum: {self.max_calls} panggilan per {self.period} detik\nSilakan tunggu beberapa saat sebelum mencoba lagi."
+        )
+
+    def try_acquire(self, key: Hashable = "default") -> bool:
+        return self._reserve(key, 0.0) is not None
+
+    def acquire(
+        self,
+        key: Hashable = "default",
+        block: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        wait = self._reserve(key, self._max_wait(block, timeout))
+        if wait is None:
+            raise self._exceeded(key)
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(
+        self,
+        key: Hashable = "default",
+        block: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        wait = self._reserve(key, self._max_wait(block, timeout))
+        if wait is None:
+            raise self._exceeded(key)
+        if wait:
+            await asyncio.sleep(wait)
+
+    def limit(self, key: Optional[Callable[..., Hashable]] = None) -> Callable:
+        """Decorator; ``key(*args, **kwargs)`` picks the bucket (default: function name)."""
+
+        def decorator(func: Callable) -> Callable:
+            name = func.__name__
+
+            if asyncio.iscoroutinefunction(func):
+
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs) -> Any:
+                    await self.acquire_async(name if key is None else key(*args, **kwargs))
+                    return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @wraps(func)
+            def wrapper(*args, **kwargs) -> Any:
+                self.acquire(name if key is None else key(*args, **kwargs))
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
 
     def __call__(self, func: Callable) -> Callable:
+        return self.limit()(func)
+
+    def reset(self, key: Hashable = None):
+        for shard in self._shards if key is None else (self._shard(key),):
+            with shard.lock:
+                if key is None:
+                    shard.tats.clear()
+                else:
+                    shard.tats.pop(key, None)
+
+
+def host_key(url: Any) -> str:
+    return urllib.parse.urlsplit(str(url)).netloc or str(url)
+
+
+# Longest a throttled helper sleeps before RateLimitExceeded is raised
+DEFAULT_MAX_WAIT = 30.0
+
+file_rate_limiter = RateLimiter(max_calls=1000, period=60, block=True, max_wait=DEFAULT_MAX_WAIT)
+
+# Per-host limit for the HTTP helpers; off until configure_http_limit() sets one
+http_rate_limiter: Optional[RateLimiter] = None
+
+
+def configure_http_limit(
+    max_calls: Optional[int] = None,
+    period: float = 60,
+    max_wait: Optional[float] = DEFAULT_MAX_WAIT,
+) -> Optional[RateLimiter]:
+    """
+    Limit the HTTP helpers to ``max_calls`` requests per ``period`` seconds per host.
+
+    The HTTP helpers are not limited by default. Once a limit is set, callers
+    over it sleep until admitted, but never longer than ``max_wait`` seconds;
+    past that RateLimitExceeded is raised. ``max_calls=None`` removes the limit.
+    """
+    global http_rate_limiter
+    if max_calls is None:
+        http_rate_limiter = None
+    else:
+        http_rate_limiter = RateLimiter(max_calls, period, block=True, max_wait=max_wait)
+    return http_rate_limiter
+
+
+def limit_per_host(func: Callable) -> Callable:
+    """Decorator for HTTP helper methods called as ``method(self, url, ...)``."""
+
+    @wraps(func)
+    def wrapper(self, url, *args, **kwargs) -> Any:
+        limiter = http_rate_limiter
+        if limiter is not None:
+            limiter.acquire(host_key(url))
+        return func(self, url, *args, **kwargs)
 
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            with self.lock:
-                now = time.time()
-                key = func.__name__
-                self.calls[key] = [
-                    call_time for call_time in self.calls[key] if now - call_time < self.period
-                ]
-                if len(self.calls[key]) >= self.max_calls:
-                    raise RuntimeError(
-                        f"⚠️ Rate limit tercapai untuk '{func.__name__}'\nMaksimum: {self.max_calls} panggilan per {self.period} detik\nSilakan tunggu beberapa saat sebelum mencoba lagi."
-                    )
-                self.calls[key].append(now)
-            return func(*args, **kwargs)
-
-        return wrapper
-
-    def reset(self, func_name: str = None):
-        with self.lock:
-            if func_name:
-                self.calls[func_name] = []
-            else:
-                self.calls.clear()
-
-
-http_rate_limiter = RateLimiter(max_calls=100, period=60)
-file_rate_limiter = RateLimiter(max_calls=1000, period=60)
+    return wrapper
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+
+from renzmc import bench
+
+
+def test_default_corpus_ships_with_the_package():
+    corpus = bench.default_corpus_dir()
+    assert os.path.dirname(corpus) == os.path.dirname(os.path.abspath(bench.__file__))
+    names = {b.name for b in bench.discover(corpus)}
+    assert {"rekursi", "jit_rekursi", "jit_rekursi:hangat", "lex_parse_besar"} <= names
+
+
+def test_rekursi_stays_interpreted():
+    path = os.path.join(bench.default_corpus_dir(), "rekursi.rmc")
+    interpreter = bench._new_interpreter(path)
+    bench._execute(interpreter, bench._parse(bench._read(path)))
+
+    assert interpreter.jit_call_counts["jumlah_pohon"] > interpreter.jit_threshold
+    assert not any(interpreter.jit_compiled_functions.values())
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+
+from renzmc.core.interpreter import Interpreter
+from renzmc.core.lexer import Lexer
+from renzmc.core.parser import Parser
+
+NESTED_CALLS = """
+fungsi g(x):
+    hasil ke_angka(x)
+selesai
+fungsi f(x):
+    h itu g
+    hasil h(x)
+selesai
+k itu f
+k("abc")
+"""
+
+
+def test_errors_keep_the_innermost_message_and_position():
+    ast = Parser(Lexer(NESTED_CALLS)).parse()
+    with pytest.raises(RuntimeError) as info:
+        Interpreter().visit(ast)
+
+    message, line, column = info.value.args
+    assert message == "Error dalam lambda 'ke_angka': Tidak dapat mengkonversi 'abc' ke angka"
+    assert (line, column) == (3, 11)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from renzmc.library import fileio
+from renzmc.library.fileio import CSVWriter, read_csv, read_csv_parallel
+
+
+def test_write_rows_list_without_fieldnames(tmp_path):
+    path = tmp_path / "out.csv"
+    with CSVWriter(str(path)) as writer:
+        writer.write_rows([[1, 2], [3, 4]])
+        writer.write_rows(iter([[5, 6]]))
+    assert writer.rows_written == 3
+    assert read_csv(str(path)) == [["1", "2"], ["3", "4"], ["5", "6"]]
+
+
+def test_write_rows_dicts_with_fieldnames(tmp_path):
+    path = tmp_path / "out.csv"
+    with CSVWriter(str(path), fieldnames=["nama", "umur"]) as writer:
+        writer.write_rows([{"nama": "Budi", "umur": 25}, {"nama": "Ani"}])
+    assert read_csv(str(path)) == [["nama", "umur"], ["Budi", "25"], ["Ani", ""]]
+
+
+def test_read_csv_parallel_keeps_order_across_many_ranges(tmp_path, monkeypatch):
+    path = tmp_path / "besar.csv"
+    path.write_text("".join(f"{i},nama{i}\n" for i in range(5000)))
+    monkeypatch.setattr(fileio, "_CSV_RANGE_SIZE", 1024)
+
+    batches = list(read_csv_parallel(str(path), types=["bulat", "teks"], workers=2, min_size=1))
+
+    assert len(batches) > 8
+    assert [row for batch in batches for row in batch] == [[i, f"nama{i}"] for i in range(5000)]
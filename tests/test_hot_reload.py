@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from renzmc.__main__ import run_code
+from renzmc.core.interpreter import Interpreter
+
+MODULE = """
+kelas Hitung:
+    konstruktor(n):
+        diri.n itu n
+    selesai
+    metode nilai():
+        hasil diri.n + 1
+    selesai
+selesai
+
+fungsi baru(n):
+    hasil Hitung(n)
+selesai
+
+fungsi nilai_dari(h):
+    hasil h.nilai()
+selesai
+
+fungsi total(n):
+    s itu 0
+    untuk i dari 1 sampai n
+        s itu s + i
+    selesai
+    hasil s
+selesai
+"""
+
+WARM_UP = """
+untuk k dari 1 sampai 30
+    jumlah_total itu modul_reload.total(3)
+selesai
+nilai itu modul_reload.nilai_dari(objek)
+"""
+
+
+def test_refresh_module_replaces_jit_code_and_methods(tmp_path):
+    module_file = tmp_path / "modul_reload.rmc"
+    module_file.write_text(MODULE)
+    interpreter = Interpreter()
+    interpreter.module_manager.add_search_path(str(tmp_path))
+
+    run_code(
+        "impor modul_reload\nobjek itu modul_reload.baru(5)\n" + WARM_UP,
+        interpreter=interpreter,
+        use_cache=False,
+    )
+    assert interpreter.get_variable("jumlah_total") == 6
+    assert interpreter.get_variable("nilai") == 6
+
+    module_file.write_text(
+        MODULE.replace("s + i", "s + i * 10").replace("diri.n + 1", "diri.n + 100")
+    )
+    assert interpreter.module_manager.refresh_changed_modules() == ["modul_reload"]
+
+    # Warm up again past the JIT threshold: the recompiled code must use the new body
+    run_code(WARM_UP, interpreter=interpreter, use_cache=False)
+    assert interpreter.get_variable("jumlah_total") == 60
+    assert interpreter.get_variable("nilai") == 105
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from renzmc.library.http import HTTPError, HTTPSession, fetch_many
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class TimeoutSession:
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(method)
+        raise HTTPError("timeout")
+
+
+def test_fetch_many_retries_only_idempotent_methods_by_default():
+    session = TimeoutSession()
+    requests = [
+        {"url": "http://example.invalid/a", "method": "GET"},
+        {"url": "http://example.invalid/b", "method": "post"},
+        {"url": "http://example.invalid/c", "method": "PATCH"},
+    ]
+    results = fetch_many(requests, retries=2, backoff=0, session=session)
+
+    assert all(isinstance(result, HTTPError) for result in results)
+    assert sorted(session.calls) == ["GET", "GET", "GET", "PATCH", "POST"]
+
+
+def test_fetch_many_retry_methods_opt_in():
+    session = TimeoutSession()
+    fetch_many(
+        ["http://example.invalid/a"],
+        method="POST",
+        retries=2,
+        backoff=0,
+        session=session,
+        retry_methods=["post"],
+    )
+
+    assert session.calls == ["POST", "POST", "POST"]
+
+
+def test_shared_session_counts_every_request():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    try:
+        with HTTPSession(pool_size=16) as session:
+            results = fetch_many([url] * 300, concurrency=16, per_host=16, session=session)
+            stats = dict(session.stats)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert all(result.status_code == 200 for result in results)
+    assert stats["requests"] == 300
+    assert stats["connections_created"] + stats["connections_reused"] == 300
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+
+from renzmc.__main__ import run_code
+from renzmc.core.interpreter import Interpreter
+from renzmc.jit import compiler as jit_compiler
+
+SOURCE = """
+fungsi fakt(n):
+    jika n <= 1
+        hasil 1
+    selesai
+    hasil n * fakt(n - 1)
+selesai
+
+fungsi setengah(x):
+    jika x < 1.0
+        hasil x
+    selesai
+    hasil setengah(x / 2.0)
+selesai
+
+untuk i dari 1 sampai 20
+    pemanasan itu fakt(5) + setengah(8.0)
+selesai
+besar itu [fakt(20), fakt(25), fakt(30)]
+pecahan itu setengah(1000.0)
+"""
+
+
+def _run(jit):
+    interpreter = Interpreter()
+    if not jit:
+        interpreter.jit_compiler = None
+    run_code(SOURCE, interpreter=interpreter, use_cache=False)
+    return interpreter
+
+
+def test_recursive_jit_matches_interpreter_on_big_integers():
+    with_jit = _run(jit=True)
+    without_jit = _run(jit=False)
+
+    assert "fakt" in with_jit.jit_compiler.compiled_cache
+    assert with_jit.get_variable("besar") == without_jit.get_variable("besar")
+    assert with_jit.get_variable("besar")[1] == 15511210043330985984000000
+    assert with_jit.get_variable("pecahan") == without_jit.get_variable("pecahan")
+
+
+@pytest.mark.skipif(not jit_compiler.NUMBA_AVAILABLE, reason="numba tidak terpasang")
+def test_recursive_jit_keeps_integer_signatures_out_of_numba():
+    interpreter = _run(jit=True)
+
+    fakt = interpreter.jit_compiler.compiled_cache["fakt"]
+    setengah = interpreter.jit_compiler.compiled_cache["setengah"]
+    assert set(fakt.__jit_signatures__.values()) == {False}
+    assert set(setengah.__jit_signatures__.values()) == {True}
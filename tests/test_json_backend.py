@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+
+import json as py_json
+
+from renzmc.library import json as rmc_json
+
+
+@pytest.fixture
+def backend():
+    previous = rmc_json.get_backend()
+    yield rmc_json.set_backend
+    rmc_json.set_backend(previous)
+
+
+@pytest.mark.parametrize("name", [n for n in rmc_json.BACKENDS if rmc_json._BACKEND_FUNCTIONS[n]])
+def test_validate_json_matches_stdlib_for_every_backend(backend, name):
+    backend(name)
+    assert rmc_json.validate_json('{"a": [1, 2.5, null]}')
+    assert not rmc_json.validate_json("01")
+    assert not rmc_json.validate_json('"a\tb"')
+    assert not rmc_json.validate_json("[1,]")
+
+
+def test_default_backend_skips_ujson(backend):
+    assert backend() in rmc_json.DEFAULT_BACKENDS
+    with pytest.raises(py_json.JSONDecodeError):
+        rmc_json.loads("01")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from renzmc.__main__ import run_code
+from renzmc.core.interpreter import Interpreter
+from renzmc.runtime.memprofiler import MemoryProfiler
+
+SOURCE = """
+simpanan itu []
+
+fungsi fib(n):
+    jika n < 2
+        hasil n
+    selesai
+    hasil fib(n - 1) + fib(n - 2)
+selesai
+
+fungsi tahan(i):
+    tambah(simpanan, "data" * 500)
+    hasil i
+selesai
+
+untuk i dari 1 sampai 20
+    x itu fib(12)
+    y itu tahan(i)
+selesai
+"""
+
+
+def test_leaks_skip_jit_compilation_and_report_retained_memory():
+    interpreter = Interpreter()
+    with MemoryProfiler() as profiler:
+        run_code(SOURCE, interpreter=interpreter, use_cache=False)
+
+    leaks = {name: per_call for name, calls, per_call in profiler.leaks()}
+    assert "fib" in interpreter.jit_compiled_functions
+    assert "fib" not in leaks
+    assert leaks["tahan"] >= 2000
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from renzmc.core.interpreter import Interpreter
+
+
+def test_module_interpreter_is_constructed_with_shared_runtime(tmp_path):
+    host = Interpreter()
+    module_path = str(tmp_path / "modul.rmc")
+    child = host._create_module_interpreter(module_path)
+
+    assert type(child) is type(host)
+    assert child.current_file == module_path
+    for attr in ("module_manager", "python_integration", "file_ops", "loop"):
+        assert getattr(child, attr) is getattr(host, attr)
+    assert child.scope_manager is not host.scope_manager
+    assert child.builtin_functions is not host.builtin_functions
+    assert child.builtin_functions["impor_renzmc"].__self__ is child
+
+
+def test_rmc_modules_is_not_a_search_path():
+    paths = Interpreter().module_manager.module_search_paths
+    assert not any(path.endswith("rmc_modules") for path in paths)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from renzmc.core.interpreter import Interpreter
+from renzmc.runtime.module_prefetch import ModulePrefetcher
+
+
+def _write_modules(tmp_path, count, size):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"m{i}.rmc"
+        path.write_text("x itu 1\n" * (size // 8), encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_small_waves_are_parsed_inline(tmp_path):
+    prefetcher = ModulePrefetcher(Interpreter().module_manager, max_workers=4)
+    assert not prefetcher._worth_parallel(_write_modules(tmp_path, 16, 1024))
+
+
+def test_large_waves_use_the_pool(tmp_path):
+    prefetcher = ModulePrefetcher(Interpreter().module_manager, max_workers=4)
+    assert prefetcher._worth_parallel(_write_modules(tmp_path, 3, 64 * 1024))
+
+
+def test_single_cpu_never_uses_the_pool(tmp_path):
+    prefetcher = ModulePrefetcher(Interpreter().module_manager, max_workers=1)
+    assert not prefetcher._worth_parallel(_write_modules(tmp_path, 3, 64 * 1024))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import array
+
+import pytest
+
+from renzmc.__main__ import run_code
+from renzmc.core.interpreter import Interpreter
+from renzmc.runtime import numeric_array
+from renzmc.runtime.numeric_array import Larik
+from renzmc.runtime.python_integration import PythonIntegration
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_python_arrays_are_adopted_without_copy():
+    integration = PythonIntegration()
+    source = numpy.arange(5)
+    converted = integration.convert_python_to_renzmc(source)
+
+    assert isinstance(converted, Larik)
+    converted[0] = 9
+    assert source[0] == 9
+    assert integration.convert_renzmc_to_python(converted) is source
+
+
+def test_other_arrays_and_buffers_stay_python_objects():
+    integration = PythonIntegration()
+    for value in (
+        numpy.zeros((2, 3)),
+        numpy.array(["a", "b"]),
+        bytearray(b"ab"),
+        memoryview(b"ab"),
+        array.array("d", [1.5, 2.5]),
+    ):
+        assert not isinstance(integration.convert_python_to_renzmc(value), Larik)
+
+
+def test_numpy_module_results_become_larik():
+    interpreter = Interpreter()
+    run_code(
+        'impor_python "numpy"\n'
+        "a itu numpy.arange(4)\n"
+        "b itu a * 2\n"
+        "total itu numpy.sum(b)\n"
+        "bentuk itu a.shape\n",
+        interpreter=interpreter,
+        use_cache=False,
+    )
+
+    assert isinstance(interpreter.get_variable("a"), Larik)
+    assert interpreter.get_variable("b").ke_list() == [0, 2, 4, 6]
+    assert interpreter.get_variable("total") == 12
+    assert interpreter.get_variable("bentuk") == (4,)
+
+
+@pytest.mark.parametrize("values", [[2**62, 1], numpy.array([2**62, 1])])
+def test_integer_overflow_raises_on_both_backends(values):
+    data = Larik(values)
+    with pytest.raises(OverflowError):
+        data + data
+    with pytest.raises(OverflowError):
+        data * 4
+    assert Larik([2**62] * 4).jumlah() == 2**64
+
+
+def test_pure_python_backend_raises_on_overflow(monkeypatch):
+    monkeypatch.setattr(numeric_array, "_numpy", None)
+    monkeypatch.setattr(numeric_array, "_numpy_checked", True)
+    data = Larik([2**62, 1])
+    assert not data.uses_numpy
+    with pytest.raises(OverflowError):
+        data + data
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import copy
+
+from renzmc.__main__ import run_code
+from renzmc.core.interpreter import Interpreter
+from renzmc.runtime.python_integration import PythonIntegration, PythonListView
+
+
+def test_negative_index_children_keep_writes():
+    integration = PythonIntegration("lazy")
+    source = [[1, 2], [3, 4]]
+    view = integration.convert_python_to_renzmc(source)
+
+    view[-1][0] = 9
+    assert view[-1][0] == 9
+    assert view[1][0] == 9
+    assert integration.convert_renzmc_to_python(view) == [[1, 2], [9, 4]]
+    assert source == [[1, 2], [3, 4]]
+
+
+def test_views_work_with_list_builtins_and_index_assignment():
+    it = Interpreter()
+    it.python_integration.set_conversion_mode("lazy")
+    source = [[1, 2], [3, 4]]
+    it.global_scope["data"] = it.python_integration.convert_python_to_renzmc(source)
+    run_code("data[0] itu 7\ntambah(data, 5)\nn itu panjang(data)", interpreter=it, use_cache=False)
+
+    assert it.get_variable("n") == 3
+    assert source == [[1, 2], [3, 4]]
+
+
+def test_copying_a_view_gives_a_detached_list():
+    integration = PythonIntegration("lazy")
+    view = integration.convert_python_to_renzmc([[1], [2]])
+    shallow = copy.copy(view)
+    deep = copy.deepcopy(view)
+
+    assert type(shallow) is list and type(deep) is list
+    shallow.append(3)
+    assert len(view) == 2
+    assert isinstance(view, PythonListView)
+
+
+def test_eager_mode_copies_plain_containers():
+    integration = PythonIntegration("eager")
+    for value in ([1, 2, 3], {"a": 1}, {1, 2}):
+        converted = integration.convert_python_to_renzmc(value)
+        assert converted == value and converted is not value
+        back = integration.convert_renzmc_to_python(converted)
+        assert back == value and back is not converted
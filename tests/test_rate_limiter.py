@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+MIT License
+
+Copyright (c) 2025 RenzMc
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+
+from renzmc.utils import rate_limiter
+
+
+class Client:
+    def __init__(self):
+        self.calls = 0
+
+    @rate_limiter.limit_per_host
+    def get(self, url):
+        self.calls += 1
+        return url
+
+
+@pytest.fixture(autouse=True)
+def reset_http_limit():
+    yield
+    rate_limiter.configure_http_limit(None)
+
+
+def test_http_helpers_are_not_limited_by_default():
+    client = Client()
+    for _ in range(500):
+        client.get("http://example.invalid/a")
+    assert client.calls == 500
+
+
+def test_http_limit_is_per_host_and_bounded():
+    rate_limiter.configure_http_limit(max_calls=2, period=60, max_wait=0.01)
+    client = Client()
+    client.get("http://a.invalid/1")
+    client.get("http://a.invalid/2")
+    client.get("http://b.invalid/1")
+    with pytest.raises(rate_limiter.RateLimitExceeded):
+        client.get("http://a.invalid/3")
+    assert client.calls == 3